@@ -22,8 +22,18 @@
 #
 ###############################################################################
 import pygame
+import weakref
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import threading
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from random import randint, uniform, choice
-from typing import Union, Callable, Any
+from typing import Union, Callable, Any, Sequence
 
 # Colours ---------------------------------------------------------------------
 WHITE = (255, 255, 255)
@@ -57,60 +67,3194 @@ COLLECTIBLE_SIZE = 16
 # Speed constants--------------------------------------------------------------
 MOVING_PLATFORM_SPEED = 12  # moving platform speed is inversely proportional to this
 
+# Debug options ---------------------------------------------------------------
+DEBUG_SURFACE_FORMATS = False  # reports every Surface that reaches a blit in a non-native pixel format
+
+# Rendering options -----------------------------------------------------------
+DIRTY_RECTS = True  # only pushes the regions of the screen that changed to the display
+DIRTY_RECT_MAX_AREA = 0.5  # the fraction of the screen above which the whole frame is pushed instead
+RENDER_BACKEND = "surface"  # "surface" draws with CPU blits, "sdl2" draws textures with SDL's renderer
+RENDER_RESOLUTION = None  # the size the game is drawn at, i.e. (1280, 720), or None to draw at the display's size
+RENDER_SCALING = "integer"  # how a 'RENDER_RESOLUTION' frame is fitted to the display - "integer" or "smooth"
+CULL_MARGIN = 64  # how far outside the screen, in pixels, sprites are still drawn
+
+# Text rendering --------------------------------------------------------------
+GLYPH_FONTS = True  # draws text from pre-rasterized glyph atlases instead of rasterizing every string
+GLYPH_CHARSET = "".join(chr(code) for code in range(32, 127))  # the characters rasterized into every atlas
+GLYPH_ATLAS_WIDTH = 2048  # the width at which glyphs wrap onto the next row of an atlas
+
+# Texture atlas ---------------------------------------------------------------
+ATLAS_DATA_PATH = "images/atlas.bin"  # raw BGRA pixels of the packed sheet
+ATLAS_INDEX_PATH = "images/atlas.idx"  # rect of every sprite in the sheet, keyed by its lowercase path
+ATLAS_MAGIC = b"PATL"
+ATLAS_MIN_WIDTH = 1024
+ATLAS_EXCLUDED = ("images/backgrounds", "images/weaponIcons/source")  # full screen images and unused sources
+
+
+def isOpaque(image: pygame.Surface) -> bool:
+    """ Returns if every pixel of 'image' is fully opaque
+
+    Parameters:
+        image: pygame.Surface
+            The image to check
+
+    Return => bool: True if the image does not need an alpha channel
+    """
+    # a mask with a threshold of 254 only has the fully opaque pixels set
+    return pygame.mask.from_surface(image, 254).count() == image.get_width() * image.get_height()
+
+
+class TextureAtlas(object):
+    """ Every sprite frame in 'images/' packed into one sheet, which is memory-mapped from 'ATLAS_DATA_PATH'.
+        Frames are served as subsurfaces of the sheet, so startup reads a single file and several game
+        processes share the same pages. The atlas is baked offline with 'python Platformer.py --bake-atlas'
+
+    Attributes:
+        data: mmap.mmap
+            The mapped pixel data of the sheet
+
+        sheet: pygame.Surface
+            The whole packed sheet
+
+        rects: dict[str, tuple[pygame.Rect, bool]]
+            The rect of every sprite in the sheet and if it is fully opaque, keyed by its lowercase path
+
+    """
+
+    def __init__(self, data: mmap.mmap, size: tuple[int, int], rects: dict[str, tuple[pygame.Rect, bool]]) -> None:
+        self.data = data
+        self.sheet = pygame.image.frombuffer(data, size, "BGRA")
+        self.rects = rects
+
+    @staticmethod
+    def key(path: str) -> str:
+        """ Returns the key of 'path' in the index. Paths are matched case-insensitively
+
+        Parameters:
+            path: str
+                The path of the image file
+
+        Return => str: the normalized path
+        """
+        return path.replace("\\", "/").lower()
+
+    @classmethod
+    def open(cls, dataPath: str, indexPath: str) -> Union["TextureAtlas", None]:
+        """ Maps the baked atlas into memory
+
+        Parameters:
+            dataPath: str
+                The path of the raw pixel data
+
+            indexPath: str
+                The path of the index
+
+        Return => TextureAtlas | None: the atlas, or None if it has not been baked
+        """
+        if not (os.path.isfile(dataPath) and os.path.isfile(indexPath)):
+            return None
+
+        with open(indexPath, "rb") as indexFile:
+            index = indexFile.read()
+
+        magic, width, height, count = struct.unpack_from("<4sIII", index, 0)
+
+        if magic != ATLAS_MAGIC:
+            return None
+
+        offset = struct.calcsize("<4sIII")
+        rects = {}
+
+        for _ in range(count):
+            nameLength, = struct.unpack_from("<H", index, offset)
+            offset += 2
+            name = index[offset:offset + nameLength].decode("utf-8")
+            offset += nameLength
+            x, y, w, h, opaque = struct.unpack_from("<HHHHB", index, offset)
+            offset += struct.calcsize("<HHHHB")
+            rects[name] = (pygame.Rect(x, y, w, h), bool(opaque))
+
+        with open(dataPath, "rb") as dataFile:
+            # copy on write, so the pages stay shared unless a frame is drawn on
+            data = mmap.mmap(dataFile.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        # a truncated or stale data file
+        if len(data) != width * height * 4:
+            data.close()
+            return None
+
+        return cls(data, (width, height), rects)
+
+    @staticmethod
+    def bake(directory: str, dataPath: str, indexPath: str) -> None:
+        """ Packs every image under 'directory' into a sheet with a shelf packer and writes the sheet and its index
+
+        Parameters:
+            directory: str
+                The directory to pack
+
+            dataPath: str
+                The path to write the raw pixel data to
+
+            indexPath: str
+                The path to write the index to
+
+        Return => None
+        """
+        sprites = []
+
+        for root, _, files in os.walk(directory):
+            root = root.replace("\\", "/")
+
+            if root.startswith(ATLAS_EXCLUDED):
+                continue
+
+            for fileName in files:
+                if fileName.lower().endswith((".png", ".jpg")):
+                    path = f"{root}/{fileName}"
+                    sprites.append((TextureAtlas.key(path), pygame.image.load(path)))
+
+        # tallest first, so each shelf wastes as little height as possible
+        sprites.sort(key=lambda sprite: sprite[1].get_height(), reverse=True)
+
+        width = max([ATLAS_MIN_WIDTH] + [image.get_width() for _, image in sprites])
+        placements = []
+        x = 0
+        y = 0
+        shelfHeight = 0
+
+        for name, image in sprites:
+            # starts a new shelf
+            if x + image.get_width() > width:
+                x = 0
+                y += shelfHeight
+                shelfHeight = 0
+
+            placements.append((name, image, x, y))
+            x += image.get_width()
+            shelfHeight = max(shelfHeight, image.get_height())
+
+        height = y + shelfHeight
+
+        # rows are copied byte for byte, so semi-transparent pixels are not blended against the empty sheet
+        pixels = bytearray(width * height * 4)
+        index = [struct.pack("<4sIII", ATLAS_MAGIC, width, height, len(placements))]
+
+        for name, image, x, y in placements:
+            w, h = image.get_size()
+            rows = pygame.image.tobytes(image, "BGRA")
+
+            for row in range(h):
+                start = ((y + row) * width + x) * 4
+                pixels[start:start + w * 4] = rows[row * w * 4:(row + 1) * w * 4]
+
+            encoded = name.encode("utf-8")
+            index.append(struct.pack("<H", len(encoded)) + encoded)
+            index.append(struct.pack("<HHHHB", x, y, w, h, isOpaque(image)))
+
+        with open(dataPath, "wb") as dataFile:
+            dataFile.write(pixels)
+
+        with open(indexPath, "wb") as indexFile:
+            indexFile.write(b"".join(index))
+
+        print(f"baked {len(placements)} images into a {width}x{height} atlas")
+
+
+# Scaled image cache ----------------------------------------------------------
+SCALED_CACHE_DIRECTORY = "cache"  # full screen images scaled to the resolution of a previous launch
+SCALED_CACHE_MAGIC = b"PSCL"
+
+# filters that full screen images can be scaled with, keyed by the name used in the cache key
+SCALE_FILTERS = {
+    "scale": pygame.transform.scale,
+    "smoothscale": pygame.transform.smoothscale,
+}
+
+
+## bakes the atlas and exits without opening the game window
+if "--bake-atlas" in sys.argv:
+    TextureAtlas.bake("images", ATLAS_DATA_PATH, ATLAS_INDEX_PATH)
+    sys.exit()
+
 # Game Window Options ---------------------------------------------------------
 pygame.init()
 # WIDTH = 800
 # HEIGHT = 600
 # gameWindow = pygame.display.set_mode((WIDTH, HEIGHT))
 
-## the following code makes the game full screen and sets the width and height accordingly
-gameWindow = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = gameWindow.get_size()
+## the backend can be picked at startup with '--renderer=sdl2' or the PLATFORMER_RENDERER environment variable
+RENDER_BACKEND = os.environ.get("PLATFORMER_RENDERER", RENDER_BACKEND)
+
+for argument in sys.argv:
+    if argument.startswith("--renderer="):
+        RENDER_BACKEND = argument.split("=", 1)[1]
+
+if RENDER_BACKEND == "sdl2":
+    try:
+        from pygame._sdl2.video import Window, Renderer, Texture, error as RendererError
+
+    except ImportError:
+        print("pygame._sdl2 is not available, drawing with surfaces instead")
+        RENDER_BACKEND = "surface"
+
+if RENDER_BACKEND == "sdl2":
+    # the renderer owns the window, so the display module only keeps a hidden surface that images are converted to
+    displayWindow = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    rendererWindow = Window("Source Code", fullscreen_desktop=True)
+    screenSize = rendererWindow.size
+
+else:
+    ## the following code makes the game full screen and sets the width and height accordingly
+    displayWindow = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    screenSize = displayWindow.get_size()
+
+# the game is drawn at 'RENDER_RESOLUTION' if set, so its cost does not depend on the monitor
+WIDTH, HEIGHT = RENDER_RESOLUTION or screenSize
+
+# the surface everything is drawn on - replaced by a back buffer only when a 'RENDER_RESOLUTION' frame is scaled
+gameWindow = displayWindow
+
+
+# Asset cache -----------------------------------------------------------------
+# the directional sprites - the player, enemies, projectiles and muzzle flashes - whose left-facing variant is baked
+MIRRORED_DIRECTORIES = ("images/character", "images/enemy/normal", "images/enemy/underworld", "images/enemy/ice")
+
+
+class AssetCache(object):
+    """ A process-wide cache of images, keyed by the path of the file.
+        Every image in the game is loaded through this cache, so each file is decoded only once and the
+        resulting Surface is shared between every object that uses it.
+        Every image is converted to the display's native pixel format when it is loaded, and the
+        left-facing (horizontally flipped) variant of directional sprites (see 'MIRRORED_DIRECTORIES') is baked at
+        the same time. Any other image is only flipped if its left-facing variant is ever asked for.
+        Images that are packed in the texture atlas are served from it instead of being decoded.
+        Images can be loaded from several threads at once; a path is only ever decoded by one of them
+
+    Attributes:
+        images: dict[str, pygame.Surface]
+            The decoded images, keyed by their path in lowercase (see 'TextureAtlas.key')
+
+        loading: dict[str, threading.Event]
+            The images that are being decoded, keyed like 'images'. The event is set once the image is cached
+
+        lock: threading.RLock
+            Guards 'images', 'loading', 'mirrors' and the counters
+
+        mirrors: weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface]
+            The left-facing variant of each image, keyed by the right-facing image. Weak keys, so images that
+            are not loaded from a file (i.e. scaled frames) are dropped with the object that made them
+
+        originals: weakref.WeakKeyDictionary[pygame.Surface, weakref.ref]
+            The right-facing image of each left-facing variant, so a renderer can flip it instead
+
+        nativeFormats: set[tuple[int, tuple[int, int, int, int]]]
+            The (bit size, masks) of the display's opaque and per-pixel alpha formats
+
+        atlas: TextureAtlas | None
+            The baked texture atlas, or None if it has not been baked
+
+        flaggedFormats: set[tuple[tuple[int, int], int, tuple[int, int, int, int]]]
+            The (size, bit size, masks) of every non-native surface already reported by 'checkFormat'.
+            Keyed by format rather than by surface so text rendered every frame is only reported once
+
+        hits: int
+            The number of loads served from the cache since the counters were last reset
+
+        misses: int
+            The number of loads that had to decode the file from disk since the counters were last reset
+
+        scaledHits: int
+            The number of scaled images read from the disk cache since the counters were last reset
+
+        scaledMisses: int
+            The number of scaled images that had to be decoded and scaled since the counters were last reset
+
+    """
+
+    def __init__(self) -> None:
+        self.images = {}
+        self.loading = {}
+        self.lock = threading.RLock()
+        self.mirrors = weakref.WeakKeyDictionary()
+        self.originals = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.scaledHits = 0
+        self.scaledMisses = 0
+
+        # the formats 'convert()' and 'convert_alpha()' produce for the current display
+        opaque = pygame.Surface((1, 1)).convert()
+        alpha = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        self.nativeFormats = {
+            (opaque.get_bitsize(), opaque.get_masks()),
+            (alpha.get_bitsize(), alpha.get_masks()),
+        }
+        self.flaggedFormats = set()
+
+        self.atlas = TextureAtlas.open(ATLAS_DATA_PATH, ATLAS_INDEX_PATH)
+
+        # the sheet is only converted if the display does not use the baked format
+        if self.atlas is not None and not self.isNative(self.atlas.sheet):
+            self.atlas.sheet = self.atlas.sheet.convert_alpha()
+
+    def load(self, path: str) -> pygame.Surface:
+        """ Returns the image at 'path', only decoding it from disk the first time it is requested.
+            The returned Surface is shared, so it must not be drawn on or modified
+
+        Parameters:
+            path: str
+                The path of the image file
+
+        Return => pygame.Surface: the cached image
+        """
+        key = TextureAtlas.key(path)
+
+        with self.lock:
+            image = self.images.get(key)
+
+            if image is not None:
+                self.hits += 1
+                return image
+
+            loading = self.loading.get(key)
+            decoding = loading is None
+
+            # this thread decodes the image
+            if decoding:
+                loading = threading.Event()
+                self.loading[key] = loading
+
+        # another thread is decoding the image - waits for it instead of decoding it twice
+        if not decoding:
+            loading.wait()
+
+            with self.lock:
+                image = self.images.get(key)
+
+                if image is not None:
+                    self.hits += 1
+                    return image
+
+            # the other thread failed to load it, so the error is raised here as well
+            return self.load(path)
+
+        try:
+            image = self.loadFromAtlas(path)
+
+            if image is None:
+                image = self.normalize(pygame.image.load(path))
+
+            with self.lock:
+                self.misses += 1
+                self.images[key] = image
+
+                # bakes the left-facing variant of sprites that are drawn facing either way
+                if key.startswith(MIRRORED_DIRECTORIES):
+                    self.mirror(image)
+
+        finally:
+            with self.lock:
+                del self.loading[key]
+
+            loading.set()
+
+        return image
+
+    def cached(self, path: str) -> Union[pygame.Surface, None]:
+        """ Returns the cached image of 'path' without loading it
+
+        Parameters:
+            path: str
+                The path of the image file
+
+        Return => pygame.Surface | None: the image, or None if it is not cached
+        """
+        with self.lock:
+            return self.images.get(TextureAtlas.key(path))
+
+    def normalize(self, image: pygame.Surface) -> pygame.Surface:
+        """ Converts 'image' to the display's native pixel format, so blitting it needs no per-pixel conversion.
+            Images where every pixel is opaque lose their alpha channel; any other image keeps per-pixel alpha
+
+        Parameters:
+            image: pygame.Surface
+                The image to convert
+
+        Return => pygame.Surface: the converted image
+        """
+        if isOpaque(image):
+            return image.convert()
+
+        return image.convert_alpha()
+
+    def loadFromAtlas(self, path: str) -> Union[pygame.Surface, None]:
+        """ Returns the frame of the atlas packed from 'path'. Opaque frames are copied to the opaque native format;
+            every other frame is a subsurface that shares the mapped pixels
+
+        Parameters:
+            path: str
+                The path of the image file
+
+        Return => pygame.Surface | None: the frame, or None if the image is not in the atlas
+        """
+        if self.atlas is None:
+            return None
+
+        entry = self.atlas.rects.get(TextureAtlas.key(path))
+
+        if entry is None:
+            return None
+
+        rect, opaque = entry
+        image = self.atlas.sheet.subsurface(rect)
+
+        if opaque:
+            return image.convert()
+
+        return image
+
+    def isNative(self, image: pygame.Surface) -> bool:
+        """ Returns if 'image' is in one of the display's native pixel formats
+
+        Parameters:
+            image: pygame.Surface
+                The image to check
+
+        Return => bool: True if blitting the image needs no format conversion
+        """
+        return (image.get_bitsize(), image.get_masks()) in self.nativeFormats
+
+    def checkFormat(self, image: pygame.Surface) -> None:
+        """ Reports 'image' if it is not in a native pixel format. Each size and format is only reported once
+
+        Parameters:
+            image: pygame.Surface
+                The image that is about to be blitted
+
+        Return => None
+        """
+        if self.isNative(image):
+            return
+
+        signature = (image.get_size(), image.get_bitsize(), image.get_masks())
+
+        if signature not in self.flaggedFormats:
+            self.flaggedFormats.add(signature)
+            print(f"non-native surface blitted: {signature[0]}, {signature[1]}-bit, masks {signature[2]}")
+
+    def mirror(self, image: pygame.Surface) -> pygame.Surface:
+        """ Returns the left-facing variant of 'image'. Directional sprites loaded through the cache are already
+            baked; any other image is flipped once, the first time it is requested
+
+        Parameters:
+            image: pygame.Surface
+                The right-facing image
+
+        Return => pygame.Surface: the horizontally flipped image
+        """
+        with self.lock:
+            mirrored = self.mirrors.get(image)
+
+            if mirrored is None:
+                mirrored = pygame.transform.flip(image, True, False)
+                self.mirrors[image] = mirrored
+                self.originals[mirrored] = weakref.ref(image)
+
+        return mirrored
+
+    def original(self, image: pygame.Surface) -> Union[pygame.Surface, None]:
+        """ Returns the right-facing image 'image' was flipped from
+
+        Parameters:
+            image: pygame.Surface
+                The image to check
+
+        Return => pygame.Surface | None: the right-facing image, or None if 'image' is not a left-facing variant
+        """
+        reference = self.originals.get(image)
+
+        return reference() if reference is not None else None
+
+    def facing(self, image: pygame.Surface, facingLeft: bool) -> pygame.Surface:
+        """ Returns the variant of 'image' facing the given direction
+
+        Parameters:
+            image: pygame.Surface
+                The right-facing image
+
+            facingLeft: bool
+                True for the left-facing variant, False for 'image' itself
+
+        Return => pygame.Surface: the image facing the correct way
+        """
+        if facingLeft:
+            return self.mirror(image)
+
+        return image
+
+    def loadScaled(self, path: str, size: tuple[int, int], scaleFilter: str = "scale") -> pygame.Surface:
+        """ Returns the image at 'path' scaled to 'size'. The scaled pixels are kept on disk, keyed by the hash of the
+            source file, the size and the filter, so later launches at the same resolution skip decoding and scaling.
+            The result is not kept in memory by the cache
+
+        Parameters:
+            path: str
+                The path of the image file
+
+            size: tuple[int, int]
+                The size to scale the image to
+
+            scaleFilter: str
+                The name of the filter in 'SCALE_FILTERS' to scale with
+
+        Return => pygame.Surface: the scaled image, in a native pixel format
+        """
+        with open(path, "rb") as sourceFile:
+            digest = hashlib.sha1(sourceFile.read()).hexdigest()
+
+        cachePath = f"{SCALED_CACHE_DIRECTORY}/{digest}_{size[0]}x{size[1]}_{scaleFilter}.raw"
+        image = self.readScaled(cachePath, size)
+
+        if image is not None:
+            with self.lock:
+                self.scaledHits += 1
+
+            return image
+
+        with self.lock:
+            self.scaledMisses += 1
+
+        source = pygame.image.load(path)
+        opaque = isOpaque(source)
+        image = SCALE_FILTERS[scaleFilter](source.convert_alpha(), size)
+
+        # the cache is only an optimization, so a read-only directory just means scaling again next launch
+        try:
+            os.makedirs(SCALED_CACHE_DIRECTORY, exist_ok=True)
+
+            with open(cachePath + ".tmp", "wb") as cacheFile:
+                cacheFile.write(struct.pack("<4sIIB", SCALED_CACHE_MAGIC, size[0], size[1], opaque))
+                cacheFile.write(pygame.image.tobytes(image, "BGRA"))
+
+            os.replace(cachePath + ".tmp", cachePath)
+
+        except OSError:
+            pass
+
+        if opaque:
+            return image.convert()
+
+        return image
+
+    def readScaled(self, cachePath: str, size: tuple[int, int]) -> Union[pygame.Surface, None]:
+        """ Reads a scaled image written by 'loadScaled'
+
+        Parameters:
+            cachePath: str
+                The path of the cached image
+
+            size: tuple[int, int]
+                The size the image was scaled to
+
+        Return => pygame.Surface | None: the image, or None if it is not cached or the file is damaged
+        """
+        try:
+            with open(cachePath, "rb") as cacheFile:
+                data = cacheFile.read()
+
+        except OSError:
+            return None
+
+        headerSize = struct.calcsize("<4sIIB")
+
+        if len(data) != headerSize + size[0] * size[1] * 4:
+            return None
+
+        magic, width, height, opaque = struct.unpack_from("<4sIIB", data, 0)
+
+        if magic != SCALED_CACHE_MAGIC or (width, height) != tuple(size):
+            return None
+
+        image = pygame.image.frombytes(data[headerSize:], size, "BGRA")
+
+        if opaque:
+            return image.convert()
+
+        if not self.isNative(image):
+            return image.convert_alpha()
+
+        return image
+
+    def evict(self, path: str) -> None:
+        """ Drops the cached image of 'path', so it is decoded again the next time it is loaded.
+            Its left-facing variant is dropped with it once nothing else holds the image
+
+        Parameters:
+            path: str
+                The path of the image file
+
+        Return => None
+        """
+        with self.lock:
+            self.images.pop(TextureAtlas.key(path), None)
+
+    def resetCounters(self) -> None:
+        """ Resets the hit and miss counters, keeping the cached images
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.hits = 0
+        self.misses = 0
+        self.scaledHits = 0
+        self.scaledMisses = 0
+
+    def stats(self) -> dict[str, int]:
+        """ Returns the hit and miss counters, and the number of cached images
+
+        Parameters:
+
+
+        Return => dict[str, int]: the 'hits', 'misses', 'scaledHits', 'scaledMisses' and 'images' counts
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "scaledHits": self.scaledHits,
+            "scaledMisses": self.scaledMisses,
+            "images": len(self.images),
+        }
+
+
+assets = AssetCache()
+
+
+# Scaled frame cache ----------------------------------------------------------
+SCALED_FRAME_SETS = 16  # the number of scaled animations kept before the least recently used one is dropped
+LASER_BEAM_WIDTH_STEP = 32  # laser beams are scaled to a multiple of this width, so shots from nearby share frames
+LASER_BEAM_FRAME_SETS = 4  # the number of laser beam lengths kept, apart from the other animations
+
+
+class ScaledFrameCache(object):
+    """ A bounded cache of animations scaled to a size, so projectiles that are fired repeatedly reuse their frames
+        instead of scaling them on every shot. The least recently used animation is dropped when the cache is full
+
+    Attributes:
+        maxSets: int
+            The number of scaled animations kept
+
+        frameSets: OrderedDict[tuple[tuple[str, ...], tuple[int, int]], tuple[pygame.Surface, ...]]
+            The scaled frames, keyed by the paths of the frames and the size, from least to most recently used
+
+        hits: int
+            The number of requests served from the cache
+
+        misses: int
+            The number of requests that had to scale the frames
+
+    """
+
+    def __init__(self, maxSets: int) -> None:
+        self.maxSets = maxSets
+        self.frameSets = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, paths: tuple[str, ...], size: tuple[int, int]) -> tuple[pygame.Surface, ...]:
+        """ Returns the frames at 'paths' scaled to 'size'. The frames are shared, so they must not be modified
+
+        Parameters:
+            paths: tuple[str, ...]
+                The paths of the frames of the animation, in order
+
+            size: tuple[int, int]
+                The size to scale every frame to
+
+        Return => tuple[pygame.Surface, ...]: the scaled frames
+        """
+        key = (paths, size)
+        frames = self.frameSets.get(key)
+
+        if frames is not None:
+            self.hits += 1
+            self.frameSets.move_to_end(key)
+            return frames
+
+        self.misses += 1
+        frames = tuple(pygame.transform.scale(assets.load(path), size) for path in paths)
+        self.frameSets[key] = frames
+
+        # drops the least recently used animation
+        if len(self.frameSets) > self.maxSets:
+            self.frameSets.popitem(last=False)
+
+        return frames
+
+
+scaledFrames = ScaledFrameCache(SCALED_FRAME_SETS)
+
+# the beam length depends on where the player is on the screen, so beams get their own cache to not evict the others
+laserBeamFrames = ScaledFrameCache(LASER_BEAM_FRAME_SETS)
+
+
+# Asset preloader -------------------------------------------------------------
+PRELOAD_WORKERS = 2
+
+# sprites used outside of biomes - the biome sprites are loaded with their bundles
+PRELOAD_DIRECTORIES = (
+    "images/character", "images/chest", "images/coin", "images/gui", "images/portal", "images/potion",
+    "images/weaponIcons/default", "images/weaponIcons/laser", "images/weaponIcons/staff",
+)
+
+
+class AssetPreloader(object):
+    """ Loads images into the asset cache on worker threads, so they are decoded while the menu is shown instead of
+        when the game first needs them. An image that is needed before its worker is done is waited for, not decoded twice
+
+    Attributes:
+        executor: ThreadPoolExecutor
+            The worker threads
+
+        tasks: dict[str, concurrent.futures.Future]
+            The load of every submitted image, keyed by its path
+
+        scaledTasks: dict[tuple[str, tuple[int, int], str], concurrent.futures.Future]
+            The scale of every submitted full-screen image that has not been taken yet, keyed by its path, size and
+            filter
+
+        waits: dict[str, float]
+            The seconds spent waiting for each image by 'waitFor'
+
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preloader")
+        self.tasks = {}
+        self.scaledTasks = {}
+        self.waits = {}
+
+    def preload(self, paths: list[str]) -> None:
+        """ Queues the images at 'paths' to be loaded by the workers
+
+        Parameters:
+            paths: list[str]
+                The paths of the image files
+
+        Return => None
+        """
+        for path in paths:
+            if path not in self.tasks:
+                self.tasks[path] = self.executor.submit(assets.load, path)
+
+    def preloadDirectories(self, directories: tuple[str, ...]) -> None:
+        """ Queues every image under 'directories' to be loaded by the workers
+
+        Parameters:
+            directories: tuple[str, ...]
+                The directories to load
+
+        Return => None
+        """
+        paths = []
+
+        for directory in directories:
+            for root, _, files in os.walk(directory):
+                root = root.replace("\\", "/")
+                paths += [f"{root}/{fileName}" for fileName in sorted(files) if fileName.lower().endswith((".png", ".jpg"))]
+
+        self.preload(paths)
+
+    def preloadScaled(self, path: str, size: tuple[int, int], scaleFilter: str = "scale") -> None:
+        """ Queues the image at 'path' to be scaled to 'size' by the workers, for 'loadScaled' to take later
+
+        Parameters:
+            path: str
+                The path of the image file
+
+            size: tuple[int, int]
+                The size to scale the image to
+
+            scaleFilter: str
+                The name of the filter in 'SCALE_FILTERS' to scale with
+
+        Return => None
+        """
+        key = (path, size, scaleFilter)
+
+        if key not in self.scaledTasks:
+            self.scaledTasks[key] = self.executor.submit(assets.loadScaled, path, size, scaleFilter)
+
+    def loadScaled(self, path: str, size: tuple[int, int], scaleFilter: str = "scale") -> pygame.Surface:
+        """ Returns the image at 'path' scaled to 'size', waiting for the workers if it was queued and is not done yet.
+            The task is dropped once taken, so the scaled image is only kept alive by whoever uses it
+
+        Parameters:
+            path: str
+                The path of the image file
+
+            size: tuple[int, int]
+                The size to scale the image to
+
+            scaleFilter: str
+                The name of the filter in 'SCALE_FILTERS' to scale with
+
+        Return => pygame.Surface: the scaled image
+        """
+        task = self.scaledTasks.pop((path, size, scaleFilter), None)
+
+        if task is None:
+            return assets.loadScaled(path, size, scaleFilter)
+
+        if not task.done():
+            start = perf_counter()
+            task.exception()
+            self.waits[path] = perf_counter() - start
+
+        return task.result()
+
+    def isReady(self, path: Union[str, None] = None) -> bool:
+        """ Returns if an image, or every submitted image, has finished loading
+
+        Parameters:
+            path: str | None
+                The path of the image, or None for every image
+
+        Return => bool: True if nothing needs to be waited for
+        """
+        if path is None:
+            return all(task.done() for task in self.tasks.values())
+
+        task = self.tasks.get(path)
+        return task is None or task.done()
+
+    def waitFor(self, paths: Union[list[str], None] = None) -> dict[str, float]:
+        """ Blocks until the images at 'paths' have loaded. Images that are already loaded are not waited for
+
+        Parameters:
+            paths: list[str] | None
+                The paths of the images, or None for every submitted image
+
+        Return => dict[str, float]: the seconds waited for each image that was still loading
+        """
+        waited = {}
+        scaledTasks = {key[0]: task for key, task in self.scaledTasks.items()}
+
+        for path in (list(self.tasks) + list(scaledTasks) if paths is None else paths):
+            task = self.tasks.get(path, scaledTasks.get(path))
+
+            if task is None or task.done():
+                continue
+
+            start = perf_counter()
+
+            # a failed load is raised again when the game loads the image itself
+            task.exception()
+
+            waited[path] = perf_counter() - start
+
+        self.waits.update(waited)
+        return waited
+
+    def shutdown(self) -> None:
+        """ Cancels every load that has not started and stops the workers
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+preloader = AssetPreloader(PRELOAD_WORKERS)
+
+
+# Display viewport ------------------------------------------------------------
+class DisplayViewport(object):
+    """ The region of the display the game is shown in. When the game is drawn at a 'RENDER_RESOLUTION' smaller or
+        larger than the display, each frame is scaled into this region, keeping its aspect ratio
+
+    Attributes:
+        size: tuple[int, int]
+            The size the game is drawn at
+
+        displaySize: tuple[int, int]
+            The size of the display
+
+        scaling: str
+            "integer" scales by the largest whole factor that fits, so pixels stay sharp and changed regions can
+            still be pushed on their own. "smooth" fills as much of the display as possible with filtering
+
+        factor: float
+            The scale from the game to the display
+
+        rect: pygame.Rect
+            The region of the display the game is shown in. The rest of the display is left black
+
+    """
+
+    def __init__(self, size: tuple[int, int], displaySize: tuple[int, int], scaling: str) -> None:
+        self.size = size
+        self.displaySize = displaySize
+        fit = min(displaySize[0] / size[0], displaySize[1] / size[1])
+
+        # whole factors only work if the display is at least the size of the game
+        if scaling == "integer" and fit >= 1:
+            self.scaling = "integer"
+            self.factor = int(fit)
+
+        else:
+            self.scaling = "smooth"
+            self.factor = fit
+
+        self.rect = pygame.Rect(0, 0, int(size[0] * self.factor), int(size[1] * self.factor))
+        self.rect.center = (displaySize[0] // 2, displaySize[1] // 2)
+
+    @property
+    def scaled(self) -> bool:
+        """ If the game is not drawn at the size of the display """
+        return self.size != self.displaySize
+
+    @property
+    def partialUpdates(self) -> bool:
+        """ If changed regions can be pushed to the display on their own """
+        return self.scaling == "integer" or not self.scaled
+
+    def toDisplay(self, rect: pygame.Rect) -> pygame.Rect:
+        """ Converts a region of the game to the region of the display it is shown in
+
+        Parameters:
+            rect: pygame.Rect
+                The region of the game
+
+        Return => pygame.Rect: the region of the display
+        """
+        return pygame.Rect(self.rect.x + rect.x * self.factor, self.rect.y + rect.y * self.factor,
+                           rect.width * self.factor, rect.height * self.factor)
+
+    def toGame(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """ Converts a position on the display (i.e. the mouse) to a position in the game
+
+        Parameters:
+            pos: tuple[int, int]
+                The position on the display
+
+        Return => tuple[int, int]: the position in the game
+        """
+        if not self.scaled:
+            return pos
+
+        return int((pos[0] - self.rect.x) / self.factor), int((pos[1] - self.rect.y) / self.factor)
+
+    def present(self, frame: pygame.Surface, rects: list[pygame.Rect] = None) -> list[pygame.Rect]:
+        """ Copies a frame, or the given regions of it, to the display
+
+        Parameters:
+            frame: pygame.Surface
+                The finished frame
+
+            rects: list[pygame.Rect]
+                The regions to copy, or None for the whole frame
+
+        Return => list[pygame.Rect]: the regions of the display that changed
+        """
+        if frame is displayWindow:
+            return rects or [self.rect]
+
+        if not self.scaled:
+            for rect in rects or [self.rect]:
+                displayWindow.blit(frame, rect, rect)
+
+            return rects or [self.rect]
+
+        if rects is None:
+            scale = pygame.transform.scale if self.scaling == "integer" else pygame.transform.smoothscale
+            scale(frame, self.rect.size, displayWindow.subsurface(self.rect))
+
+            return [self.rect]
+
+        # only whole factors can be copied region by region
+        changed = []
+
+        for rect in rects:
+            target = self.toDisplay(rect)
+            pygame.transform.scale(frame.subsurface(rect), target.size, displayWindow.subsurface(target))
+            changed.append(target)
+
+        return changed
+
+
+# SDL's renderer always fits the frame to the window with filtering
+viewport = DisplayViewport((WIDTH, HEIGHT), screenSize, "smooth" if RENDER_BACKEND == "sdl2" else RENDER_SCALING)
+
+
+# Dirty rects -----------------------------------------------------------------
+class DirtyRectRenderer(object):
+    """ Tracks the regions of the frame that changed, so only those are pushed to the display.
+        Every frame redraws the background over the whole screen, so a region changed if something was drawn over the
+        background in it this frame or the frame before. The whole frame is pushed when the background is switched,
+        the camera scrolls, or the changed regions cover more than 'DIRTY_RECT_MAX_AREA' of the screen
+
+    Attributes:
+        enabled: bool
+            If dirty rects are used. If False every frame is pushed whole
+
+        current: list[pygame.Rect]
+            The regions drawn over the background this frame
+
+        previous: list[pygame.Rect]
+            The regions drawn over the background last frame, which have to be cleared
+
+        background: pygame.Surface | None
+            The background drawn this frame
+
+        fullRefresh: bool
+            If the whole frame has to be pushed
+
+        bounds: weakref.WeakKeyDictionary[pygame.Surface, pygame.Rect]
+            The non-transparent bounds of every blitted surface, so large mostly transparent images (i.e. the clouds)
+            only mark the area they cover
+
+        partialFrames: int
+            The number of frames pushed as dirty rects
+
+        fullFrames: int
+            The number of frames pushed whole
+
+    """
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.current = []
+        self.previous = []
+        self.background = None
+        self.fullRefresh = True
+        self.bounds = weakref.WeakKeyDictionary()
+        self.partialFrames = 0
+        self.fullFrames = 0
+
+    def mark(self, rect: pygame.Rect) -> pygame.Rect:
+        """ Records a region that was drawn over the background this frame
+
+        Parameters:
+            rect: pygame.Rect
+                The region that was drawn
+
+        Return => pygame.Rect: 'rect', so drawing calls can be wrapped
+        """
+        if self.enabled and rect.width and rect.height:
+            self.current.append(rect)
+
+        return rect
+
+    def markBlit(self, source: pygame.Surface, dest: Any, area: Any, drawn: pygame.Rect) -> None:
+        """ Records the region covered by the visible pixels of a blit
+
+        Parameters:
+            source: pygame.Surface
+                The surface that was blitted
+
+            dest: Any
+                The position it was blitted at
+
+            area: Any
+                The part of the source that was blitted, or None for all of it
+
+            drawn: pygame.Rect
+                The region returned by the blit
+
+        Return => None
+        """
+        if not self.enabled:
+            return
+
+        bounds = self.bounds.get(source)
+
+        if bounds is None:
+            bounds = source.get_bounding_rect()
+            self.bounds[source] = bounds
+
+        # only the visible pixels inside the area were drawn
+        if area is not None:
+            area = pygame.Rect(area)
+            bounds = bounds.clip(area).move(-area.x, -area.y)
+
+        # a pixel of slack for fractional positions, clipped to where the blit actually drew
+        x, y = (dest[0], dest[1]) if not isinstance(dest, pygame.Rect) else dest.topleft
+        self.mark(bounds.move(int(x), int(y)).inflate(2, 2).clip(drawn))
+
+    def invalidate(self) -> None:
+        """ Pushes the whole frame at the next update
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.fullRefresh = True
+
+    def drawBackground(self, background: pygame.Surface) -> None:
+        """ Draws a full screen background. It is not recorded as a change, unless it is a different background
+
+        Parameters:
+            background: pygame.Surface
+                The background to draw
+
+        Return => None
+        """
+        if background is not self.background:
+            self.background = background
+            self.invalidate()
+
+        gameWindow.blit(background, (0, 0))
+        frameStats.blitCalls += 1
+        frameStats.surfacesDrawn += 1
+
+    @staticmethod
+    def merge(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """ Joins overlapping regions - a sprite's old and new position usually overlap - so they are not counted twice
+
+        Parameters:
+            rects: list[pygame.Rect]
+                The regions to join
+
+        Return => list[pygame.Rect]: the joined regions
+        """
+        merged = []
+
+        for rect in rects:
+            for i, other in enumerate(merged):
+                if rect.colliderect(other):
+                    merged[i] = other.union(rect)
+                    break
+
+            else:
+                merged.append(rect)
+
+        return merged
+
+    def present(self) -> None:
+        """ Pushes the frame to the display, only updating the changed regions if possible
+
+        Parameters:
+
+
+        Return => None
+        """
+        partial = self.enabled and not self.fullRefresh and viewport.partialUpdates
+        rects = self.merge(self.previous + self.current) if partial else []
+        dirtyArea = sum(rect.width * rect.height for rect in rects)
+
+        if not partial or dirtyArea > WIDTH * HEIGHT * DIRTY_RECT_MAX_AREA:
+            viewport.present(gameWindow)
+            pygame.display.update()
+            self.fullFrames += 1
+
+        else:
+            # clipped to the frame, as a scaled region has to be inside it
+            rects = [rect.clip(gameWindow.get_rect()) for rect in rects]
+            pygame.display.update(viewport.present(gameWindow, [rect for rect in rects if rect.width and rect.height]))
+            self.partialFrames += 1
+
+        self.previous = self.current
+        self.current = []
+        self.fullRefresh = False
+
+
+dirtyRects = DirtyRectRenderer(DIRTY_RECTS)
+
+
+# the game is drawn straight onto the display, unless it has to be scaled to fit it
+if RENDER_BACKEND == "surface" and viewport.scaled:
+    gameWindow = pygame.Surface((WIDTH, HEIGHT), 0, displayWindow)
+
+
+# Render backends -------------------------------------------------------------
+class SurfaceBackend(object):
+    """ Draws the game with CPU blits onto 'gameWindow', which is pushed to the display by 'dirtyRects'. Every blit
+        and shape is recorded in 'dirtyRects', and blitted surfaces are passed to 'assets.checkFormat' if
+        'DEBUG_SURFACE_FORMATS' is True. Every draw function goes through a backend, so the game can be drawn with
+        'SDL2Backend' instead
+    """
+
+    def blit(self, source: pygame.Surface, dest: Any, area: Any = None, special_flags: int = 0) -> pygame.Rect:
+        """ Draws a surface
+
+        Parameters:
+            source: pygame.Surface
+                The surface to draw
+
+            dest: Any
+                The position on the screen to draw it at
+
+            area: Any
+                The part of the source to draw, or None for all of it
+
+            special_flags: int
+                The blend flags of the blit
+
+        Return => pygame.Rect: the region that was drawn
+        """
+        if DEBUG_SURFACE_FORMATS:
+            assets.checkFormat(source)
+
+        drawn = gameWindow.blit(source, dest, area, special_flags)
+        dirtyRects.markBlit(source, dest, area, drawn)
+        frameStats.blitCalls += 1
+        frameStats.surfacesDrawn += 1
+
+        return drawn
+
+    def blits(self, sequence: list[tuple]) -> None:
+        """ Draws a sequence of (source, dest, area, special_flags) blits with one call
+
+        Parameters:
+            sequence: list[tuple]
+                The blits to draw, in order
+
+        Return => None
+        """
+        if DEBUG_SURFACE_FORMATS:
+            for item in sequence:
+                assets.checkFormat(item[0])
+
+        drawn = gameWindow.blits(sequence)
+
+        for item, rect in zip(sequence, drawn):
+            dirtyRects.markBlit(item[0], item[1], item[2] if len(item) > 2 else None, rect)
+
+        frameStats.blitCalls += 1
+        frameStats.surfacesDrawn += len(sequence)
+
+    def drawRect(self, colour: tuple[int, int, int], rect: Any, width: int = 0, radius: int = -1) -> pygame.Rect:
+        """ Draws a filled rectangle, or its border if 'width' is larger than 0
+
+        Parameters:
+            colour: tuple[int, int, int]
+                The colour of the rectangle
+
+            rect: Any
+                The rectangle to draw
+
+            width: int
+                The width of the border, or 0 to fill the rectangle
+
+            radius: int
+                The radius of the rounded corners
+
+        Return => pygame.Rect: the region that was drawn
+        """
+        return dirtyRects.mark(pygame.draw.rect(gameWindow, colour, rect, width, radius))
+
+    def drawLine(self, colour: tuple[int, int, int], start: tuple[float, float], end: tuple[float, float], width: int = 1) -> pygame.Rect:
+        """ Draws a straight line
+
+        Parameters:
+            colour: tuple[int, int, int]
+                The colour of the line
+
+            start: tuple[float, float]
+                The start of the line
+
+            end: tuple[float, float]
+                The end of the line
+
+            width: int
+                The thickness of the line
+
+        Return => pygame.Rect: the region that was drawn
+        """
+        return dirtyRects.mark(pygame.draw.line(gameWindow, colour, start, end, width))
+
+    def drawBackground(self, background: pygame.Surface) -> None:
+        """ Draws a full screen background under everything else in the frame
+
+        Parameters:
+            background: pygame.Surface
+                The background to draw
+
+        Return => None
+        """
+        dirtyRects.drawBackground(background)
+
+    def setIcon(self, image: pygame.Surface) -> None:
+        """ Sets the icon of the window
+
+        Parameters:
+            image: pygame.Surface
+                The icon
+
+        Return => None
+        """
+        pygame.display.set_icon(image)
+
+    def present(self) -> None:
+        """ Shows the finished frame on the screen
+
+        Parameters:
+
+
+        Return => None
+        """
+        dirtyRects.present()
+
+
+class SDL2Backend(SurfaceBackend):
+    """ Draws the game with SDL's renderer. Every surface is uploaded as a texture the first time it is drawn, and
+        left-facing images are drawn by flipping the texture of the right-facing image instead of uploading both.
+        Uses the hardware renderer if there is one and SDL's software renderer otherwise (i.e. headless machines)
+
+    Attributes:
+        window: pygame._sdl2.video.Window
+            The window that is drawn to
+
+        renderer: pygame._sdl2.video.Renderer
+            The renderer of the window. The frame is drawn at 'size' and scaled to the window by the renderer
+
+        frame: pygame._sdl2.video.Texture
+            The texture every frame is drawn on. It keeps the last frame after it is presented, so overlays (i.e. the
+            paused image) are drawn over the game like with the surface backend
+
+        textures: weakref.WeakKeyDictionary[pygame.Surface, pygame._sdl2.video.Texture]
+            The texture of every drawn surface. Weak keys, so text rendered every frame does not pile up
+
+    """
+
+    def __init__(self, window: Any, size: tuple[int, int]) -> None:
+        self.window = window
+
+        try:
+            self.renderer = Renderer(window, accelerated=1)
+
+        except RendererError:
+            self.renderer = Renderer(window, accelerated=0)
+
+        if tuple(size) != tuple(window.size):
+            self.renderer.logical_size = size
+
+        self.frame = Texture(self.renderer, size, target=True)
+        self.renderer.target = self.frame
+        self.textures = weakref.WeakKeyDictionary()
+
+    def texture(self, source: pygame.Surface) -> tuple[Any, bool]:
+        """ Gets the texture of a surface, uploading it if it has not been drawn before
+
+        Parameters:
+            source: pygame.Surface
+                The surface to draw
+
+        Return => tuple[Texture, bool]: the texture, and if it has to be flipped to look like 'source'
+        """
+        original = assets.original(source)
+        flipped = original is not None
+
+        if flipped:
+            source = original
+
+        texture = self.textures.get(source)
+
+        if texture is None:
+            # SDL copies the surface's alpha (i.e. the paused overlay) and blend mode to the texture
+            texture = Texture.from_surface(self.renderer, source)
+            self.textures[source] = texture
+
+        return texture, flipped
+
+    def blit(self, source: pygame.Surface, dest: Any, area: Any = None, special_flags: int = 0) -> pygame.Rect:
+        x, y = (dest[0], dest[1]) if not isinstance(dest, pygame.Rect) else dest.topleft
+
+        # empty surfaces (i.e. text that has not started typing) cannot be textures
+        if not source.get_width() or not source.get_height():
+            return pygame.Rect(int(x), int(y), 0, 0)
+
+        texture, flipped = self.texture(source)
+
+        if area is None:
+            sourceRect = None
+            drawn = pygame.Rect(int(x), int(y), *source.get_size())
+
+        else:
+            sourceRect = pygame.Rect(area)
+            drawn = pygame.Rect(int(x), int(y), *sourceRect.size)
+
+            # the area is taken from the unflipped texture
+            if flipped:
+                sourceRect.x = source.get_width() - sourceRect.right
+
+        texture.draw(sourceRect, drawn, flip_x=flipped)
+        frameStats.blitCalls += 1
+        frameStats.surfacesDrawn += 1
+
+        return drawn
+
+    def blits(self, sequence: list[tuple]) -> None:
+        for item in sequence:
+            self.blit(*item)
+
+    def drawRect(self, colour: tuple[int, int, int], rect: Any, width: int = 0, radius: int = -1) -> pygame.Rect:
+        # the renderer has no rounded corners, so they are drawn square
+        rect = pygame.Rect(rect)
+        self.renderer.draw_color = pygame.Color(colour)
+
+        if width <= 0:
+            self.renderer.fill_rect(rect)
+
+        else:
+            for i in range(width):
+                self.renderer.draw_rect(rect.inflate(-2 * i, -2 * i))
+
+        return rect
+
+    def drawLine(self, colour: tuple[int, int, int], start: tuple[float, float], end: tuple[float, float], width: int = 1) -> pygame.Rect:
+        self.renderer.draw_color = pygame.Color(colour)
+
+        # thick lines are drawn as several lines side by side
+        for i in range(width):
+            offset = i - width // 2
+
+            if abs(end[0] - start[0]) > abs(end[1] - start[1]):
+                self.renderer.draw_line((start[0], start[1] + offset), (end[0], end[1] + offset))
+            else:
+                self.renderer.draw_line((start[0] + offset, start[1]), (end[0] + offset, end[1]))
+
+        return pygame.Rect(min(start[0], end[0]), min(start[1], end[1]), abs(end[0] - start[0]) + width, abs(end[1] - start[1]) + width)
+
+    def drawBackground(self, background: pygame.Surface) -> None:
+        # a new frame starts from black, in case the background does not cover the whole screen
+        self.renderer.draw_color = pygame.Color(BLACK)
+        self.renderer.clear()
+        self.blit(background, (0, 0))
+
+    def setIcon(self, image: pygame.Surface) -> None:
+        self.window.set_icon(image)
+
+    def present(self) -> None:
+        # the frame is copied to the window, and kept for anything drawn over it before the next background
+        self.renderer.target = None
+        self.renderer.draw_color = pygame.Color(BLACK)
+        self.renderer.clear()
+        self.frame.draw()
+        self.renderer.present()
+        self.renderer.target = self.frame
+
+
+backend = SDL2Backend(rendererWindow, (WIDTH, HEIGHT)) if RENDER_BACKEND == "sdl2" else SurfaceBackend()
+
+
+# Camera ----------------------------------------------------------------------
+class Camera(object):
+    """ The view of the level. Everything in the level is kept in world coordinates, which do not change when the
+        screen scrolls - the camera offset is only applied when things are drawn
+
+    Attributes:
+        x: float
+            The world x position of the left edge of the screen
+
+    """
+
+    def __init__(self) -> None:
+        self.x = 0
+
+    def reset(self) -> None:
+        """ Moves the camera back to the start of a level
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.x = 0
+        dirtyRects.invalidate()
+
+    def scroll(self, rate: float) -> None:
+        """ Moves the camera forward to give the illusion of the player moving forward
+
+        Parameters:
+            rate: float
+                The distance to move the camera by
+
+        Return => None
+        """
+        # the camera scrolled, so every region of the screen changed
+        if rate:
+            self.x += rate
+            dirtyRects.invalidate()
+
+    def toScreen(self, x: float) -> float:
+        """ Converts a world x position to a position on the screen
+
+        Parameters:
+            x: float
+                The world x position
+
+        Return => float: the x position on the screen
+        """
+        return x - self.x
+
+    def toWorld(self, x: float) -> float:
+        """ Converts an x position on the screen to a world position
+
+        Parameters:
+            x: float
+                The x position on the screen
+
+        Return => float: the world x position
+        """
+        return x + self.x
+
+    def isVisible(self, x: float, y: float, width: float, height: float) -> bool:
+        """ Returns if a region of the world is on the screen, or within 'CULL_MARGIN' of it
+
+        Parameters:
+            x: float
+                The world x position of the left of the region
+
+            y: float
+                The y position of the top of the region
+
+            width: float
+                The width of the region
+
+            height: float
+                The height of the region
+
+        Return => bool: True if the region can be seen
+        """
+        return (x < self.x + WIDTH + CULL_MARGIN and x + width > self.x - CULL_MARGIN and
+                y < HEIGHT + CULL_MARGIN and y + height > -CULL_MARGIN)
+
+
+camera = Camera()
+
+
+# Blit batching ---------------------------------------------------------------
+class FrameStats(object):
+    """ Counts the blit calls made into SDL every frame. Only blits made through the render backend are counted
+
+    Attributes:
+        blitCalls: int
+            The number of blit and blits calls made this frame
+
+        surfacesDrawn: int
+            The number of surfaces drawn this frame
+
+        lastBlitCalls: int
+            The number of blit and blits calls made last frame
+
+        lastSurfacesDrawn: int
+            The number of surfaces drawn last frame
+
+        peakBlitCalls: int
+            The most blit and blits calls made in a single frame
+
+        spritesDrawn, spritesCulled: int
+            The number of sprites queued on a 'BlitBatch' this frame, and the number skipped for being off the screen
+
+        lastSpritesDrawn, lastSpritesCulled: int
+            The number of sprites drawn and culled last frame
+
+        layerBlits, layerPixels: int
+            The number of background layers drawn this frame, and the number of pixels they covered
+
+        lastLayerBlits, lastLayerPixels: int
+            The number of background layers drawn last frame, and the number of pixels they covered
+
+    """
+
+    def __init__(self) -> None:
+        self.blitCalls = 0
+        self.surfacesDrawn = 0
+        self.lastBlitCalls = 0
+        self.lastSurfacesDrawn = 0
+        self.peakBlitCalls = 0
+        self.spritesDrawn = 0
+        self.spritesCulled = 0
+        self.lastSpritesDrawn = 0
+        self.lastSpritesCulled = 0
+        self.layerBlits = 0
+        self.layerPixels = 0
+        self.lastLayerBlits = 0
+        self.lastLayerPixels = 0
+
+    def endFrame(self) -> None:
+        """ Keeps the counts of the finished frame and starts counting the next one
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.lastBlitCalls = self.blitCalls
+        self.lastSurfacesDrawn = self.surfacesDrawn
+        self.peakBlitCalls = max(self.peakBlitCalls, self.blitCalls)
+        self.lastSpritesDrawn = self.spritesDrawn
+        self.lastSpritesCulled = self.spritesCulled
+        self.lastLayerBlits = self.layerBlits
+        self.lastLayerPixels = self.layerPixels
+        self.blitCalls = 0
+        self.surfacesDrawn = 0
+        self.spritesDrawn = 0
+        self.spritesCulled = 0
+        self.layerBlits = 0
+        self.layerPixels = 0
+
+
+frameStats = FrameStats()
+
+
+class BlitBatch(object):
+    """ Collects the blits of one draw pass so they are submitted to SDL with a single 'blits' call.
+        Entities queue their images with 'blit' in world coordinates and the pass calls 'submit' once every entity has
+        been queued. Images that are not on the screen are culled instead of queued
+
+    Attributes:
+        sequence: list[tuple]
+            The queued (source, dest, area, special_flags) blits, in the order they are drawn
+
+    """
+
+    def __init__(self) -> None:
+        self.sequence = []
+
+    def blit(self, source: pygame.Surface, dest: Any, area: Any = None, special_flags: int = 0) -> None:
+        """ Queues a blit to the game window, offset by the camera, if it can be seen
+
+        Parameters:
+            source: pygame.Surface
+                The surface to draw
+
+            dest: Any
+                The world position to draw it at
+
+            area: Any
+                The part of the source to draw, or None for all of it
+
+            special_flags: int
+                The blend flags of the blit
+
+        Return => None
+        """
+        width, height = source.get_size() if area is None else pygame.Rect(area).size
+
+        if self.visible(dest[0], dest[1], width, height):
+            self.sequence.append((source, (dest[0] - camera.x, dest[1]), area, special_flags))
+            frameStats.spritesDrawn += 1
+
+    @staticmethod
+    def visible(x: float, y: float, width: float, height: float) -> bool:
+        """ Returns if a region of the world can be seen, counting it as culled if not
+
+        Parameters:
+            x: float
+                The world x position of the left of the region
+
+            y: float
+                The y position of the top of the region
+
+            width: float
+                The width of the region
+
+            height: float
+                The height of the region
+
+        Return => bool: True if the region can be seen
+        """
+        if camera.isVisible(x, y, width, height):
+            return True
+
+        frameStats.spritesCulled += 1
+        return False
+
+    def submit(self) -> None:
+        """ Draws every queued blit to the game window with one call and empties the batch
+
+        Parameters:
+
+
+        Return => None
+        """
+        if self.sequence:
+            backend.blits(self.sequence)
+            self.sequence = []
+
+
+spriteBatch = BlitBatch()
+
+
+# Health bars -----------------------------------------------------------------
+class HealthBarCache(object):
+    """ Health bars rasterized once per style and health bucket, so each bar is a single blit while the health does
+        not change
+
+    Attributes:
+        bars: dict[tuple, tuple[pygame.Surface, tuple[int, int]]]
+            The rasterized bars and the offset of their top left corner from where the bar is drawn, keyed by their
+            style, size and the number of health chunks they show
+
+    """
+
+    def __init__(self) -> None:
+        self.bars = {}
+
+    @staticmethod
+    def rasterize(shapes: list[tuple]) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ Draws a bar made of rectangles to its own transparent surface
+
+        Parameters:
+            shapes: list[tuple]
+                The (colour, rect, width, border radius) of every rectangle, relative to where the bar is drawn
+
+        Return => tuple[pygame.Surface, tuple[int, int]]: the bar and the offset of its top left corner
+        """
+        bounds = pygame.Rect(shapes[0][1]).unionall([pygame.Rect(shape[1]) for shape in shapes[1:]])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+
+        for colour, rect, width, radius in shapes:
+            pygame.draw.rect(surface, colour, pygame.Rect(rect).move(-bounds.x, -bounds.y), width, radius)
+
+        return assets.normalize(surface), bounds.topleft
+
+    def get(self, key: tuple, shapes: Callable[[], list[tuple]]) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ Gets a bar, rasterizing it if it is not cached
+
+        Parameters:
+            key: tuple
+                The style, size and health bucket of the bar
+
+            shapes: Callable[[], list[tuple]]
+                Returns the rectangles of the bar. Only called if the bar is not cached
+
+        Return => tuple[pygame.Surface, tuple[int, int]]: the bar and the offset of its top left corner
+        """
+        bar = self.bars.get(key)
+
+        if bar is None:
+            bar = self.rasterize(shapes())
+            self.bars[key] = bar
+
+        return bar
+
+    def player(self, health: float) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ Gets the bar of a player, in chunks of 5 health
+
+        Parameters:
+            health: float
+                The health of the player
+
+        Return => tuple[pygame.Surface, tuple[int, int]]: the bar and its offset from (WIDTH - 366, y)
+        """
+        chunks = int(health // 5)
+
+        def shapes() -> list[tuple]:
+            drawn = []
+
+            for j in range(chunks):
+                # health
+                drawn.append((RED, (j * 14, 3, 14, 30), 0, 0))
+                drawn.append((LRED, (j * 14, 8, 14, 6), 0, 0))
+
+                # drawing over edges of health bar
+                if j == 0:
+                    drawn.append((RED, (0, 3, 6, 30), 0, 0))
+                if j == chunks - 1:
+                    drawn.append((RED, (j * 14 + 8, 3, 6, 30), 0, 0))
+
+            # border
+            drawn.append((BLACK, (-4, 0, 286, 36), 5, 8))
+            drawn.append(((64, 64, 64), (-4, -2, 288, 40), 3, 8))
+
+            return drawn
+
+        return self.get(("player", chunks), shapes)
+
+    def boss(self, health: float) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ Gets the bar of the boss, in chunks of 25 health
+
+        Parameters:
+            health: float
+                The health of the boss
+
+        Return => tuple[pygame.Surface, tuple[int, int]]: the bar and its offset from (200, y)
+        """
+        chunks = int(health // 25)
+
+        def shapes() -> list[tuple]:
+            drawn = []
+
+            for j in range(chunks):
+                # health
+                drawn.append((PURPLE, (j * 14, 3, 14, 30), 0, 0))
+                drawn.append((LPURPLE, (j * 14, 8, 14, 6), 0, 0))
+
+                # drawing over edges of health bar
+                if j == 0:
+                    drawn.append((PURPLE, (0, 3, 6, 30), 0, 0))
+                if j == chunks - 1:
+                    drawn.append((PURPLE, (j * 14 + 8, 3, 6, 30), 0, 0))
+
+            # border
+            drawn.append((BLACK, (-4, 0, 422, 36), 5, 8))
+            drawn.append(((64, 64, 64), (-4, -2, 424, 40), 3, 8))
+
+            return drawn
+
+        return self.get(("boss", chunks), shapes)
+
+    def enemy(self, health: float, size: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """ Gets the bar of an enemy, in chunks of 5 health
+
+        Parameters:
+            health: float
+                The health of the enemy
+
+            size: int
+                The width of the enemy
+
+        Return => tuple[pygame.Surface, tuple[int, int]]: the bar and its offset from the top left corner of the enemy
+        """
+        chunks = int(health // 5)
+
+        def shapes() -> list[tuple]:
+            # the border, then the health
+            drawn = [(BLACK, (-2, -7, size + 4, 9), 2, 1)]
+
+            for j in range(chunks):
+                drawn.append((RED, (j * size // 23, -5, size // 5, 5), 0, 0))
+
+            return drawn
+
+        return self.get(("enemy", size, chunks), shapes)
+
+
+healthBars = HealthBarCache()
+
+
+# Animation clips -------------------------------------------------------------
+class AnimationClip(object):
+    """ A sequence of animation images and how long each one is shown for, shared by everything that plays it. The
+        image shown on every tick is looked up in a table built once, so playing a clip is an index calculation.
+        The images are loaded when the clip is first played, and again after they are released
+
+    Attributes:
+        paths: tuple[str, ...]
+            The paths of the animation images, in order
+
+        size: tuple[int, int] | None
+            The size the images are scaled to through 'scaledFrames', or None to use them as they are
+
+        frames: tuple[pygame.Surface, ...] | None
+            The animation images, or None while they are not loaded
+
+        durations: tuple[int, ...]
+            The number of ticks each image is shown for
+
+        loops: bool
+            True if the clip starts over once it ends, False if it holds its last image
+
+        table: tuple[int, ...]
+            The index of the image shown on every tick of one play through the clip
+
+    """
+
+    def __init__(self, paths: tuple[str, ...], size: Union[tuple[int, int], None], durations: Sequence[int],
+                 loops: bool) -> None:
+        self.paths = paths
+        self.size = size
+        self.frames = None
+        self.durations = tuple(durations)
+        self.loops = loops
+        self.table = tuple(index for index, duration in enumerate(self.durations) for _ in range(duration))
+
+    def frame(self, age: int) -> pygame.Surface:
+        """ Returns the image shown a number of ticks after the clip started
+
+        Parameters:
+            age: int
+                The number of ticks since the clip started
+
+        Return => pygame.Surface: the image to draw
+        """
+        if self.frames is None:
+            self.load()
+
+        if self.loops:
+            return self.frames[self.table[age % len(self.table)]]
+
+        return self.frames[self.table[min(age, len(self.table) - 1)]]
+
+    def finished(self, age: int) -> bool:
+        """ Returns if a clip that does not loop has played through
+
+        Parameters:
+            age: int
+                The number of ticks since the clip started
+
+        Return => bool: True if the clip is over
+        """
+        return not self.loops and age >= len(self.table)
+
+    def load(self) -> None:
+        """ Loads the animation images through the asset cache
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.frames = tuple(assets.load(path) for path in self.paths) if self.size is None \
+            else tuple(scaledFrames.get(self.paths, self.size))
+
+    def release(self) -> None:
+        """ Drops the clip's references to its images, so evicting them from the asset cache frees them
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.frames = None
+
+
+class AnimationRegistry(object):
+    """ Every animation clip, looked up by id, and the tick they are all played against. Animated objects only keep
+        the id of their clip and the tick it started on, instead of their own images and stage counters
+
+    Attributes:
+        clips: list[AnimationClip]
+            The registered clips, indexed by their id
+
+        ids: dict[tuple, int]
+            The id of every clip, keyed by its image paths, size, timing and if it loops
+
+        tick: int
+            The number of gameplay frames played
+
+    """
+
+    def __init__(self) -> None:
+        self.clips = []
+        self.ids = {}
+        self.tick = 0
+
+    def register(self, paths: tuple[str, ...], durations: Union[int, tuple[int, ...]], loops: bool = True,
+                 size: Union[tuple[int, int], None] = None) -> int:
+        """ Returns the id of a clip, loading its images the first time the clip is registered
+
+        Parameters:
+            paths: tuple[str, ...]
+                The paths of the animation images, in order
+
+            durations: int | tuple[int, ...]
+                The number of ticks every image is shown for, or the number of ticks of each image
+
+            loops: bool
+                True if the clip starts over once it ends, False if it holds its last image
+
+            size: tuple[int, int] | None
+                The size the images are scaled to through 'scaledFrames', or None to use them as they are
+
+        Return => int: the id of the clip
+        """
+        if isinstance(durations, int):
+            durations = (durations,) * len(paths)
+
+        key = (paths, durations, loops, size)
+        clipId = self.ids.get(key)
+
+        if clipId is None:
+            clip = AnimationClip(paths, size, durations, loops)
+            clip.load()
+            clipId = self.ids[key] = len(self.clips)
+            self.clips.append(clip)
+
+        return clipId
+
+    def release(self, paths: set[str]) -> None:
+        """ Releases the images of every clip that plays any of 'paths'. The clips keep their ids, and load their
+            images again if they are played later
+
+        Parameters:
+            paths: set[str]
+                The paths of the images being evicted
+
+        Return => None
+        """
+        for clip in self.clips:
+            if clip.frames is not None and not paths.isdisjoint(clip.paths):
+                clip.release()
+
+    def frame(self, clipId: int, startTick: int) -> pygame.Surface:
+        """ Returns the current image of a clip
+
+        Parameters:
+            clipId: int
+                The id of the clip
+
+            startTick: int
+                The tick the clip started on
+
+        Return => pygame.Surface: the image to draw
+        """
+        return self.clips[clipId].frame(self.tick - startTick)
+
+    def finished(self, clipId: int, startTick: int) -> bool:
+        """ Returns if a clip that does not loop has played through
+
+        Parameters:
+            clipId: int
+                The id of the clip
+
+            startTick: int
+                The tick the clip started on
+
+        Return => bool: True if the clip is over
+        """
+        return self.clips[clipId].finished(self.tick - startTick)
+
+    def advance(self) -> None:
+        """ Moves every animation on to the next tick
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.tick += 1
+
+
+animations = AnimationRegistry()
+
+
+# Effects ---------------------------------------------------------------------
+EFFECT_POOL_SIZE = 128  # the most explosions and flashes that can play at once
+
+
+class EffectPool(object):
+    """ Plays the one-shot animations (explosions and flashes) of objects that have already left the game, so nothing
+        stays in 'enemies', 'bullets' or 'grenades' just to finish animating. Effects are kept in preallocated parallel
+        lists, with the live ones packed at the front, and are all drawn in one pass every frame
+
+    Attributes:
+        size: int
+            The most effects that can play at once
+
+        count: int
+            The number of effects playing. They are kept in the first 'count' slots of every list
+
+        x, y: list[float]
+            The world position of the top left corner of each effect
+
+        clip: list[int]
+            The id of the animation clip each effect plays. Effect clips do not loop
+
+        startTick: list[int]
+            The tick of 'animations' each effect started on
+
+        flipped: list[bool]
+            True if the effect is drawn facing left
+
+        dropped: int
+            The number of effects not played because every slot was in use
+
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.count = 0
+        self.x = [0.0] * size
+        self.y = [0.0] * size
+        self.clip = [0] * size
+        self.startTick = [0] * size
+        self.flipped = [False] * size
+        self.dropped = 0
+
+    def spawn(self, clipId: int, x: float, y: float, flipped: bool = False) -> None:
+        """ Starts an effect on the current tick. It is dropped if every slot is in use
+
+        Parameters:
+            clipId: int
+                The id of the right-facing animation clip to play
+
+            x: float
+                The world x position of the top left corner of the effect
+
+            y: float
+                The y position of the top left corner of the effect
+
+            flipped: bool
+                True to draw the effect facing left
+
+        Return => None
+        """
+        if self.count == self.size:
+            self.dropped += 1
+            return
+
+        slot = self.count
+        self.x[slot] = x
+        self.y[slot] = y
+        self.clip[slot] = clipId
+        self.startTick[slot] = animations.tick
+        self.flipped[slot] = flipped
+        self.count += 1
+
+    def retire(self, slot: int) -> None:
+        """ Frees a slot by moving the last live effect into it
+
+        Parameters:
+            slot: int
+                The slot of the finished effect
+
+        Return => None
+        """
+        last = self.count - 1
+        self.x[slot] = self.x[last]
+        self.y[slot] = self.y[last]
+        self.clip[slot] = self.clip[last]
+        self.startTick[slot] = self.startTick[last]
+        self.flipped[slot] = self.flipped[last]
+        self.count = last
+
+    def update(self) -> None:
+        """ Draws the current image of every effect and retires the finished ones
+
+        Parameters:
+
+
+        Return => None
+        """
+        clips = animations.clips
+        slot = 0
+
+        while slot < self.count:
+            clip = clips[self.clip[slot]]
+            age = animations.tick - self.startTick[slot]
+
+            if clip.finished(age):
+                # the moved-in effect is drawn on the next iteration, so 'slot' is not advanced
+                self.retire(slot)
+                continue
+
+            spriteBatch.blit(assets.facing(clip.frame(age), self.flipped[slot]), (self.x[slot], self.y[slot]))
+            slot += 1
+
+        spriteBatch.submit()
+
+    def clear(self) -> None:
+        """ Stops every effect
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.count = 0
+
+
+effects = EffectPool(EFFECT_POOL_SIZE)
+
+
+# HUD -------------------------------------------------------------------------
+class HUDWidget(object):
+    """ A part of the HUD that is rendered from a few values (i.e. the number of coins), and only rendered again when
+        those values change
+
+    Attributes:
+        render: Callable[..., pygame.Surface]
+            Renders the widget from its values
+
+        values: tuple | None
+            The values the cached surface shows, or None if it has not been rendered
+
+        surface: pygame.Surface | None
+            The cached surface
+
+        renders: int
+            The number of times the widget has been rendered
+
+    """
+
+    def __init__(self, render: Callable[..., pygame.Surface]) -> None:
+        self.render = render
+        self.values = None
+        self.surface = None
+        self.renders = 0
+
+    def get(self, *values) -> pygame.Surface:
+        """ Returns the widget showing 'values', rendering it only if they changed
+
+        Parameters:
+            values: Any
+                The values to show
+
+        Return => pygame.Surface: the rendered widget
+        """
+        if values != self.values:
+            self.surface = self.render(*values)
+            self.values = values
+            self.renders += 1
+
+        return self.surface
+
+
+class HUDLayer(object):
+    """ The HUD, drawn over the level. Its widgets are cached between frames, and every part of the HUD is queued during
+        the frame and drawn with a single blits call
+
+    Attributes:
+        widgets: dict[str, HUDWidget]
+            The widgets, keyed by their name
+
+        sequence: list[tuple]
+            The (source, dest, area, special_flags) blits queued this frame
+
+    """
+
+    def __init__(self) -> None:
+        self.widgets = {}
+        self.sequence = []
+
+    def widget(self, name: str, render: Callable[..., pygame.Surface], *values) -> pygame.Surface:
+        """ Returns a widget showing 'values', creating the widget the first time it is used
+
+        Parameters:
+            name: str
+                The name of the widget
+
+            render: Callable[..., pygame.Surface]
+                Renders the widget from its values
+
+            values: Any
+                The values to show
+
+        Return => pygame.Surface: the rendered widget
+        """
+        widget = self.widgets.get(name)
+
+        if widget is None:
+            widget = HUDWidget(render)
+            self.widgets[name] = widget
+
+        return widget.get(*values)
+
+    def blit(self, source: pygame.Surface, dest: Any) -> None:
+        """ Queues a part of the HUD
+
+        Parameters:
+            source: pygame.Surface
+                The surface to draw
+
+            dest: Any
+                The position on the screen to draw it at
+
+        Return => None
+        """
+        self.sequence.append((source, dest, None, 0))
+
+    def draw(self) -> None:
+        """ Draws every queued part of the HUD with one call
+
+        Parameters:
+
+
+        Return => None
+        """
+        if self.sequence:
+            backend.blits(self.sequence)
+            self.sequence = []
+
+
+hud = HUDLayer()
+
+
+# Text ------------------------------------------------------------------------
+class GlyphFont(object):
+    """ A drop-in for the render() and size() methods of pygame.font.Font. Every character of a colour is rasterized once
+        into a glyph atlas, and strings are built by blitting the glyphs from it
+
+    Attributes:
+        font: pygame.font.Font
+            The font the glyphs are rasterized with
+
+        height: int
+            The height of a line of text. Glyphs that reach above or below the line (i.e. '$' and ',') make their
+            text taller
+
+        glyphMetrics: dict[str, tuple[int, int, int]]
+            The width each character moves the pen by, and how far its glyph reaches above and below the line, keyed by
+            the character
+
+        atlases: dict[tuple[bool, tuple[int, int, int, int]], dict[str, tuple[pygame.Surface, pygame.Rect | None]]]
+            The (source, area) of every rasterized glyph, keyed by antialiasing and colour, then by the character
+
+    """
+
+    def __init__(self, path: str, size: int) -> None:
+        self.font = pygame.font.Font(path, size)
+        self.height = self.font.get_height()
+        self.glyphMetrics = {}
+        self.atlases = {}
+
+    def metrics(self, char: str) -> tuple[int, int, int]:
+        """ Returns the width 'char' moves the pen by, and how far its glyph reaches above and below the line
+
+        Parameters:
+            char: str
+                The character to measure
+
+        Return => tuple[int, int, int]: the advance of the character, and its overhang above and below the line
+        """
+        metrics = self.glyphMetrics.get(char)
+
+        if metrics is None:
+            advance, height = self.font.size(char)
+
+            # a glyph taller than the font's ascent pushes the line down
+            glyph = self.font.metrics(char)[0]
+            above = max(0, glyph[3] - self.font.get_ascent()) if glyph is not None else 0
+
+            metrics = (advance, above, height - self.height - above)
+            self.glyphMetrics[char] = metrics
+
+        return metrics
+
+    def atlas(self, antialias: bool, colour: tuple[int, int, int, int]) -> dict[str, tuple[pygame.Surface, Any]]:
+        """ Returns the glyphs of a colour, rasterizing 'GLYPH_CHARSET' into a new atlas the first time it is used
+
+        Parameters:
+            antialias: bool
+                Whether the glyphs are antialiased
+
+            colour: tuple[int, int, int, int]
+                The colour of the glyphs
+
+        Return => dict[str, tuple[pygame.Surface, Any]]: the (source, area) of every glyph, keyed by the character
+        """
+        glyphs = self.atlases.get((antialias, colour))
+
+        if glyphs is not None:
+            return glyphs
+
+        # packs the glyphs into rows -----------------------------------
+        rects = {}
+        x = y = width = rowHeight = 0
+        for char in GLYPH_CHARSET:
+            advance, above, below = self.metrics(char)
+            height = above + self.height + below
+
+            if x + advance > GLYPH_ATLAS_WIDTH and x > 0:
+                x = 0
+                y += rowHeight
+                rowHeight = 0
+
+            rects[char] = pygame.Rect(x, y, advance, height)
+            x += advance
+            width = max(width, x)
+            rowHeight = max(rowHeight, height)
+
+        # rasterizes every glyph into the atlas ------------------------
+        sheet = pygame.Surface((max(width, 1), y + rowHeight), pygame.SRCALPHA)
+        sheet.blits([(self.font.render(char, antialias, colour), rect) for char, rect in rects.items()], doreturn=False)
+        sheet = assets.normalize(sheet)
+
+        glyphs = {char: (sheet, rect) for char, rect in rects.items()}
+        self.atlases[(antialias, colour)] = glyphs
+
+        return glyphs
+
+    def render(self, text: str, antialias: bool, color: Any, background: Any = None) -> pygame.Surface:
+        """ Renders 'text' from the glyph atlas of its colour
+
+        Parameters:
+            text: str
+                The text to render
+
+            antialias: bool
+                Whether the text is antialiased
+
+            color: Any
+                The colour of the text
+
+            background: Any
+                The colour behind the text, or None for a transparent background
+
+        Return => pygame.Surface: the rendered text
+        """
+        glyphs = self.atlas(antialias, tuple(pygame.Color(color)))
+
+        surface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        if background is not None:
+            surface.fill(background)
+
+        # every glyph sits on the line of the tallest one
+        top = max((self.metrics(char)[1] for char in text), default=0)
+
+        sequence = []
+        x = 0
+        for char in text:
+            glyph = glyphs.get(char)
+
+            # characters outside of 'GLYPH_CHARSET' are rasterized on their own
+            if glyph is None:
+                glyph = (self.font.render(char, antialias, color), None)
+                glyphs[char] = glyph
+
+            advance, above, below = self.metrics(char)
+            sequence.append((glyph[0], (x, top - above), glyph[1]))
+            x += advance
+
+        surface.blits(sequence, doreturn=False)
+
+        return surface
+
+    def size(self, text: str) -> tuple[int, int]:
+        """ Measures 'text' from the cached metrics of its characters
+
+        Parameters:
+            text: str
+                The text to measure
+
+        Return => tuple[int, int]: the width and height of the rendered text
+        """
+        metrics = [self.metrics(char) for char in text]
+
+        width = sum(advance for advance, above, below in metrics)
+        above = max((above for advance, above, below in metrics), default=0)
+        below = max((below for advance, above, below in metrics), default=0)
+
+        return width, above + self.height + below
+
+
+# Text cache ------------------------------------------------------------------
+TEXT_CACHE_SIZE = 256  # the number of rendered strings kept before the least recently used one is dropped
+
+
+class TextCache(object):
+    """ A bounded cache of rendered text, so strings drawn every frame are only rasterized once. The least recently
+        used string is dropped when the cache is full
+
+    Attributes:
+        maxSurfaces: int
+            The number of rendered strings kept
+
+        surfaces: OrderedDict[tuple[Any, str, bool, tuple[int, ...]], pygame.Surface]
+            The rendered text, keyed by the font, string, antialiasing and colour, from least to most recently used
+
+        typedTexts: OrderedDict[tuple[Any, str, bool, tuple[int, ...]], TypedText]
+            The messages with a typed-out animation, keyed like 'surfaces', from least to most recently used
+
+        hits: int
+            The number of renders served from the cache
+
+        misses: int
+            The number of renders that had to rasterize the text
+
+    """
+
+    def __init__(self, maxSurfaces: int) -> None:
+        self.maxSurfaces = maxSurfaces
+        self.surfaces = OrderedDict()
+        self.typedTexts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hitRate(self) -> float:
+        """ The fraction of renders served from the cache """
+        return self.hits / max(self.hits + self.misses, 1)
+
+    def render(self, font: Any, text: str, antialias: bool, colour: Any) -> pygame.Surface:
+        """ Returns 'text' rendered with 'font'. The surface is shared, so it must not be modified
+
+        Parameters:
+            font: GlyphFont | pygame.font.Font
+                The font to render with
+
+            text: str
+                The text to render
+
+            antialias: bool
+                Whether the text is antialiased
+
+            colour: Any
+                The colour of the text
+
+        Return => pygame.Surface: the rendered text
+        """
+        key = (font, text, antialias, tuple(colour))
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, colour)
+        self.surfaces[key] = surface
+
+        # drops the least recently used string
+        if len(self.surfaces) > self.maxSurfaces:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def typed(self, font: Any, text: str, antialias: bool, colour: Any) -> "TypedText":
+        """ Returns 'text' laid out for a typed-out animation
+
+        Parameters:
+            font: GlyphFont | pygame.font.Font
+                The font to render with
+
+            text: str
+                The whole message
+
+            antialias: bool
+                Whether the text is antialiased
+
+            colour: Any
+                The colour of the text
+
+        Return => TypedText: the message
+        """
+        key = (font, text, antialias, tuple(colour))
+        typedText = self.typedTexts.get(key)
+
+        if typedText is not None:
+            self.typedTexts.move_to_end(key)
+            return typedText
+
+        typedText = TypedText(font, text, antialias, colour)
+        self.typedTexts[key] = typedText
+
+        # drops the least recently used message
+        if len(self.typedTexts) > self.maxSurfaces:
+            self.typedTexts.popitem(last=False)
+
+        return typedText
+
+
+class TypedText(object):
+    """ A message that is typed out a letter at a time. The whole message is rendered once, and each prefix is drawn by
+        clipping the rendered message to the width of its letters
+
+    Attributes:
+        surface: pygame.Surface
+            The whole message, rendered
+
+        sizes: list[tuple[int, int]]
+            The width and height of every prefix of the message, indexed by the number of letters in it
+
+    """
+
+    def __init__(self, font: Any, text: str, antialias: bool, colour: Any) -> None:
+        self.surface = font.render(text, antialias, colour)
+
+        # cumulative advances of the letters
+        self.sizes = [font.size("")]
+        for char in text:
+            charWidth, charHeight = font.size(char)
+            width, height = self.sizes[-1]
+            self.sizes.append((width + charWidth, max(height, charHeight)))
+
+    def size(self, letters: int) -> tuple[int, int]:
+        """ Returns the size of the first 'letters' letters of the message
+
+        Parameters:
+            letters: int
+                The number of letters typed so far
+
+        Return => tuple[int, int]: the width and height of the typed letters
+        """
+        return self.sizes[min(letters, len(self.sizes) - 1)]
+
+    def draw(self, letters: int, dest: Any) -> None:
+        """ Draws the first 'letters' letters of the message
+
+        Parameters:
+            letters: int
+                The number of letters typed so far
+
+            dest: Any
+                The position of the top left of the message on the screen
+
+        Return => None
+        """
+        width, height = self.size(letters)
+
+        if width:
+            backend.blit(self.surface, dest, (0, 0, width, height))
+
+
+textCache = TextCache(TEXT_CACHE_SIZE)
+
+
+# Menu widgets ----------------------------------------------------------------
+class Label(object):
+    """ Text with a drop shadow. Every look of the text is rendered and laid out once, when it is added
+
+    Attributes:
+        font: GlyphFont | pygame.font.Font
+            The font of the text
+
+        centerX: float
+            The x position the text is centered on
+
+        y: float
+            The y position of the top of the text
+
+        shadowOffset: int
+            How far down and right of the text its shadow is drawn
+
+        looks: dict[str, tuple[pygame.Surface, pygame.Surface, tuple[float, float]]]
+            The text, shadow and position of every look, keyed by its name
+
+        look: str
+            The name of the look that is drawn
+
+        rect: pygame.Rect
+            The region of the text in its "normal" look
+
+        visible: bool
+            Whether the label is drawn
+
+    """
+
+    def __init__(self, font: Any, text: str, centerX: float, y: float, shadowOffset: int) -> None:
+        self.font = font
+        self.centerX = centerX
+        self.y = y
+        self.shadowOffset = shadowOffset
+        self.looks = {}
+        self.look = "normal"
+        self.visible = True
+
+        self.addLook("normal", text, BLACK, WHITE, False, False)
+        text, shadow, position = self.looks["normal"]
+        self.rect = pygame.Rect(position, text.get_size())
+
+    def addLook(self, name: str, text: str, colour: tuple[int, int, int], shadowColour: tuple[int, int, int],
+                antialias: bool, shadowAntialias: bool) -> None:
+        """ Renders and lays out a look of the label
+
+        Parameters:
+            name: str
+                The name of the look
+
+            text: str
+                The text to show
+
+            colour: tuple[int, int, int]
+                The colour of the text
+
+            shadowColour: tuple[int, int, int]
+                The colour of the shadow
+
+            antialias: bool
+                Whether the text is antialiased
+
+            shadowAntialias: bool
+                Whether the shadow is antialiased
+
+        Return => None
+        """
+        textWidth = self.font.size(text)[0]
+        self.looks[name] = (self.font.render(text, antialias, colour),
+                            self.font.render(text, shadowAntialias, shadowColour),
+                            (self.centerX - textWidth / 2, self.y))
+
+    def handle(self, event: pygame.event.Event) -> None:
+        """ Responds to an input event. Labels do not respond to input
+
+        Parameters:
+            event: pygame.event.Event
+                The event
+
+        Return => None
+        """
+
+    def draw(self) -> None:
+        """ Draws the label in its current look
+
+        Parameters:
+
+
+        Return => None
+        """
+        if not self.visible:
+            return
+
+        text, shadow, (x, y) = self.looks[self.look]
+        backend.blit(shadow, (x + self.shadowOffset, y + self.shadowOffset))
+        backend.blit(text, (x, y))
+
+
+class Button(Label):
+    """ A label that inverts its colours while the mouse is over it and can be clicked
+
+    Attributes:
+        hoverArea: pygame.Rect
+            The region where the mouse makes the button hovered
+
+        hovered: bool
+            Whether the mouse is over 'hoverArea'
+
+        clicked: bool
+            Whether the button was clicked during the events of this frame
+
+    """
+
+    def __init__(self, font: Any, text: str, centerX: float, y: float, shadowOffset: int,
+                 hoverShadowAntialias: bool = True) -> None:
+        super().__init__(font, text, centerX, y, shadowOffset)
+        self.addLook("hover", text, WHITE, BLACK, True, hoverShadowAntialias)
+        self.hoverArea = self.rect
+        self.hovered = False
+        self.clicked = False
+
+    def handle(self, event: pygame.event.Event) -> None:
+        """ Updates the hover state from mouse movement, and records clicks on the button
+
+        Parameters:
+            event: pygame.event.Event
+                The event
+
+        Return => None
+        """
+        if event.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            return
+
+        # the renderer's logical size already maps event positions into the game, unlike 'pygame.mouse.get_pos'
+        mousePos = event.pos if RENDER_BACKEND == "sdl2" else viewport.toGame(event.pos)
+        self.hover(mousePos)
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.visible:
+            self.clicked = self.clicked or self.rect.collidepoint(mousePos)
+
+    def hover(self, mousePos: tuple[int, int]) -> None:
+        """ Updates the hover state from where the mouse is
+
+        Parameters:
+            mousePos: tuple[int, int]
+                The position of the mouse in the game
+
+        Return => None
+        """
+        self.hovered = self.hoverArea.collidepoint(mousePos)
+        self.updateLook()
+
+    def updateLook(self) -> None:
+        """ Picks the look of the button from its state
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.look = "hover" if self.hovered else "normal"
+
+
+class Toggle(Button):
+    """ A button for one of a set of options, which shows another text while its option is selected
+
+    Attributes:
+        selected: bool
+            Whether the option is selected
+
+    """
+
+    def __init__(self, font: Any, text: str, selectedText: str, centerX: float, y: float, shadowOffset: int) -> None:
+        super().__init__(font, text, centerX, y, shadowOffset)
+        self.addLook("selected", selectedText, WHITE, BLACK, False, False)
+        self.selected = False
+
+    def select(self, selected: bool) -> None:
+        """ Selects or deselects the option
+
+        Parameters:
+            selected: bool
+                Whether the option is selected
+
+        Return => None
+        """
+        self.selected = selected
+        self.updateLook()
+
+    def updateLook(self) -> None:
+        """ Picks the look of the toggle - only selection changes how it looks
+
+        Parameters:
+
+
+        Return => None
+        """
+        self.look = "selected" if self.selected else "normal"
+
+
+class WidgetScreen(object):
+    """ The widgets of a menu screen, which are laid out once and then only respond to input events
+
+    Attributes:
+        widgets: list[Label]
+            The widgets, in the order they are drawn
+
+    """
+
+    def __init__(self, widgets: list[Label]) -> None:
+        self.widgets = widgets
+
+    def handle(self, events: list[pygame.event.Event]) -> None:
+        """ Passes the events of this frame to every widget
+
+        Parameters:
+            events: list[pygame.event.Event]
+                The events of this frame
+
+        Return => None
+        """
+        for widget in self.widgets:
+            if isinstance(widget, Button):
+                widget.clicked = False
+
+        for event in events:
+            for widget in self.widgets:
+                widget.handle(event)
+
+    def reset(self) -> None:
+        """ Clears the state of the widgets when the screen is shown, and hovers them from where the mouse already is
+
+        Parameters:
+
+
+        Return => None
+        """
+        mousePos = viewport.toGame(pygame.mouse.get_pos())
+
+        for widget in self.widgets:
+            if isinstance(widget, Button):
+                widget.clicked = False
+                widget.hover(mousePos)
+
+    def draw(self) -> None:
+        """ Draws every visible widget
+
+        Parameters:
+
+
+        Return => None
+        """
+        for widget in self.widgets:
+            widget.draw()
+
+
+# Game icon and caption ----------------------------------------
+icon = assets.load("images/character/running/running2.png")
+backend.setIcon(icon)
+pygame.display.set_caption("Source Code")
+
+# Parallax layers -------------------------------------------------------------
+class ParallaxLayer(object):
+    """ One layer of a scrolling background, which moves at its own rate. The image is converted once and cropped to the
+        rows that have visible pixels. A scrolling layer is baked into a strip of two copies of the image side by side,
+        so wrapping around is a single clipped blit
+
+    Attributes:
+        rate: float
+            How many pixels the layer moves for every pixel of scroll - 0 keeps it still
+
+        y: int
+            The y position of the first visible row of the image on the screen
+
+        width: int
+            The width of the image, after which a scrolling layer repeats
+
+        image: pygame.Surface
+            The cropped image, or the strip of two copies of it for a scrolling layer
+
+        opaque: bool
+            Whether every pixel of the cropped image is opaque, so it has no alpha channel to blend
+
+        fullScreen: bool
+            Whether the layer is opaque and covers the whole screen, so it is drawn as the background of the frame
+
+    """
+
+    def __init__(self, image: pygame.Surface, rate: float) -> None:
+        bounds = image.get_bounding_rect()
+        band = image.subsurface((0, bounds.y, image.get_width(), bounds.height))
+
+        self.rate = rate
+        self.y = bounds.y
+        self.width = image.get_width()
+        self.opaque = isOpaque(band)
+        self.fullScreen = self.opaque and band.get_size() == (WIDTH, HEIGHT)
+
+        if rate:
+            # the copies do not overlap, so taking the maximum onto the empty strip copies them without blending
+            strip = pygame.Surface((self.width * 2, bounds.height), pygame.SRCALPHA)
+            strip.blit(band, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            strip.blit(band, (self.width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.image = assets.normalize(strip)
+
+        # an uncropped image that is already in the right format is used as it is
+        elif band.get_size() == image.get_size() and not (self.opaque and image.get_flags() & pygame.SRCALPHA):
+            self.image = image
+
+        else:
+            self.image = assets.normalize(band)
+
+    def draw(self, scroll: float) -> None:
+        """ Draws the layer scrolled by 'scroll', and counts the blit in 'frameStats'
+
+        Parameters:
+            scroll: float
+                How far the view has scrolled, i.e. the x position of the camera
+
+        Return => None
+        """
+        if not self.rate:
+            if self.fullScreen:
+                backend.drawBackground(self.image)
+            else:
+                backend.blit(self.image, (0, self.y))
+
+            width, height = self.image.get_size()
+
+        else:
+            # the visible part of the strip starts somewhere in the first copy
+            width, height = min(self.width, WIDTH), self.image.get_height()
+            backend.blit(self.image, (0, self.y), (int(scroll * self.rate) % self.width, 0, width, height))
+
+        frameStats.layerBlits += 1
+        frameStats.layerPixels += width * height
+
+
+# Biome bundles ---------------------------------------------------------------
+class BiomeBundle(object):
+    """ The assets of one biome - its background, platform tiles and enemy sprites.
+        A bundle is loaded when a level first needs it and evicted when the run leaves the biome
+
+    Attributes:
+        name: str
+            The name of the biome
+
+        backgroundPath: str
+            The path of the background image, which is scaled to the size of the screen
+
+        tilePaths: tuple[str, str, str]
+            The paths of the middle, left and right platform tiles
+
+        spritePaths: list[str]
+            The paths of the enemy sprites that spawn in the biome. They are kept in the asset cache while the bundle
+            is loaded
+
+        loaded: bool
+            If the bundle is loaded
+
+        background: pygame.Surface | None
+            The scaled background, or None if the bundle is not loaded
+
+        layers: list[ParallaxLayer]
+            The layers of the background, from the back to the front, or an empty list if the bundle is not loaded
+
+        tile, tileL, tileR: pygame.Surface | None
+            The middle, left and right platform tiles, or None if the bundle is not loaded
+
+        strips: dict[int, pygame.Surface]
+            Platforms baked from the tiles, keyed by their length, so each platform is drawn with a single blit
+
+    """
+
+    def __init__(self, name: str, backgroundPath: str, tilePaths: tuple[str, str, str], spritePaths: list[str]) -> None:
+        self.name = name
+        self.backgroundPath = backgroundPath
+        self.tilePaths = tilePaths
+        self.spritePaths = spritePaths
+        self.loaded = False
+        self.background = None
+        self.layers = []
+        self.tile = None
+        self.tileL = None
+        self.tileR = None
+        self.strips = {}
+
+    def paths(self) -> set[str]:
+        """ Returns the paths of every image of the bundle that is kept in the asset cache
+
+        Parameters:
+
+
+        Return => set[str]: the tile and enemy sprite paths
+        """
+        return set(self.tilePaths) | set(self.spritePaths)
+
+    def load(self) -> "BiomeBundle":
+        """ Loads the bundle if it is not loaded yet
+
+        Parameters:
+
+
+        Return => BiomeBundle: the bundle itself
+        """
+        if self.loaded:
+            return self
+
+        self.background = preloader.loadScaled(self.backgroundPath, (WIDTH, HEIGHT))
+
+        # the backgrounds do not tile, so they stay still behind the level
+        self.layers = [ParallaxLayer(self.background, 0)]
+
+        self.tile, self.tileL, self.tileR = [assets.load(path) for path in self.tilePaths]
+
+        for path in self.spritePaths:
+            assets.load(path)
+
+        self.loaded = True
+        return self
+
+    def evict(self, keep: set[str] = frozenset()) -> None:
+        """ Releases the bundle's images, along with the enemy animation clips that play them. Objects that still
+            hold an image keep it until they are destroyed
+
+        Parameters:
+            keep: set[str]
+                Paths that stay cached because the next biome uses them as well
+
+        Return => None
+        """
+        evicted = self.paths() - keep
+        animations.release(evicted)
+
+        for path in evicted:
+            assets.evict(path)
+
+        self.loaded = False
+        self.background = None
+        self.layers = []
+        self.tile = None
+        self.tileL = None
+        self.tileR = None
+        self.strips = {}
+
+    def platformStrip(self, length: int) -> pygame.Surface:
+        """ Returns a platform of 'length' baked into one surface - the left tile, middle tiles and the right tile.
+            Strips are cached, so every platform of the same length shares one surface
+
+        Parameters:
+            length: int
+                The length of the platform
+
+        Return => pygame.Surface: the baked platform
+        """
+        strip = self.strips.get(length)
 
+        if strip is not None:
+            return strip
 
-# Game icon and caption ----------------------------------------
-icon = pygame.image.load("images/character/running/running2.png")
-pygame.display.set_icon(icon)
-pygame.display.set_caption("Source Code")
+        self.load()
+        offsets = range(0, int(length), 20)
+        height = max(self.tile.get_height(), self.tileL.get_height(), self.tileR.get_height())
+        strip = pygame.Surface((offsets[-1] + 20, height), pygame.SRCALPHA)
 
-# Images not loaded with a class ----------------------------------------------
-backgroundImage = pygame.image.load("images/backgrounds/background.jpg")
-cloudsImage = pygame.image.load("images/backgrounds/clouds.png")
+        for x in offsets:
+            # the first block is the left image, the last block the right image
+            if x == 0:
+                tile = self.tileL
+
+            elif x + 20 >= length:
+                tile = self.tileR
+
+            else:
+                tile = self.tile
+
+            # the tiles do not overlap, so taking the maximum onto the empty strip copies them without blending
+            strip.blit(tile, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
 
-underworldBackgroundImage = pygame.image.load("images/backgrounds/underworld.png")
-iceBackgroundImage = pygame.image.load("images/backgrounds/iceBackground.png")
+        strip = assets.normalize(strip)
+        self.strips[length] = strip
 
-# tile images needed for comparison
-grassTile = pygame.image.load("images/tiles/grassTile/tile.png")
-underworldTile = pygame.image.load("images/tiles/underworldTile/underworldTile.png")
-iceTile = pygame.image.load("images/tiles/iceTile.jpg")
+        return strip
 
-# resizing images
-backgroundImage = pygame.transform.scale(backgroundImage, (WIDTH, HEIGHT))
-cloudsImage = pygame.transform.scale(cloudsImage, (WIDTH, HEIGHT))
-underworldBackgroundImage = pygame.transform.scale(underworldBackgroundImage, (WIDTH, HEIGHT))
-iceBackgroundImage = pygame.transform.scale(iceBackgroundImage, (WIDTH, HEIGHT))
+    def memoryUsage(self) -> int:
+        """ Returns the number of bytes of pixel data held by the bundle, including baked left-facing sprites
 
+        Parameters:
+
+
+        Return => int: the size of the bundle in bytes, or 0 if it is not loaded
+        """
+        if not self.loaded:
+            return 0
+
+        surfaces = [self.background] + [layer.image for layer in self.layers if layer.image is not self.background]
+        surfaces += list(self.strips.values()) + [assets.cached(path) for path in self.paths()]
+        surfaces += [assets.mirrors.get(surface) for surface in surfaces if surface is not None]
+
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize()
+                   for surface in surfaces if surface is not None)
+
+
+# enemy sprites - every biome also spawns the enemies of the biomes before it in its boss level
+NORMAL_ENEMY_SPRITES = (
+    [f"images/enemy/normal/moving/running/running{i}.png" for i in range(1, 4)]
+    + ["images/enemy/normal/moving/hurt/hurt1.png"]
+    + [f"images/enemy/normal/dead/explosion{i}.png" for i in range(1, 11)]
+)
+
+UNDERWORLD_ENEMY_SPRITES = (
+    [f"images/enemy/underworld/moving/running/running{i}.png" for i in range(1, 7)]
+    + ["images/enemy/underworld/moving/hurt/hurt1.png"]
+    + [f"images/enemy/underworld/dead/explosion{i}.png" for i in range(1, 11)]
+)
+
+ICE_ENEMY_SPRITES = (
+    [f"images/enemy/ice/moving/running/running{i}.png" for i in range(1, 7)]
+    + [f"images/enemy/ice/dead/explosion{i}.png" for i in range(1, 11)]
+    + ["images/enemy/ice/weapon/icicle1.png"]
+)
+
+grassBiome = BiomeBundle(
+    "grass", "images/backgrounds/background.jpg",
+    ("images/tiles/grassTile/tile.png", "images/tiles/grassTile/tileL.png", "images/tiles/grassTile/tileR.png"),
+    NORMAL_ENEMY_SPRITES
+)
+
+underworldBiome = BiomeBundle(
+    "underworld", "images/backgrounds/underworld.png",
+    ("images/tiles/underworldTile/underworldTile.png", "images/tiles/underworldTile/underworldTileLeft.png",
+     "images/tiles/underworldTile/underworldTileRight.png"),
+    NORMAL_ENEMY_SPRITES + UNDERWORLD_ENEMY_SPRITES
+)
+
+# the ice tiles have no rounded ends
+iceBiome = BiomeBundle(
+    "ice", "images/backgrounds/iceBackground.png",
+    ("images/tiles/iceTile.jpg", "images/tiles/iceTile.jpg", "images/tiles/iceTile.jpg"),
+    NORMAL_ENEMY_SPRITES + UNDERWORLD_ENEMY_SPRITES + ICE_ENEMY_SPRITES
+)
+
+# starts scaling the full-screen images, then decoding sprites, on worker threads while the rest of the game loads
+for scaledPath in (grassBiome.backgroundPath, "images/backgrounds/clouds.png", "images/backgrounds/paused.png"):
+    preloader.preloadScaled(scaledPath, (WIDTH, HEIGHT))
+
+preloader.preload(sorted(grassBiome.paths()))
+preloader.preloadDirectories(PRELOAD_DIRECTORIES)
+
+# Images not loaded with a class ----------------------------------------------
 # a sized up coin icon for the GUI
-coinIcon = pygame.image.load("images/coin/coinIcon.png")
+coinIcon = assets.load("images/coin/coinIcon.png")
 
 # Bullet GUI images
 bulletGUI = [
-    pygame.image.load(f"images/gui/bullet/bullet{i}.png") for i in range(1, 6)
+    assets.load(f"images/gui/bullet/bullet{i}.png") for i in range(1, 6)
 ]
 
-# menu animation images
-menuBackgroundImage = pygame.image.load("images/backgrounds/background.jpg")
-menuBackgroundImage = pygame.transform.scale(menuBackgroundImage, (WIDTH, HEIGHT))
-
-# paused translucent image
-pausedImage = pygame.image.load("images/backgrounds/paused.png")
-pausedImage = pygame.transform.scale(pausedImage, (WIDTH, HEIGHT))
-pausedImage.set_alpha(128)  # set opacity
-
 # pause button
-pauseButton = pygame.image.load("images/gui/button/pauseButton.png")
-pauseButtonPressed = pygame.image.load("images/gui/button/pauseButtonPressed.png")
+pauseButton = assets.load("images/gui/button/pauseButton.png")
+pauseButtonPressed = assets.load("images/gui/button/pauseButtonPressed.png")
 
 # Sounds ----------------------------------------------------------------------
 # initializing the pygame.mixer module
@@ -188,14 +3332,16 @@ playerDies.set_volume(0.3)
 pygame.mixer.music.load("sounds/soundtrack.mp3")
 
 # Fonts -----------------------------------------------------------------------
-scoreFont = pygame.font.Font("fonts/ScoreFont.ttf", 50)
-scoreFontSmall = pygame.font.Font("fonts/ScoreFont.ttf", 32)
-titleFont = pygame.font.Font("fonts/TitleFontBold.ttf", (120 * WIDTH) // 800)
-subTitleFont = pygame.font.Font("fonts/GravityBold8.ttf", (40 * WIDTH) // 800)
-smallHeadingFont = pygame.font.Font("fonts/GravityBold8.ttf", (16 * WIDTH) // 800)
-playerNameFont = pygame.font.Font("fonts/GravityBold8.ttf", (5 * WIDTH) // 800)
-instructionFont = pygame.font.Font("fonts/GravityRegular5.ttf", (20 * WIDTH) // 800)
-deathMessageFont = pygame.font.Font("fonts/GravityRegular5.ttf", (16 * WIDTH) // 800)
+Font = GlyphFont if GLYPH_FONTS else pygame.font.Font
+
+scoreFont = Font("fonts/ScoreFont.ttf", 50)
+scoreFontSmall = Font("fonts/ScoreFont.ttf", 32)
+titleFont = Font("fonts/TitleFontBold.ttf", (120 * WIDTH) // 800)
+subTitleFont = Font("fonts/GravityBold8.ttf", (40 * WIDTH) // 800)
+smallHeadingFont = Font("fonts/GravityBold8.ttf", (16 * WIDTH) // 800)
+playerNameFont = Font("fonts/GravityBold8.ttf", (5 * WIDTH) // 800)
+instructionFont = Font("fonts/GravityRegular5.ttf", (20 * WIDTH) // 800)
+deathMessageFont = Font("fonts/GravityRegular5.ttf", (16 * WIDTH) // 800)
 
 
 ###############################################################################
@@ -226,56 +3372,35 @@ class Platform(object):
         width: int
             The width of the platform
 
-        image: pygame.Surface
-            The image of the tiled
+        strip: pygame.Surface
+            The platform baked from the tiles of its biome - the left tile is a more 'rounded' verion of the middle
+            tiles, as is the right tile
 
-        imageL: pygame.Surface
-            The left image of the platform - a more 'rounded' verion of the normal 'image'
-            
-        imageR: pygame.Surface
-            The right image of the platform - a more 'rounded' verion of the normal 'image'
+        moves: bool
+            If the platform moves in the world. A class attribute, so things resting on a platform only follow it if
+            it moves
     """
 
-    def __init__(self, x: float, y: float, length: int, image: pygame.Surface = grassTile, width: int = 20) -> None:
+    moves = False
+
+    def __init__(self, x: float, y: float, length: int, biome: BiomeBundle = grassBiome, width: int = 20) -> None:
         self.x = x
         self.y = y
         self.length = length
         self.width = width
-        self.image = image
 
-        # loading the rounded grass images if the tile image is set to the grass type
-        if self.image is grassTile:
-            self.imageL = pygame.image.load("images/tiles/grassTile/tileL.png")
-            self.imageR = pygame.image.load("images/tiles/grassTile/tileR.png")
-            
-        elif self.image is underworldTile:
-            self.imageL = pygame.image.load("images/tiles/underworldTile/underworldTileLeft.png")
-            self.imageR = pygame.image.load("images/tiles/underworldTile/underworldTileRight.png")
-            
-        else:
-            self.imageL = self.image
-            self.imageR = self.image
+        # the platform is baked from the tiles of the biome once per length
+        self.strip = biome.platformStrip(length)
 
     def draw(self) -> None:
-        """ Draws the platform, with square tiles, and using the left and right images if possible
+        """ Draws the platform's baked strip of tiles
 
         Parameters:
 
 
         Return => None
         """
-        for x in range(int(self.x), int(self.x + self.length), 20):
-            # this means that this is the first block - blit 'imageL'
-            if x == int(self.x):
-                gameWindow.blit(self.imageL, (x, self.y))
-
-            # this means that this is the last block - blit 'imageR'
-            elif x + 20 >= int(self.x + self.length):
-                gameWindow.blit(self.imageR, (x, self.y))
-
-            # blit the normal image
-            else:
-                gameWindow.blit(self.image, (x, self.y))
+        spriteBatch.blit(self.strip, (self.x, self.y))
 
 
 class VerticalMovingPlatform(Platform):
@@ -297,8 +3422,8 @@ class VerticalMovingPlatform(Platform):
         speed: float
             The speed at which the platform moves
 
-        image: pygame.Surface
-            The image of the tile
+        strip: pygame.Surface
+            The platform baked from the tiles of its biome
 
         moveDown: bool
             If the platform is moving down - True if moving down, False if moving up
@@ -311,15 +3436,17 @@ class VerticalMovingPlatform(Platform):
 
     """
 
-    def __init__(self, x: float, y: float, length: int, rangeOfMovement: float, speed: float = 0.5, image: pygame.Surface = grassTile) -> None:
-        super().__init__(x, y, length, image)
+    moves = True
+
+    def __init__(self, x: float, y: float, length: int, rangeOfMovement: float, speed: float = 0.5, biome: BiomeBundle = grassBiome) -> None:
+        super().__init__(x, y, length, biome)
         self.upperBound = y - rangeOfMovement
         self.lowerBound = y + rangeOfMovement
         self.moveDown = True
         self.speed = speed
 
     def draw(self) -> None:
-        """ Draws the platform, with square tiles, and using the left and right images if possible.
+        """ Draws the platform's baked strip of tiles.
             Also draws the line of movement in a gray line
 
         Parameters:
@@ -329,22 +3456,11 @@ class VerticalMovingPlatform(Platform):
         """
 
         # draws the line of movement
-        pygame.draw.line(gameWindow, GREY, (self.x + self.length / 2, self.upperBound),
-                         (self.x + self.length / 2, self.lowerBound), 2)
+        backend.drawLine(GREY, (camera.toScreen(self.x + self.length / 2), self.upperBound),
+                         (camera.toScreen(self.x + self.length / 2), self.lowerBound), 2)
 
         # drawing the platform at the correct location
-        for xCoord in range(int(self.x), int(self.x + self.length), 20):
-            # this means that this is the first block - blit 'imageL'
-            if xCoord == int(self.x):
-                gameWindow.blit(self.imageL, (xCoord, self.y))
-
-            # this means that this is the last block - blit 'imageR'
-            elif xCoord == int(self.x + self.length) - 20:
-                gameWindow.blit(self.imageR, (xCoord, self.y))
-
-            # blit the normal image
-            else:
-                gameWindow.blit(self.image, (xCoord, self.y))
+        spriteBatch.blit(self.strip, (self.x, self.y))
 
         # Moving the platform
         if self.moveDown:
@@ -382,8 +3498,8 @@ class HorizontalMovingPlatform(Platform):
         speed: float
             The speed at which the platform moves
 
-        image: pygame.Surface
-            The image of the tile
+        strip: pygame.Surface
+            The platform baked from the tiles of its biome
 
         moveRight: bool
             If the platform is moving right - True if moving right, False if moving left
@@ -396,16 +3512,18 @@ class HorizontalMovingPlatform(Platform):
 
     """
 
-    def __init__(self, x: float, y: float, length: int, rangeOfMovement: float, speed: float = 0.5, image: pygame.Surface = grassTile) -> None:
+    moves = True
+
+    def __init__(self, x: float, y: float, length: int, rangeOfMovement: float, speed: float = 0.5, biome: BiomeBundle = grassBiome) -> None:
         self.upperBound = x - rangeOfMovement
         self.lowerBound = x + rangeOfMovement
         self.rangeOfMovement = rangeOfMovement
         self.moveRight = True
         self.speed = speed
-        super().__init__(x, y, length, image)
+        super().__init__(x, y, length, biome)
 
     def draw(self) -> None:
-        """ Draws the platform, with square tiles, and using the left and right images if possible.
+        """ Draws the platform's baked strip of tiles.
             Also draws the line of movement in a gray line
 
         Parameters:
@@ -414,21 +3532,10 @@ class HorizontalMovingPlatform(Platform):
         Return => None
         """
         # draws the line of movement
-        pygame.draw.line(gameWindow, BLACK, (self.upperBound, self.y + self.width / 2), (self.lowerBound + self.length, self.y + self.width / 2), 2)
+        backend.drawLine(BLACK, (camera.toScreen(self.upperBound), self.y + self.width / 2), (camera.toScreen(self.lowerBound + self.length), self.y + self.width / 2), 2)
 
         # drawing the platform at the correct location
-        for xCoord in range(int(self.x), int(self.x + self.length), 20):
-            # this means that this is the first block - blit 'imageL'
-            if xCoord == int(self.x):
-                gameWindow.blit(self.imageL, (xCoord, self.y))
-
-            # this means that this is the last block - blit 'imageR'
-            elif xCoord == int(self.x + self.length) - 20:
-                gameWindow.blit(self.imageR, (xCoord, self.y))
-
-            # blit the normal image
-            else:
-                gameWindow.blit(self.image, (xCoord, self.y))
+        spriteBatch.blit(self.strip, (self.x, self.y))
 
         # Moving the platform
         if self.moveRight:
@@ -486,10 +3593,16 @@ class Enemy(object):
             A boolean for if the enemy is damaged. If it is, the enemy becomes invincible
 
         isDead: bool
-            A boolean for if the enemy is dead, but not done the explosion death animation yet.
+            A boolean for if the enemy is dead. Dead enemies are deleted, and their explosion is played by 'effects'
+
+        hurt: list[pygame.Surface]
+            List of images for when the enemy is hurt. Changes if 'underworldEnemy' is True
 
-        moving, hurt, dead: list[pygame.Surface]
-            List of images for when the enemy is moving, hurt or dead. Changes if 'underworldEnemy' is True
+        runningClip, deathClip: int
+            The ids of the animation clips played while the enemy moves and once it dies
+
+        spawnTick: int
+            The tick the enemy spawned on, which its running animation is played from
 
         timeHit:
             Time that the enemy was hit - used in collisions and invincibility cooldowns
@@ -509,25 +3622,22 @@ class Enemy(object):
         self.isDead = False
         self.timeHit = 0
 
-        # Animation Images
-        self.moving = [
-            pygame.image.load(f"images/enemy/normal/moving/running/running{i}.png") for i in range(1, 4)
-        ]
+        # Animations
+        self.runningClip = animations.register(
+            tuple(f"images/enemy/normal/moving/running/running{i}.png" for i in range(1, 4)), 15
+        )
 
         self.hurt = [
-            pygame.image.load("images/enemy/normal/moving/hurt/hurt1.png"),
+            assets.load("images/enemy/normal/moving/hurt/hurt1.png"),
         ]
 
-        self.dead = [
-            pygame.image.load(f"images/enemy/normal/dead/explosion{i}.png") for i in range(1, 11)
-        ]
+        self.deathClip = animations.register(
+            tuple(f"images/enemy/normal/dead/explosion{i}.png" for i in range(1, 11)), 8, False
+        )
 
         # The current image
-        self.currentImage = self.moving[0]
-
-        # Keeps track of the animation stages
-        self.movingStage = 0
-        self.deadStage = 0
+        self.spawnTick = animations.tick
+        self.currentImage = animations.frame(self.runningClip, self.spawnTick)
 
         # the current time when it takes damage. used for an invincibility delay
         self.damageTime = 0
@@ -545,25 +3655,24 @@ class Enemy(object):
         """
         # if the enemy is hurt, but not dead, draw the enemy hurt image
         if self.damaged and self.health > 0:
-            # flip the image if the enemy is facing left
-            if self.moveLeft:
-                gameWindow.blit(pygame.transform.flip(self.hurt[0], True, False), (self.x - self.enemySizeX / 2, self.y - self.enemySizeY / 2))
-
-            else:
-                gameWindow.blit(self.hurt[0], (self.x - self.enemySizeX / 2, self.y - self.enemySizeY / 2))
+            # uses the left-facing image if the enemy is facing left
+            spriteBatch.blit(assets.facing(self.hurt[0], self.moveLeft), (self.x - self.enemySizeX / 2, self.y - self.enemySizeY / 2))
 
         else:
             # otherwise, blit the normal image
-            gameWindow.blit(self.currentImage, (self.x - self.enemySizeX / 2, self.y - self.enemySizeY / 2))
+            spriteBatch.blit(self.currentImage, (self.x - self.enemySizeX / 2, self.y - self.enemySizeY / 2))
 
-        # draws the health bar if not dead ----------------------------------------------------------------------------
-        if not self.isDead:
-            # draw the border
-            pygame.draw.rect(gameWindow, BLACK, (int(self.x - self.enemySizeX / 2 - 2), int(self.y - self.enemySizeX / 2 - 7), self.enemySizeX + 4, 9), 2, 1)
+    def drawHealthBar(self) -> None:
+        """ Draws the health bar above the enemy if it is not dead
 
-            # draws the health
-            for j in range(self.health // 5):
-                pygame.draw.rect(gameWindow, RED, (int(self.x - self.enemySizeX / 2 + (j * self.enemySizeX // 23)), int(self.y - self.enemySizeX / 2 - 5), self.enemySizeX // 5, 5))
+        Parameters:
+
+
+        Return => None
+        """
+        if not self.isDead:
+            bar, (offsetX, offsetY) = healthBars.enemy(self.health, self.enemySizeX)
+            spriteBatch.blit(bar, (int(self.x - self.enemySizeX / 2) + offsetX, int(self.y - self.enemySizeX / 2) + offsetY))
 
     def move(self) -> None:
         """ Moves the enemy along its platform, and uses the appropriate images
@@ -573,9 +3682,6 @@ class Enemy(object):
 
         Return => None
         """
-        # checks to see if any of the 'animationStage' attributes will cause an error, and resets them to 0
-        self.checkAnimation()
-
         # move the enemy if its not dead ------------------------------------------------------------------------------
         if not self.isDead:
 
@@ -583,13 +3689,13 @@ class Enemy(object):
             if self.moveLeft:
                 self.x -= self.speed
                 # blit a flipped image
-                self.currentImage = pygame.transform.flip(self.moving[int(self.movingStage // 15)], True, False)
+                self.currentImage = assets.mirror(animations.frame(self.runningClip, self.spawnTick))
 
             # if its moving right, add speed ----------------------------------
             else:
                 self.x += self.speed
                 # blit the image
-                self.currentImage = self.moving[int(self.movingStage // 15)]
+                self.currentImage = animations.frame(self.runningClip, self.spawnTick)
 
             # if the enemy has reached the end of the platform, flip its direction
             if self.x < self.platform.x + self.enemySizeX / 4:
@@ -598,27 +3704,6 @@ class Enemy(object):
             if self.x > self.platform.x + self.platform.length - self.enemySizeX / 4:
                 self.moveLeft = True
 
-            # increment animation
-            self.movingStage += 1
-
-        # -------------------------------------------------------------------------------------------------------------
-
-        # The enemy is dead -------------------------------------------------------------------------------------------
-        else:
-            # generate collectible and spawn it at the enemy's x and y coordinate
-            if self.deadStage == 0:
-                collectibles.append(Coin(self.x, self.y))
-
-            # draw the explosion images, flipping horizontally if necessary
-            if self.moveLeft:
-                self.currentImage = pygame.transform.flip(self.dead[int(self.deadStage // 8)], True, False)
-
-            else:
-                self.currentImage = self.dead[int(self.deadStage // 8)]
-
-            # increment 'deadStage'
-            self.deadStage += 1
-
         # -------------------------------------------------------------------------------------------------------------
 
         # if the platform is a vertical moving platform ---------------------------------------------------------------
@@ -657,20 +3742,16 @@ class Enemy(object):
         if self.health <= 0:
             self.isDead = True
 
-    def checkAnimation(self) -> None:
-        """ Checks to see if any of the 'animationStage' attributes will cause an error, and resets them to 0
+    def explode(self) -> None:
+        """ Drops a coin where the enemy died and hands its explosion over to 'effects'
 
         Parameters:
 
 
         Return => None
         """
-
-        if self.movingStage >= len(self.moving) * 15 - 1:
-            self.movingStage = 0
-            
-        if self.deadStage >= len(self.dead) * 8 - 1:
-            self.deadStage = 0
+        collectibles.append(Coin(self.x, self.y))
+        effects.spawn(self.deathClip, self.x - self.enemySizeX / 2, self.y - self.enemySizeY / 2, self.moveLeft)
 
     def takeDamage(self, damage: int) -> None:
         """ If the enemy is alive and the enemy is not invincible, deduct health
@@ -720,16 +3801,13 @@ class UnderworldEnemy(Enemy):
             A boolean for if the enemy is damaged. If it is, the enemy becomes invincible
 
         isDead: bool
-            A boolean for if the enemy is dead, but not done the explosion death animation yet.
-
-        moving: list[pygame.Surface]
-            List of images for when the enemy is moving.
+            A boolean for if the enemy is dead. Dead enemies are deleted, and their explosion is played by 'effects'
 
         hurt: list[pygame.Surface]
             List of images for when the enemy is hurt.
 
-        dead: list[pygame.Surface]
-            List of images for when the enemy is dead.
+        runningClip, deathClip: int
+            The ids of the animation clips played while the enemy moves and once it dies
     """
 
     def __init__(self, platform: Platform, speed: float, health: int = 100) -> None:
@@ -737,20 +3815,19 @@ class UnderworldEnemy(Enemy):
         self.enemySizeX = UNDERWORLD_ENEMY_SIZE_X
         self.enemySizeY = UNDERWORLD_ENEMY_SIZE_Y
 
-        ## lists of images for animation ##
-        self.moving = [
-            pygame.image.load(f"images/enemy/underworld/moving/running/running{i}.png") for i in range(1, 7)
-        ]
+        ## animations ##
+        self.runningClip = animations.register(
+            tuple(f"images/enemy/underworld/moving/running/running{i}.png" for i in range(1, 7)), 15
+        )
 
         self.hurt = [
-            pygame.image.load("images/enemy/underworld/moving/hurt/hurt1.png"),
+            assets.load("images/enemy/underworld/moving/hurt/hurt1.png"),
         ]
 
         # Explosion animations are the same, but scaled up
-        self.dead = [
-            pygame.image.load(f"images/enemy/underworld/dead/explosion{i}.png") for i in range(1, 11)
-
-        ]
+        self.deathClip = animations.register(
+            tuple(f"images/enemy/underworld/dead/explosion{i}.png" for i in range(1, 11)), 8, False
+        )
 
         self.x = platform.x + platform.length / 2
         self.y = platform.y - ENEMY_SIZE_Y / 2
@@ -807,16 +3884,13 @@ class IceEnemy(Enemy):
             A boolean for if the enemy is damaged. If it is, the enemy becomes invincible
 
         isDead: bool
-            A boolean for if the enemy is dead, but not done the explosion death animation yet.
-
-        moving: list[pygame.Surface]
-            List of images for when the enemy is moving.
+            A boolean for if the enemy is dead. Dead enemies are deleted, and their explosion is played by 'effects'
 
         hurt: list[pygame.Surface]
             List of images for when the enemy is hurt.
 
-        dead: list[pygame.Surface]
-            List of images for when the enemy is dead.
+        runningClip, deathClip: int
+            The ids of the animation clips played while the enemy moves and once it dies
 
     """
 
@@ -825,16 +3899,16 @@ class IceEnemy(Enemy):
         self.enemySizeX = ICE_ENEMY_SIZE_X
         self.enemySizeY = ICE_ENEMY_SIZE_Y
 
-        # lists of images for animation
-        self.moving = [
-            pygame.image.load(f"images/enemy/ice/moving/running/running{i}.png") for i in range(1, 7)
-        ]
+        # animations
+        self.runningClip = animations.register(
+            tuple(f"images/enemy/ice/moving/running/running{i}.png" for i in range(1, 7)), 15
+        )
         self.hurt = [
-            pygame.image.load(f"images/enemy/ice/moving/running/running{i}.png") for i in range(1, 2)
-        ]
-        self.dead = [
-            pygame.image.load(f"images/enemy/ice/dead/explosion{i}.png") for i in range(1, 11)
+            assets.load(f"images/enemy/ice/moving/running/running{i}.png") for i in range(1, 2)
         ]
+        self.deathClip = animations.register(
+            tuple(f"images/enemy/ice/dead/explosion{i}.png" for i in range(1, 11)), 8, False
+        )
 
         self.x = platform.x + platform.length / 2
         self.y = platform.y - ENEMY_SIZE_Y / 2
@@ -853,9 +3927,6 @@ class IceEnemy(Enemy):
 
         Return => None
         """
-        # checks to see if any of the 'animationStage' attributes will cause an error, and resets them to 0
-        self.checkAnimation()
-
         # move the enemy if its not dead ------------------------------------------------------------------------------
         if not self.isDead:
 
@@ -863,13 +3934,13 @@ class IceEnemy(Enemy):
             if self.moveLeft:
                 self.x -= self.speed
                 # blit a flipped image
-                self.currentImage = pygame.transform.flip(self.moving[int(self.movingStage // 15)], True, False)
+                self.currentImage = assets.mirror(animations.frame(self.runningClip, self.spawnTick))
 
             # if its moving right, add speed ----------------------------------
             else:
                 self.x += self.speed
                 # blit the image
-                self.currentImage = self.moving[int(self.movingStage // 15)]
+                self.currentImage = animations.frame(self.runningClip, self.spawnTick)
 
             # if the enemy has reached the end of the platform, flip its direction
             if self.x < self.platform.x + self.enemySizeX / 4:
@@ -880,27 +3951,6 @@ class IceEnemy(Enemy):
                 bullets.append(Icicle(self.x + 4, self.y + 5, 5))
                 self.moveLeft = True
 
-            # increment animation
-            self.movingStage += 1
-
-        # -------------------------------------------------------------------------------------------------------------
-
-        # The enemy is dead -------------------------------------------------------------------------------------------
-        else:
-            # generate collectible and spawn it at the enemy's x and y coordinate
-            if self.deadStage == 0:
-                collectibles.append(Coin(self.x, self.y))
-
-            # draw the explosion images, flipping if necessary
-            if self.moveLeft:
-                self.currentImage = pygame.transform.flip(self.dead[int(self.deadStage // 8)], True, False)
-
-            else:
-                self.currentImage = self.dead[int(self.deadStage // 8)]
-
-            # increments 'deadStage'
-            self.deadStage += 1
-
         # -------------------------------------------------------------------------------------------------------------
 
         # if the platform is a vertical moving platform ---------------------------------------------------------------
@@ -953,7 +4003,10 @@ class Gun(object):
             The damage done per bullet
 
         name: str
-            The name of the weapon in a string
+            The name of the weapon in a string. A class attribute, so it can be shown without constructing the gun
+
+        iconPath: str
+            The path of the weapon's icon. A class attribute, so the icon can be shown without constructing the gun
 
         icon: pygame.Surface
             The icon of the weapon when a chest is opened
@@ -972,11 +4025,13 @@ class Gun(object):
 
     """
 
+    name = "Gun"
+    iconPath = "images/weaponIcons/default/pistol.png"
+
     def __init__(self, fireRate: float, damage: int, clipSize: int = 1) -> None:
         self.fireRate = fireRate
         self.damage = damage
-        self.name = "Gun"
-        self.icon = pygame.image.load("images/weaponIcons/default/pistol.png")
+        self.icon = assets.load(self.iconPath)
         self.timeSinceFire = 0
         self.clipSize = clipSize
         self.bulletsInMagazine = self.clipSize
@@ -1026,12 +4081,13 @@ class Pistol(Gun):
 
     """
 
+    name = "Pistol"
+    iconPath = "images/weaponIcons/default/pistol.png"
+
     def __init__(self) -> None:
         super().__init__(PISTOL_FIRE_RATE, PISTOL_DAMAGE)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/pistol.png")
-        self.name = "Pistol"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1091,12 +4147,13 @@ class AssaultRifle(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Assault Rifle"
+    iconPath = "images/weaponIcons/default/assaultRifle.png"
+
     def __init__(self) -> None:
         super().__init__(ASSAULT_RIFLE_FIRE_RATE, ASSAULT_RIFLE_DAMAGE)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/assaultRifle.png")
-        self.name = "Assault Rifle"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1153,13 +4210,14 @@ class SubMachineGun(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Sub-Machine Gun"
+    iconPath = "images/weaponIcons/default/submachineGun.png"
+
     def __init__(self) -> None:
         super().__init__(7, 18, 30)
         self.canFire = True
         self.reloadTime = 0.03
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/submachineGun.png")
-        self.name = "Sub-Machine Gun"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1222,12 +4280,13 @@ class MachineGun(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Machine Gun"
+    iconPath = "images/weaponIcons/default/machineGun.png"
+
     def __init__(self) -> None:
         super().__init__(MACHINE_GUN_FIRE_RATE, MACHINE_GUN_DAMAGE)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/machineGun.png")
-        self.name = "Machine Gun"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1292,12 +4351,13 @@ class Shotgun(Gun):
 
     """
 
+    name = "Shotgun"
+    iconPath = "images/weaponIcons/default/shotgun.png"
+
     def __init__(self) -> None:
         super().__init__(SHOTGUN_FIRE_RATE, SHOTGUN_DAMAGE)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/shotgun.png")
-        self.name = "Shotgun"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1357,12 +4417,13 @@ class SniperRifle(Gun):
 
     """
 
+    name = "Sniper Rifle"
+    iconPath = "images/weaponIcons/default/sniper.png"
+
     def __init__(self) -> None:
         super().__init__(SNIPER_FIRE_RATE, SNIPER_DAMAGE)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/sniper.png")
-        self.name = "Sniper Rifle"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1420,12 +4481,13 @@ class GrenadeLauncher(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Grenade Launcher"
+    iconPath = "images/weaponIcons/default/grenadeLauncher.png"
+
     def __init__(self) -> None:
         super().__init__(GRENADE_LAUNCHER_FIRE_RATE, GRENADE_LAUNCHER_DAMAGE)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/grenadeLauncher.png")
-        self.name = "Grenade Launcher"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1486,13 +4548,14 @@ class MissileLauncher(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Missile Launcher"
+    iconPath = "images/weaponIcons/default/missileLauncher.png"
+
     def __init__(self) -> None:
         super().__init__(7.5, 160, 4)
         self.reloadTime = 0.5
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/default/missileLauncher.png")
-        self.name = "Missile Launcher"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1558,13 +4621,14 @@ class FlameThrower(Gun):
 
     """
 
+    name = "Flamethrower"
+    iconPath = "images/weaponIcons/default/flameThrower.png"
+
     def __init__(self) -> None:
         super().__init__(0.015, 15)
         self.canFire = True
         self.timeSinceFire = 0
         self.clipSize = 100
-        self.icon = pygame.image.load("images/weaponIcons/default/flameThrower.png")
-        self.name = "Flamethrower"
         self.flameStage = 0
         self.playSound = True
 
@@ -1634,13 +4698,14 @@ class PlasmaCannon(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Plasma Cannon"
+    iconPath = "images/weaponIcons/laser/plasmaCannon.png"
+
     def __init__(self) -> None:
         super().__init__(6.5, 600, 4)
         self.reloadTime = 0.5
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/laser/plasmaCannon.png")
-        self.name = "Plasma Cannon"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1704,12 +4769,13 @@ class LaserPistol(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Laser Pistol"
+    iconPath = "images/weaponIcons/laser/pistol.png"
+
     def __init__(self) -> None:
         super().__init__(1.5, 60)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/laser/pistol.png")
-        self.name = "Laser Pistol"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1768,12 +4834,13 @@ class LaserAssaultRifle(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Laser Assault Rifle"
+    iconPath = "images/weaponIcons/laser/assaultRifle.png"
+
     def __init__(self) -> None:
         super().__init__(0.4, 35)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/laser/assaultRifle.png")
-        self.name = "Laser Assault Rifle"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1831,12 +4898,13 @@ class LaserMachineGun(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Laser Machine Gun"
+    iconPath = "images/weaponIcons/laser/machineGun.png"
+
     def __init__(self) -> None:
         super().__init__(0.1, 20)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/laser/machineGun.png")
-        self.name = "Laser Machine Gun"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1894,12 +4962,13 @@ class LaserShotgun(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Laser Shotgun"
+    iconPath = "images/weaponIcons/laser/shotgun.png"
+
     def __init__(self) -> None:
         super().__init__(3.5, 450)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/laser/shotgun.png")
-        self.name = "Laser Shotgun"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -1957,12 +5026,13 @@ class LaserSniperRifle(Gun):
             The time of the shot being fired. Used for the fire rate of the weapon
     """
 
+    name = "Laser Sniper Rifle"
+    iconPath = "images/weaponIcons/laser/sniperRifle.png"
+
     def __init__(self) -> None:
         super().__init__(5, 320)
         self.canFire = True
         self.timeSinceFire = 0
-        self.icon = pygame.image.load("images/weaponIcons/laser/sniperRifle.png")
-        self.name = "Laser Sniper Rifle"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -2021,11 +5091,12 @@ class LaserCannon(Gun):
 
     """
 
+    name = "Laser Cannon"
+    iconPath = "images/weaponIcons/laser/cannon.png"
+
     def __init__(self) -> None:
         super().__init__(4, 240)
         self.canFire = True
-        self.icon = pygame.image.load("images/weaponIcons/laser/cannon.png")
-        self.name = "Laser Cannon"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -2047,7 +5118,7 @@ class LaserCannon(Gun):
             laserFiredSound.play()
 
             # appends bullet to list
-            bullets.append(LaserBeam(x - 4, y - 10, facingLeft, self.damage, int(x - 10)))
+            bullets.append(LaserBeam(x - 4, y - 10, facingLeft, self.damage, int(camera.toScreen(x) - 10)))
 
             # records time of shot
             self.timeSinceFire = timeElapsed
@@ -2084,11 +5155,12 @@ class LightningStaff(Gun):
 
     """
 
+    name = "Lightning Staff"
+    iconPath = "images/weaponIcons/staff/lightningStaff.png"
+
     def __init__(self) -> None:
         super().__init__(4.5, 40)
         self.canFire = True
-        self.icon = pygame.image.load("images/weaponIcons/staff/lightningStaff.png")
-        self.name = "Lightning Staff"
 
     def fire(self, x: float, y: float, facingLeft: bool) -> None:
         """ 'Fires' the gun, appending bullet to the 'bullets' list
@@ -2121,6 +5193,44 @@ class LightningStaff(Gun):
             self.bulletsInMagazine = self.clipSize
 
 
+class WeaponDescriptor(object):
+    """ A lightweight entry of the weapon registry. It shows a weapon's name and icon without constructing the gun,
+        which only happens when the weapon is equipped
+
+    Attributes:
+        weaponClass: type[Gun]
+            The class of the weapon
+
+        tier: str
+            The tier of the weapon in the 'weapons' registry - "default", "laser" or "misc"
+
+    """
+
+    def __init__(self, weaponClass: type, tier: str) -> None:
+        self.weaponClass = weaponClass
+        self.tier = tier
+
+    @property
+    def name(self) -> str:
+        """ The name of the weapon """
+        return self.weaponClass.name
+
+    @property
+    def icon(self) -> pygame.Surface:
+        """ The icon of the weapon, shared through the asset cache """
+        return assets.load(self.weaponClass.iconPath)
+
+    def create(self) -> Gun:
+        """ Constructs the weapon
+
+        Parameters:
+
+
+        Return => Gun: a new instance of the weapon
+        """
+        return self.weaponClass()
+
+
 #################################################################
 #                                                               #
 # Projectiles                                                   #
@@ -2167,6 +5277,16 @@ class Projectile(object):
         else:
             self.x += self.speedX
 
+    def draw(self) -> None:
+        """ Draws the projectile. Projectiles whose images are played by 'effects' have nothing to draw
+
+        Parameters:
+
+
+        Return => None
+        """
+        pass
+
 
 class Bullet(Projectile):
     """ A class representing a bullet, which travels across the screen
@@ -2197,7 +5317,7 @@ class Bullet(Projectile):
     def __init__(self, x: float, y: float, speedX: float, movingLeft: bool, damage: int) -> None:
         super().__init__(x, y, speedX, movingLeft, damage)
         self.hitbox = pygame.Rect(self.x, self.y, 10, 8)
-        self.image = pygame.image.load("images/character/bullet/bullet.png")
+        self.image = assets.load("images/character/bullet/bullet.png")
 
     def move(self) -> None:
         """ Moves the projectile depending on if the projectile is moving left or right.
@@ -2227,11 +5347,7 @@ class Bullet(Projectile):
         Return => None
         """
         # draws the bullet left or right depending on the 'movingLeft' boolean
-        if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.image, True, False), (self.x, self.y))
-
-        else:
-            gameWindow.blit(self.image, (self.x, self.y))
+        spriteBatch.blit(assets.facing(self.image, self.movingLeft), (self.x, self.y))
 
 
 class ShotgunBullet(Projectile):
@@ -2250,11 +5366,11 @@ class ShotgunBullet(Projectile):
         hitbox: pygame.Surface
             The hitbox of the shotgun bullet
 
-        muzzleFlash: list[pygame.Surface]
-            The animation images of the shotgun bullet
+        muzzleFlashClip: int
+            The id of the animation clip of the muzzle flash, played by 'effects'
 
-        muzzleFlashStage: int
-            Keeps track of which image in 'muzzleFlash' is being drawn
+        lifetime: int
+            The number of frames left before the blast stops doing damage
 
         damage: int
             The damage caused upon collision of a projectile
@@ -2262,44 +5378,30 @@ class ShotgunBullet(Projectile):
 
     def __init__(self, x: float, y: float, movingLeft: bool, damage: int) -> None:
         super().__init__(x, y, 0, movingLeft, damage)
-        self.muzzleFlash = [
-            pygame.image.load(f"images/character/shotgun/shotgunMuzzle{i}.png") for i in range(1, 6)
-        ]
-        self.muzzleFlashStage = 0
-        self.currentImage = self.muzzleFlash[0]
-        self.hitbox = pygame.Rect((self.x, self.y - 10, 50, 50))
-
-    def draw(self) -> None:
-        """ Draws the bullet and bullet animation at the x and y positions
-
-        Parameters:
-
-
-        Return => None
-        """
-        # resets animation if 'muzzleFlashStage' will cause an error
-        if self.muzzleFlashStage >= len(self.muzzleFlash) * 2 - 1:
-            self.muzzleFlashStage = 0
-
-        # Sets the rotation for the image based on if the player if facing left
-        self.currentImage = self.muzzleFlash[int(self.muzzleFlashStage // 2)]
+        self.muzzleFlashClip = animations.register(
+            tuple(f"images/character/shotgun/shotgunMuzzle{i}.png" for i in range(1, 6)), 2, False
+        )
+        self.lifetime = len(animations.clips[self.muzzleFlashClip].table) - 1
 
-        # blits image depending on which way the player is facing
+        # Builds the hit box depending on the player's direction
         if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.currentImage, True, False), (self.x - 45, self.y - 10))
+            self.hitbox = pygame.Rect(self.x - 85, self.y - 10, 50, 50)
 
         else:
-            gameWindow.blit(self.currentImage, (self.x, self.y - 10))
+            self.hitbox = pygame.Rect(self.x, self.y - 10, 50, 50)
 
-        # increments animation stage
-        self.muzzleFlashStage += 1
+        # the flash plays on its own, so the bullet only stays in 'bullets' while it does damage
+        effects.spawn(self.muzzleFlashClip, self.x - 45 if self.movingLeft else self.x, self.y - 10, self.movingLeft)
 
-        # Rebuilds hit box depending on the player's direction
-        if self.movingLeft:
-            self.hitbox = pygame.Rect(self.x - 85, self.y - 10, 50, 50)
+    def move(self) -> None:
+        """ Counts down the frames the blast does damage for
 
-        else:
-            self.hitbox = pygame.Rect(self.x, self.y - 10, 50, 50)
+        Parameters:
+
+
+        Return => None
+        """
+        self.lifetime -= 1
 
 
 class Flame(Projectile):
@@ -2319,14 +5421,11 @@ class Flame(Projectile):
         hitbox: pygame.Surface
             The hitbox of the shotgun bullet
 
-        flameImages: list[pygame.Surface]
-            The animation images of the shotgun bullet
-
-        flameImageStage: int
-            Keeps track of which image in 'muzzleFlash' is being drawn
+        flameClip: int
+            The id of the animation clip of the flame image, shown by 'effects' for a single tick
 
         fired: bool
-            If the weapon is fired, as there is a closing animation when the weapon is no longer fired
+            True until the flame has been moved, as the flame is only there for the frame it is fired in
 
         damage: int
             The damage caused upon collision of a projectile
@@ -2334,37 +5433,27 @@ class Flame(Projectile):
 
     def __init__(self, x: float, y: float, movingLeft: bool, damage: int, stage: int = 0) -> None:
         super().__init__(x, y, 0, movingLeft, damage)
-        self.flameImages = [pygame.image.load(f"images/character/flamethrower/flame{i}.png") for i in range(1, 4)]
-        self.flameImageStage = stage
-        self.currentImage = self.flameImages[self.flameImageStage]
+        self.flameClip = animations.register((f"images/character/flamethrower/flame{stage + 1}.png",), 1, False)
         self.fired = True
-        self.hitbox = pygame.Rect((self.x, self.y - 10, 50, 50))
-
-    def draw(self) -> None:
-        """ Draws the flame and flame animation at the x and y positions
-
-        Parameters:
-
 
-        Return => None
-        """
-        # Sets the rotation for the image based on if the player if facing left
-        self.currentImage = self.flameImages[int(self.flameImageStage)]
-
-        # blits image depending on which way the player is facing
-        if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.currentImage, True, False), (self.x - 110, self.y - 18))
-
-        else:
-            gameWindow.blit(self.currentImage, (self.x - 10, self.y - 18))
-
-        # Rebuilds hit box depending on the player's direction
+        # Builds the hit box depending on the player's direction
         if self.movingLeft:
             self.hitbox = pygame.Rect(self.x - 85, self.y - 10, 50, 50)
 
         else:
             self.hitbox = pygame.Rect(self.x, self.y - 10, 50, 50)
 
+        # the flame image is shown for the one frame the flame is fired in
+        effects.spawn(self.flameClip, self.x - 110 if self.movingLeft else self.x - 10, self.y - 18, self.movingLeft)
+
+    def move(self) -> None:
+        """ Marks the flame as moved, so it is removed once its collisions are checked
+
+        Parameters:
+
+
+        Return => None
+        """
         self.fired = False
 
 
@@ -2397,7 +5486,7 @@ class LaserBullet(Projectile):
     def __init__(self, x: float, y: float, speedX: float, movingLeft: bool, damage: int) -> None:
         super().__init__(x, y, speedX, movingLeft, damage)
         self.hitbox = pygame.Rect(self.x, self.y, 25, 8)
-        self.image = pygame.image.load("images/character/laser/laser.png")
+        self.image = assets.load("images/character/laser/laser.png")
 
     def move(self) -> None:
         """ Moves the projectile depending on if the projectile is moving left or right.
@@ -2420,11 +5509,7 @@ class LaserBullet(Projectile):
 
     def draw(self) -> None:
         # draws the bullet left or right depending on the 'movingLeft' boolean
-        if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.image, True, False), (self.x, self.y))
-
-        else:
-            gameWindow.blit(self.image, (self.x, self.y))
+        spriteBatch.blit(assets.facing(self.image, self.movingLeft), (self.x, self.y))
 
 
 class LaserBeam(Projectile):
@@ -2446,24 +5531,36 @@ class LaserBeam(Projectile):
         hitbox: pygame.Surface
             The hitbox of the laser
 
-        images: pygame.Surface
-            The image of the laser
+        images: tuple[pygame.Surface, ...]
+            The animation images of the laser, scaled to the length of the beam rounded up to 'LASER_BEAM_WIDTH_STEP'
+            and shared through 'laserBeamFrames'
 
         damage: int
             The damage caused upon collision of a projectile
 
         offset: int
             The starting point of the beam, used to scale the image appropriately
+
+        length: int
+            The length of the beam that is drawn. The rest of the images is clipped off its far end
     """
 
     def __init__(self, x: float, y: float, movingLeft: bool, damage: int, offset: int) -> None:
         super().__init__(x, y, 0, movingLeft, damage)
         self.hitbox = pygame.Rect(self.x, self.y + 6, WIDTH, 20)
         self.loopsSinceFire = 0
-        self.images = [pygame.image.load(f"images/character/laser/cannonLaser/cannonLaser{i}.png") for i in range(1, 7)]
         self.offset = offset
-        for i in range(len(self.images)):
-            self.images[i] = pygame.transform.scale(self.images[i], (WIDTH - self.offset + 10, 32))
+        self.length = WIDTH - self.offset + 10
+
+        # the camera scrolls every frame, so the exact length rarely repeats
+        width = -(-self.length // LASER_BEAM_WIDTH_STEP) * LASER_BEAM_WIDTH_STEP
+        self.images = laserBeamFrames.get(
+            tuple(f"images/character/laser/cannonLaser/cannonLaser{i}.png" for i in range(1, 7)), (width, 32)
+        )
+
+        # bakes the left-facing frames once, instead of flipping them every frame
+        for image in self.images:
+            assets.mirror(image)
 
     def move(self) -> None:
         """ Rebuilds the hitbox of the laser beam and increments 'loopsSinceFire'
@@ -2490,17 +5587,14 @@ class LaserBeam(Projectile):
 
         Return => None
         """
-        # draws the beam left or right depending on the 'movingLeft' boolean
+        image = self.images[min(self.loopsSinceFire // 5, len(self.images) - 1)]
+
+        # draws the beam left or right depending on the 'movingLeft' boolean, clipping off its far end
         if self.movingLeft:
-            if self.loopsSinceFire < len(self.images) * 5 - 1:
-                gameWindow.blit(pygame.transform.flip(self.images[self.loopsSinceFire // 5], True, False), (self.x - (WIDTH - self.offset + 10), self.y))
-            else:
-                gameWindow.blit(pygame.transform.flip(self.images[len(self.images) - 1], True, False), (self.x - (WIDTH - self.offset + 10), self.y))
+            area = (image.get_width() - self.length, 0, self.length, image.get_height())
+            spriteBatch.blit(assets.mirror(image), (self.x - self.length, self.y), area)
         else:
-            if self.loopsSinceFire < len(self.images) * 5 - 1:
-                gameWindow.blit(self.images[self.loopsSinceFire // 5], (self.x, self.y))
-            else:
-                gameWindow.blit(self.images[len(self.images) - 1], (self.x, self.y))
+            spriteBatch.blit(image, (self.x, self.y), (0, 0, self.length, image.get_height()))
 
 
 class LaserShotgunBullet(Projectile):
@@ -2522,11 +5616,11 @@ class LaserShotgunBullet(Projectile):
         hitbox: pygame.Surface
             The hitbox of the shotgun bullet
 
-        muzzleFlash: list[pygame.Surface]
-            The animation images of the shotgun bullet
+        muzzleFlashClip: int
+            The id of the animation clip of the muzzle flash, played by 'effects'
 
-        muzzleFlashStage: int
-            Keeps track of which image in 'muzzleFlash' is being drawn
+        lifetime: int
+            The number of frames left before the blast stops doing damage
 
         damage: int
             The damage caused upon collision of a projectile
@@ -2534,41 +5628,30 @@ class LaserShotgunBullet(Projectile):
 
     def __init__(self, x: float, y: float, speedX: float, movingLeft: bool, damage: int) -> None:
         super().__init__(x, y, speedX, movingLeft, damage)
-        self.muzzleFlash = [
-            pygame.image.load(f"images/character/laser/shotgun/shotgunMuzzle{i}.png") for i in range(1, 6)
-        ]
-        self.muzzleFlashStage = 0
-        self.currentImage = self.muzzleFlash[0]
-        self.hitbox = pygame.Rect((self.x, self.y - 10, 50, 50))
+        self.muzzleFlashClip = animations.register(
+            tuple(f"images/character/laser/shotgun/shotgunMuzzle{i}.png" for i in range(1, 6)), 2, False
+        )
+        self.lifetime = len(animations.clips[self.muzzleFlashClip].table) - 1
 
-    def draw(self) -> None:
-        """ Draws the bullet at the x and y positions
+        # Builds the hit box depending on the player's direction
+        if self.movingLeft:
+            self.hitbox = pygame.Rect(self.x - 85, self.y - 10, 50, 50)
+        else:
+            self.hitbox = pygame.Rect(self.x, self.y - 10, 50, 50)
+
+        # the flash plays on its own, so the bullet only stays in 'bullets' while it does damage
+        effects.spawn(self.muzzleFlashClip, self.x - 45 if self.movingLeft else self.x, self.y - 10, self.movingLeft)
+
+    def move(self) -> None:
+        """ Moves the bullet and counts down the frames the blast does damage for
 
         Parameters:
 
 
         Return => None
         """
-        # draws the bullet left or right depending on the 'movingLeft' boolean
-        if self.muzzleFlashStage >= len(self.muzzleFlash) * 2 - 1:
-            self.muzzleFlashStage = 0
-
-        # Sets the rotation for the image based on if the player if facing left
-        self.currentImage = self.muzzleFlash[int(self.muzzleFlashStage // 2)]
-
-        if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.currentImage, True, False), (self.x - 45, self.y - 10))
-        else:
-            gameWindow.blit(self.currentImage, (self.x, self.y - 10))
-
-        # increments animation stage
-        self.muzzleFlashStage += 1
-
-        # Rebuilds hit box depending on the player's direction
-        if self.movingLeft:
-            self.hitbox = pygame.Rect(self.x - 85, self.y - 10, 50, 50)
-        else:
-            self.hitbox = pygame.Rect(self.x, self.y - 10, 50, 50)
+        super().move()
+        self.lifetime -= 1
 
 
 class Grenade(Projectile):
@@ -2599,11 +5682,8 @@ class Grenade(Projectile):
         image: pygame.Surface
             The image of the grenade
 
-        explosionAnimation: list[pygame.Surface]
-            The animation images of the grenade explosion
-
-        explosionAnimationStage: int
-            The current animation image of the grenade explosion
+        explosionClip: int
+            The id of the animation clip of the grenade explosion, played by 'effects'
 
         currentImage: pygame.Surface
             The current image to be blitted
@@ -2626,11 +5706,10 @@ class Grenade(Projectile):
         self.accelerationY = accelerationY
         self.hitbox = pygame.Rect(self.x - 10, self.y - 10, 26, 32)
         self.explosionHitbox = pygame.Rect(self.x - 20, self.y - 50, 66, 72)
-        self.image = pygame.image.load("images/character/grenade/grenade.png")
-        self.explosionAnimation = [
-            pygame.image.load(f"images/character/grenade/explosion/explosion{i}.png") for i in range(1, 9)
-        ]
-        self.explosionAnimationStage = 0
+        self.image = assets.load("images/character/grenade/grenade.png")
+        self.explosionClip = animations.register(
+            tuple(f"images/character/grenade/explosion/explosion{i}.png" for i in range(1, 9)), 8, False
+        )
         self.currentImage = self.image
         self.exploded = False
         self.playSound = False
@@ -2644,10 +5723,6 @@ class Grenade(Projectile):
 
         Return => None
         """
-        # resets 'explosionAnimationStage' if the current value will cause an error
-        if self.explosionAnimationStage >= len(self.explosionAnimation) * 8 - 1 and self.exploded:
-            self.explosionAnimationStage = 0
-
         # moves the grenade left or right depending on the 'movingLeft' boolean
         if self.movingLeft:
             self.x -= self.speedX
@@ -2663,19 +5738,6 @@ class Grenade(Projectile):
         self.hitbox = pygame.Rect(self.x, self.y - 20, 26, 32)
         self.explosionHitbox = pygame.Rect(self.x - 20, self.y - 50, 66, 72)
 
-        # Animation
-        if self.exploded:
-            self.currentImage = self.explosionAnimation[int(self.explosionAnimationStage // 8)]
-            self.explosionAnimationStage += 1
-            self.speedX = 0
-            self.speedY = 0
-            self.accelerationY = 0
-            if self.explosionAnimationStage == 1:
-                grenadeExplosion.play()
-
-        else:
-            self.currentImage = self.image
-
     def draw(self):
         """ Draws the bullet at the x and y positions
 
@@ -2684,12 +5746,18 @@ class Grenade(Projectile):
 
         Return => None
         """
-        # draws the grenade left or right depending on the 'movingLeft' boolean
-        if self.exploded:
-            gameWindow.blit(self.currentImage, (self.x, self.y - 50))
+        spriteBatch.blit(self.currentImage, (self.x, self.y))
 
-        else:
-            gameWindow.blit(self.currentImage, (self.x, self.y))
+    def explode(self) -> None:
+        """ Plays the explosion sound and hands the explosion animation over to 'effects'
+
+        Parameters:
+
+
+        Return => None
+        """
+        grenadeExplosion.play()
+        effects.spawn(self.explosionClip, self.x, self.y - 50)
 
 
 class Missile(Grenade):
@@ -2720,11 +5788,8 @@ class Missile(Grenade):
         image: pygame.Surface
             The image of the grenade
 
-        explosionAnimation: list[pygame.Surface]
-            The animation images of the grenade explosion
-
-        explosionAnimationStage: int
-            The current animation image of the grenade explosion
+        explosionClip: int
+            The id of the animation clip of the grenade explosion, played by 'effects'
 
         currentImage: pygame.Surface
             The current image to be blitted
@@ -2744,11 +5809,10 @@ class Missile(Grenade):
         super().__init__(x, y, speedX, 0, 0, movingLeft, damage)
         self.hitbox = pygame.Rect(self.x - 10, self.y - 10, 26, 32)
         self.explosionHitbox = pygame.Rect(self.x - 20, self.y - 50, 66, 72)
-        self.image = pygame.image.load("images/character/missile/missile.png")
-        self.explosionAnimation = [
-            pygame.image.load(f"images/character/grenade/explosion/explosion{i}.png") for i in range(1, 9)
-        ]
-        self.explosionAnimationStage = 0
+        self.image = assets.load("images/character/missile/missile.png")
+        self.explosionClip = animations.register(
+            tuple(f"images/character/grenade/explosion/explosion{i}.png" for i in range(1, 9)), 8, False
+        )
         self.currentImage = self.image
         self.exploded = False
         self.playSound = False
@@ -2762,10 +5826,6 @@ class Missile(Grenade):
 
         Return => None
         """
-        # resets 'explosionAnimationStage' if the current value will cause an error
-        if self.explosionAnimationStage >= len(self.explosionAnimation) * 8 - 1 and self.exploded:
-            self.explosionAnimationStage = 0
-
         # moves the grenade left or right depending on the 'movingLeft' boolean
         if self.movingLeft:
             self.x -= self.speedX
@@ -2781,19 +5841,6 @@ class Missile(Grenade):
         self.hitbox = pygame.Rect(self.x, self.y - 20, 26, 32)
         self.explosionHitbox = pygame.Rect(self.x - 20, self.y - 50, 66, 72)
 
-        # Animation
-        if self.exploded:
-            self.currentImage = self.explosionAnimation[int(self.explosionAnimationStage // 8)]
-            self.explosionAnimationStage += 1
-            self.speedX = 0
-            self.speedY = 0
-            self.accelerationY = 0
-            if self.explosionAnimationStage == 1:
-                grenadeExplosion.play()
-
-        else:
-            self.currentImage = self.image
-
     def draw(self):
         """ Draws the bullet at the x and y positions
 
@@ -2802,15 +5849,8 @@ class Missile(Grenade):
 
         Return => None
         """
-        # draws the grenade left or right depending on the 'movingLeft' boolean
-        if self.exploded:
-            gameWindow.blit(self.currentImage, (self.x, self.y - 50))
-
-        else:
-            if self.movingLeft:
-                gameWindow.blit(pygame.transform.flip(self.currentImage, True, False), (self.x, self.y))
-            else:
-                gameWindow.blit(self.currentImage, (self.x, self.y))
+        # draws the missile left or right depending on the 'movingLeft' boolean
+        spriteBatch.blit(assets.facing(self.currentImage, self.movingLeft), (self.x, self.y))
 
 
 class PlasmaBall(Grenade):
@@ -2838,17 +5878,14 @@ class PlasmaBall(Grenade):
         hitbox: pygame.Surface
             The hitbox of the grenade
 
-        images: list[pygame.Surface]
-            The image of the grenade
-
-        explosionAnimation: list[pygame.Surface]
-            The animation images of the grenade explosion
+        flightClip: int
+            The id of the animation clip of the plasma ball
 
-        explosionAnimationStage: int
-            The current animation image of the grenade explosion
+        explosionClip: int
+            The id of the animation clip of the grenade explosion, played by 'effects'
 
-        imageStage: int
-            The current animtion image of the plasma ball
+        launchTick: int
+            The tick the plasma ball was fired on, which its animation is played from
 
         currentImage: pygame.Surface
             The current image to be blitted
@@ -2868,14 +5905,13 @@ class PlasmaBall(Grenade):
         super().__init__(x, y, speedX, 0, 0, movingLeft, damage)
         self.hitbox = pygame.Rect(self.x - 10, self.y - 10, 26, 32)
         self.explosionHitbox = pygame.Rect(self.x - 20, self.y - 50, 66, 72)
-        self.images = [
-            pygame.image.load(f"images/character/laser/plasma/ball/plasmaBall{i}.png") for i in range(1, 10)
-        ]
-        self.explosionAnimation = [
-            pygame.image.load(f"images/character/laser/plasma/explosion/plasmaExplosion{i}.png") for i in range(1, 8)
-        ]
-        self.imageStage = 0
-        self.explosionAnimationStage = 0
+        self.flightClip = animations.register(
+            tuple(f"images/character/laser/plasma/ball/plasmaBall{i}.png" for i in range(1, 10)), 8
+        )
+        self.explosionClip = animations.register(
+            tuple(f"images/character/laser/plasma/explosion/plasmaExplosion{i}.png" for i in range(1, 8)), 8, False
+        )
+        self.launchTick = animations.tick
         self.currentImage = self.image
         self.exploded = False
         self.playSound = False
@@ -2887,15 +5923,8 @@ class PlasmaBall(Grenade):
         Parameters:
 
 
-        Return => None
-        """
-        # resets 'explosionAnimationStage' if the current value will cause an error
-        if self.explosionAnimationStage >= len(self.explosionAnimation) * 8 - 1 and self.exploded:
-            self.explosionAnimationStage = 0
-
-        if self.imageStage >= len(self.images) * 8 - 1:
-            self.imageStage = 0
-
+        Return => None
+        """
         # moves the grenade left or right depending on the 'movingLeft' boolean
         if self.movingLeft:
             self.x -= self.speedX
@@ -2912,19 +5941,7 @@ class PlasmaBall(Grenade):
         self.explosionHitbox = pygame.Rect(self.x - 10, self.y - 30, 104, 84)
 
         # Animation
-        if self.exploded:
-            self.currentImage = self.explosionAnimation[int(self.explosionAnimationStage // 8)]
-            self.explosionAnimationStage += 1
-            self.speedX = 0
-            self.speedY = 0
-            self.accelerationY = 0
-            if self.explosionAnimationStage == 1:
-                grenadeExplosion.play()
-
-        else:
-            self.currentImage = self.images[int(self.imageStage // 8)]
-            self.imageStage += 1
-            
+        self.currentImage = animations.frame(self.flightClip, self.launchTick)
 
     def draw(self):
         """ Draws the bullet at the x and y positions
@@ -2934,15 +5951,8 @@ class PlasmaBall(Grenade):
 
         Return => None
         """
-        # draws the grenade left or right depending on the 'movingLeft' boolean
-        if self.exploded:
-            gameWindow.blit(self.currentImage, (self.x, self.y - 50))
-
-        else:
-            if self.movingLeft:
-                gameWindow.blit(pygame.transform.flip(self.currentImage, True, False), (self.x, self.y))
-            else:
-                gameWindow.blit(self.currentImage, (self.x, self.y))
+        # draws the plasma ball left or right depending on the 'movingLeft' boolean
+        spriteBatch.blit(assets.facing(self.currentImage, self.movingLeft), (self.x, self.y))
 
 
 
@@ -2960,11 +5970,11 @@ class Lightning(Projectile):
         hitbox: pygame.Surface
             The hitbox of the beam
 
-        explosionAnimation: list[pygame.Surface]
-            The animation images of the beam
+        strikeClip: int
+            The id of the animation clip of the beam, scaled through 'scaledFrames'
 
-        explosionAnimationStage: int
-            The current animation image of the beam
+        strikeTick: int | None
+            The tick the beam struck on, or None if it has not been drawn striking yet
 
         collided: bool
             True if the beam has collided, False otherwise
@@ -2984,12 +5994,12 @@ class Lightning(Projectile):
         super().__init__(x, y, 12, movingLeft, damage)
         self.hitbox = pygame.Rect(self.x - 10, self.y - 10, 26, 32)
         self.explosionHitbox = pygame.Rect(self.x - 20, self.y - 50, 66, 72)
-        self.explosionAnimation = [pygame.image.load(f"images/character/laser/lightning/lightning{i}.png") for i in range(1, 8)]
+        self.strikeClip = animations.register(
+            tuple(f"images/character/laser/lightning/lightning{i}.png" for i in range(1, 8)), 10, False, (64, HEIGHT)
+        )
         self.offset = offset
-        for i in range(len(self.explosionAnimation)):
-            self.explosionAnimation[i] = pygame.transform.scale(self.explosionAnimation[i], (64, HEIGHT))
 
-        self.explosionAnimationStage = 0
+        self.strikeTick = None
         self.collided = False
         self.playSound = False
 
@@ -3002,10 +6012,6 @@ class Lightning(Projectile):
 
         Return => None
         """
-        # resets 'explosionAnimationStage' if the current value will cause an error
-        if self.explosionAnimationStage >= len(self.explosionAnimation) * 10 - 1 and self.collided:
-            self.explosionAnimationStage = 0
-
         # moves the beam left or right depending on the 'movingLeft' boolean
         if self.movingLeft:
             self.x -= self.speedX
@@ -3027,11 +6033,14 @@ class Lightning(Projectile):
         """
         if self.collided:
             self.speedX = 0
-            gameWindow.blit(self.explosionAnimation[int(self.explosionAnimationStage // 10)], (self.x, self.y - HEIGHT + 50))
-            self.explosionAnimationStage += 1
-            if self.explosionAnimationStage == 1:
+
+            # the strike starts the first time it is drawn
+            if self.strikeTick is None:
+                self.strikeTick = animations.tick
                 thunderSound.play()
 
+            spriteBatch.blit(animations.frame(self.strikeClip, self.strikeTick), (self.x, self.y - HEIGHT + 50))
+
 
 class EnemyProjectile(Projectile):
     """ The base class of a projectile fired from an enemy, which always goes left
@@ -3094,7 +6103,7 @@ class Icicle(EnemyProjectile):
     def __init__(self, x, y, speedX) -> None:
         # always going left
         super().__init__(x, y, speedX, 10)
-        self.image = pygame.image.load("images/enemy/ice/weapon/icicle1.png")
+        self.image = assets.load("images/enemy/ice/weapon/icicle1.png")
         self.hitbox = pygame.Rect(self.x, self.y, 16, 10)
 
     def move(self):
@@ -3121,11 +6130,7 @@ class Icicle(EnemyProjectile):
         Return => None
         """
         # draws the bullet left or right depending on the 'movingLeft' boolean
-        if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.image, True, False), (self.x, self.y))
-
-        else:
-            gameWindow.blit(self.image, (self.x, self.y))
+        spriteBatch.blit(assets.facing(self.image, self.movingLeft), (self.x, self.y))
 
 
 class EnemyBullet(EnemyProjectile):
@@ -3151,8 +6156,8 @@ class EnemyBullet(EnemyProjectile):
     def __init__(self, x, y, speedX) -> None:
         # always going left
         super().__init__(x, y, speedX, 10)
-        self.image = pygame.image.load("images/enemy/boss/weapon/bullet.png")
-        self.image = pygame.transform.scale(self.image, (32, 16))
+        self.image = scaledFrames.get(("images/enemy/boss/weapon/bullet.png",), (32, 16))[0]
+        assets.mirror(self.image)
         self.hitbox = pygame.Rect(self.x, self.y, 32, 16)
 
     def move(self):
@@ -3179,11 +6184,7 @@ class EnemyBullet(EnemyProjectile):
         Return => None
         """
         # draws the bullet left or right depending on the 'movingLeft' boolean
-        if self.movingLeft:
-            gameWindow.blit(pygame.transform.flip(self.image, True, False), (self.x, self.y))
-
-        else:
-            gameWindow.blit(self.image, (self.x, self.y))
+        spriteBatch.blit(assets.facing(self.image, self.movingLeft), (self.x, self.y))
 
 
 class EnemyLaser(Projectile):
@@ -3196,8 +6197,8 @@ class EnemyLaser(Projectile):
         hitbox: pygame.Surface
             The hitbox of the beam
 
-        explosionAnimation: list[pygame.Surface]
-            The animation images of the beam
+        explosionAnimation: tuple[pygame.Surface, ...]
+            The animation images of the beam, shared through 'scaledFrames'
 
         explosionAnimationStage: int
             The current animation image of the beam
@@ -3212,7 +6213,7 @@ class EnemyLaser(Projectile):
             The damage caused upon collision of a projectile
 
         end: float
-            the ending position of the laser
+            the ending position of the laser on the screen. The laser keeps moving towards it as the screen scrolls
 
     """
 
@@ -3220,12 +6221,9 @@ class EnemyLaser(Projectile):
         super().__init__(x, HEIGHT, 2, False, damage)
         self.end = end
         self.hitbox = pygame.Rect(self.x - 10, 0, 27, HEIGHT)
-        self.explosionAnimation = [
-            pygame.image.load(f"images/character/laser/lightning/lightning{i}.png") for i in range(1, 6)
-        ]
-
-        for i in range(len(self.explosionAnimation)):
-            self.explosionAnimation[i] = pygame.transform.scale(self.explosionAnimation[i], (27, HEIGHT))
+        self.explosionAnimation = scaledFrames.get(
+            tuple(f"images/character/laser/lightning/lightning{i}.png" for i in range(1, 6)), (27, HEIGHT)
+        )
 
         self.explosionAnimationStage = 0
         self.ended = False
@@ -3248,10 +6246,10 @@ class EnemyLaser(Projectile):
             self.explosionAnimationStage -= 10
 
         # moves the beam left or right depending on the 'movingLeft' boolean
-        if self.x - self.speedX > self.end:
+        if self.x - self.speedX > camera.toWorld(self.end):
             self.x -= self.speedX
 
-        elif self.x + self.speedX < self.end:
+        elif self.x + self.speedX < camera.toWorld(self.end):
             self.x += self.speedX
 
         else:
@@ -3269,7 +6267,7 @@ class EnemyLaser(Projectile):
         Return => None
         """
         # draws the beam left or right depending on the 'movingLeft' boolean
-        gameWindow.blit(self.explosionAnimation[int(self.explosionAnimationStage // 10)], (self.x, self.y - HEIGHT))
+        spriteBatch.blit(self.explosionAnimation[int(self.explosionAnimationStage // 10)], (self.x, self.y - HEIGHT))
 
 
 #################################################################
@@ -3317,11 +6315,14 @@ class Player(object):
         facingLeft: bool
             True if the player is facing left. Used for blitting images the correct way.
 
-        hurt, idle, jumpOrFall, running: list[pygame.Surface]
-            these lists contain the images for the player animations
+        hurt, jumpOrFall: list[pygame.Surface]
+            these lists contain the images for when the player is hurt, jumping or falling
+
+        idleClip, runningClip: int
+            the ids of the animation clips played while the player stands still and while they run
 
-        hurtStage, idleStage, jumpOrFallStage, runningStage: int
-            tracks the animation stage of each of the lists above
+        idleTick, runningTick: int
+            the ticks the player last started standing still and running on, which the clips are played from
 
         currentImage: pygame.Surface
             the current image to be blitted
@@ -3366,35 +6367,32 @@ class Player(object):
         self.currentWeapon = currentWeapon
         self.WASD = WASD
         self.name = name
-        self.nameRender = playerNameFont.render(self.name, False, BLACK)
+        self.nameRender = textCache.render(playerNameFont, self.name, False, BLACK)
         self.timeHit = timeElapsed
 
         # Animation images
         self.hurt = [
-            pygame.image.load("images/character/hurt/hurt1.png"),
+            assets.load("images/character/hurt/hurt1.png"),
         ]
 
-        self.idle = [
-            pygame.image.load(f"images/character/idle/idle{i}.png") for i in range(1, 3)
-        ]
+        # the majority of the idle animation is the first image
+        self.idleClip = animations.register(tuple(f"images/character/idle/idle{i}.png" for i in range(1, 3)), (80, 20))
 
         self.jumpOrFall = [
-            pygame.image.load("images/character/jump/jump.png"),
-            pygame.image.load("images/character/jump/fall.png"),
+            assets.load("images/character/jump/jump.png"),
+            assets.load("images/character/jump/fall.png"),
         ]
 
-        self.running = [
-            pygame.image.load(f"images/character/running/running{i}.png") for i in range(1, 7)
-        ]
+        self.runningClip = animations.register(
+            tuple(f"images/character/running/running{i}.png" for i in range(1, 7)), 10
+        )
 
-        # Current image
-        self.currentImage = self.idle[0]
+        # Tracks when each animation started
+        self.idleTick = animations.tick
+        self.runningTick = animations.tick
 
-        # Tracks the current stage of each animation
-        self.hurtStage = 0
-        self.idleStage = 0
-        self.jumpOrFallStage = 0
-        self.runningStage = 0
+        # Current image
+        self.currentImage = animations.frame(self.idleClip, self.idleTick)
 
         # damage multiplier
         self.damageMultiplier = 1
@@ -3410,13 +6408,10 @@ class Player(object):
 
         Return => None
         """
-        # Checks to see if any current stage of any animations will cause an error and resets them if so
-        self.checkAnimation()
-
         # If 'd' is pressed and the max speed has not exceeded the maximum speed --------------------------------------
         if (keys[pygame.K_d] and self.WASD) or (keys[pygame.K_RIGHT] and not self.WASD):
             # Sets the current image of the player depending on how long 'd' has been pressed
-            self.currentImage = self.running[int(self.runningStage // 10)]
+            self.currentImage = animations.frame(self.runningClip, self.runningTick)
 
             # sets the 'facingLeft' attribute to False
             self.facingLeft = False
@@ -3430,15 +6425,14 @@ class Player(object):
                     # Makes acceleration slower if the player is in the air
                     self.speedX += self.accelerationX / 4
 
-            # Increments the running animation stage and sets the idle stage to 0
-            self.runningStage += 1
-            self.idleStage = 0
+            # Restarts the idle animation, which plays once the player stops
+            self.idleTick = animations.tick
 
         # If 'a' is pressed and the max speed has not exceeded the maximum speed --------------------------------------
         elif (keys[pygame.K_a] and self.WASD) or (keys[pygame.K_LEFT] and not self.WASD):
 
             # Sets the current image of the player depending on how long 'a' has been pressed
-            self.currentImage = pygame.transform.flip(self.running[int(self.runningStage // 10)], True, False)
+            self.currentImage = assets.mirror(animations.frame(self.runningClip, self.runningTick))
 
             # sets the 'facingLeft' attribute to True
             self.facingLeft = True
@@ -3452,17 +6446,19 @@ class Player(object):
                     # Makes acceleration slower if the player is in the air
                     self.speedX -= self.accelerationX / 4
 
-            # Increments the running animation stage and sets the idle stage to 0
-            self.runningStage += 1
-            self.idleStage = 0
+            # Restarts the idle animation, which plays once the player stops
+            self.idleTick = animations.tick
 
 
         # If neither 'a' or 'd' are pressed, slowly decreases/increase speed to 0
         else:
+            # Restarts the running animation, which plays once the player runs again
+            self.runningTick = animations.tick
+
             # decelerate by half of the set accelerationX
             if self.speedX < 0:
                 # if the current level is the ice level, decrease deceleration
-                if level.background is iceBackgroundImage and self.touchingBlock:
+                if level.biome is iceBiome and self.touchingBlock:
                     self.speedX += self.accelerationX / 6
                 else:
                     self.speedX += self.accelerationX / 2
@@ -3470,7 +6466,7 @@ class Player(object):
             # decelerate by half of the set accelerationX
             elif self.speedX > 0:
                 # if the current level is the ice level, decrease deceleration
-                if level.background is iceBackgroundImage and self.touchingBlock:
+                if level.biome is iceBiome and self.touchingBlock:
                     self.speedX -= self.accelerationX / 6
                 else:
                     self.speedX -= self.accelerationX / 2
@@ -3498,28 +6494,11 @@ class Player(object):
 
         # If idle, use the idle imaging facing right ------------------------------------------------------------------
         if 0.25 > self.speedX > -0.25 and 0.25 > self.speedY > -0.25 and not self.facingLeft:
-            # The majority of the 'idle' animation is the first image
-            if self.idleStage < 80:
-                self.currentImage = self.idle[0]
-
-            else:
-                # 1/5 of the idle time is the second image
-                self.currentImage = self.idle[1]
-
-            # Increments 'idleStage'
-            self.idleStage += 1
+            self.currentImage = animations.frame(self.idleClip, self.idleTick)
 
         # If idle, use the idle imaging facing left ------------------------------------------------------------------
         if 0.25 > self.speedX > -0.25 and 0.25 > self.speedY > -0.25 and self.facingLeft:
-            # The majority of the 'idle' animation is the first image
-            if self.idleStage < 80:
-                self.currentImage = pygame.transform.flip(self.idle[0], True, False)
-            else:
-                # 1/5 of the idle time is the second image
-                self.currentImage = pygame.transform.flip(self.idle[1], True, False)
-
-            # Increments 'idleStage'
-            self.idleStage += 1
+            self.currentImage = assets.mirror(animations.frame(self.idleClip, self.idleTick))
 
         # If falling, use the falling image facing right --------------------------------------------------------------
         if self.speedY < 0.1 and not self.touchingBlock and not self.facingLeft:
@@ -3532,21 +6511,17 @@ class Player(object):
 
         # If falling, use the falling image facing left ---------------------------------------------------------------
         if self.speedY < 0 and not self.touchingBlock and self.facingLeft:
-            self.currentImage = pygame.transform.flip(self.jumpOrFall[1], True, False)
+            self.currentImage = assets.mirror(self.jumpOrFall[1])
 
 
         # If jumping, use the jumping image facing right --------------------------------------------------------------
         elif self.speedY > 1.2 and not self.touchingBlock and self.facingLeft:
-            self.currentImage = pygame.transform.flip(self.jumpOrFall[0], True, False)
+            self.currentImage = assets.mirror(self.jumpOrFall[0])
 
         # If invincible, use the 'hurt' image -------------------------------------------------------------------------
         if self.invincible:
-            # flip the image if facing left
-            if self.facingLeft:
-                self.currentImage = pygame.transform.flip(self.hurt[0], True, False)
-
-            else:
-                self.currentImage = self.hurt[0]
+            # uses the left-facing image if facing left
+            self.currentImage = assets.facing(self.hurt[0], self.facingLeft)
 
         # Increase the x and y by the x and y speed
         self.y += self.speedY
@@ -3567,10 +6542,10 @@ class Player(object):
         playerNameTextWidth = playerNameFont.size(self.name)[0]
 
         # blits the name above the player
-        gameWindow.blit(self.nameRender, (self.x - playerNameTextWidth / 2, self.y - PLAYER_SIZE_Y / 2 - 10))
+        backend.blit(self.nameRender, (camera.toScreen(self.x) - playerNameTextWidth / 2, self.y - PLAYER_SIZE_Y / 2 - 10))
 
         # uses 'x' and 'y' as the center
-        gameWindow.blit(self.currentImage, (self.x - PLAYER_SIZE_X / 2, self.y - PLAYER_SIZE_Y / 2))
+        backend.blit(self.currentImage, (camera.toScreen(self.x) - PLAYER_SIZE_X / 2, self.y - PLAYER_SIZE_Y / 2))
 
     def checkCollision(self):
         """ Kills the player if they leave the screen area
@@ -3580,7 +6555,7 @@ class Player(object):
 
         Return => None
         """
-        if WIDTH - PLAYER_SIZE_X / 2 < self.x or self.x < 0:
+        if WIDTH - PLAYER_SIZE_X / 2 < camera.toScreen(self.x) or camera.toScreen(self.x) < 0:
             # Does 10 damages at a time
             self.health -= 10
 
@@ -3647,26 +6622,6 @@ class Player(object):
 
         return False
 
-    def checkAnimation(self):
-        """ Resets the animation stage trackers if they will cause an IndexError
-
-        Parameters:
-
-
-        Return => bool: if the player's has fired the gun
-        """
-        if self.hurtStage >= len(self.hurt):
-            self.hurtStage = 0
-
-        if self.idleStage >= len(self.idle) * 50 - 1:
-            self.idleStage = 0
-
-        if self.jumpOrFallStage >= len(self.jumpOrFall):
-            self.runningStage = 0
-
-        if self.runningStage >= len(self.running) * 10 - 1:
-            self.runningStage = 0
-
     ###################################################################################################################
     #
     # Player Collision methods
@@ -3822,7 +6777,7 @@ class Player(object):
         self.touchingBlock = onGround
 
         # if self.x >= 200:
-        #     moveBackground(1)
+        #     camera.scroll(1)
 
     def checkChestCollision(self, chestToCheck):
         """ Checks if the player has collided with any chests
@@ -3835,27 +6790,27 @@ class Player(object):
         global coinsCollected, timeOpened
 
         # setting colour based on background images
-        colour = BLACK if level.background is iceBackgroundImage else WHITE
+        colour = BLACK if level.biome is iceBiome else WHITE
 
         if chestToCheck.hitbox.colliderect(self.hitbox):
             # Displaying name of weapon if the chest is an instance of 'Chest' ----------------------------------------
             if isinstance(chestToCheck, WeaponChest):
                 chestToCheck.opening = True
-                weaponName = scoreFontSmall.render(chestToCheck.weapon.name, True, colour)
+                weaponName = textCache.render(scoreFontSmall, chestToCheck.weapon.name, True, colour)
                 weaponNameLength = weaponName.get_size()[0]
 
                 # draw the '[s]' if the level is the tutorial level ---------------------------
                 if levelNumber == 0 and not chestToCheck.collected:
-                    pressX = scoreFontSmall.render("[s]/[.]", True, colour)
-                    gameWindow.blit(pressX, ((chestToCheck.platform.x + chestToCheck.platform.length / 2 - 20), chestToCheck.platform.y + 16))
+                    pressX = textCache.render(scoreFontSmall, "[s]/[.]", True, colour)
+                    backend.blit(pressX, ((camera.toScreen(chestToCheck.platform.x) + chestToCheck.platform.length / 2 - 20), chestToCheck.platform.y + 16))
 
                 # blitting name to screen -----------------------------------------------------
                 if not chestToCheck.collected:
-                    gameWindow.blit(weaponName, ((chestToCheck.platform.x + chestToCheck.platform.length / 2) - weaponNameLength / 2, chestToCheck.platform.y - 43))
+                    backend.blit(weaponName, ((camera.toScreen(chestToCheck.platform.x) + chestToCheck.platform.length / 2) - weaponNameLength / 2, chestToCheck.platform.y - 43))
 
                 # picking up the weapon -------------------------------------------------------
                 if (keys[pygame.K_s] and self.WASD) or (keys[pygame.K_PERIOD] and not self.WASD):
-                    self.currentWeapon = chestToCheck.weapon
+                    self.currentWeapon = chestToCheck.takeWeapon()
                     if not chestToCheck.collected:
                         pickupWeapon.play()
                     chestToCheck.collected = True
@@ -3863,9 +6818,9 @@ class Player(object):
             # Displaying name of upgrade if the chest is an instance of 'UpgradeChest' --------------------------------
             if isinstance(chestToCheck, UpgradeChest):
                 if not chestToCheck.opening:
-                    costRender = scoreFontSmall.render(f"{POTION_COST} coins", True, colour)
+                    costRender = textCache.render(scoreFontSmall, f"{POTION_COST} coins", True, colour)
                     costRenderLength = costRender.get_size()[0]
-                    gameWindow.blit(costRender, (chestToCheck.platform.x + chestToCheck.platform.length / 2 - costRenderLength / 2, chestToCheck.platform.y - 48))
+                    backend.blit(costRender, (camera.toScreen(chestToCheck.platform.x) + chestToCheck.platform.length / 2 - costRenderLength / 2, chestToCheck.platform.y - 48))
 
                 if ((keys[pygame.K_s] and self.WASD) or (
                         keys[pygame.K_PERIOD] and not self.WASD)) and not chestToCheck.opening:
@@ -3878,11 +6833,11 @@ class Player(object):
                         notEnoughCoins.play()
 
                 else:
-                    upgradeName = scoreFontSmall.render(chestToCheck.upgrade.name, True, colour)
+                    upgradeName = textCache.render(scoreFontSmall, chestToCheck.upgrade.name, True, colour)
                     upgradeNameLength = upgradeName.get_size()[0]
 
                     if not chestToCheck.collected and chestToCheck.opening:
-                        gameWindow.blit(upgradeName, ((chestToCheck.platform.x + chestToCheck.platform.length / 2) - upgradeNameLength / 2, chestToCheck.platform.y - 48))
+                        backend.blit(upgradeName, ((camera.toScreen(chestToCheck.platform.x) + chestToCheck.platform.length / 2) - upgradeNameLength / 2, chestToCheck.platform.y - 48))
 
                     if ((keys[pygame.K_s] and self.WASD) or (keys[
                                                                  pygame.K_PERIOD] and not self.WASD)) and not chestToCheck.collected and timeElapsed - timeOpened >= 0.25:
@@ -3916,15 +6871,15 @@ class Player(object):
         Return => Level: The newly generated level
         """
         # the colour changes depending on background of the level
-        colour = BLACK if level.background is iceBackgroundImage else WHITE
+        colour = BLACK if level.biome is iceBiome else WHITE
         for portal in portalList:
             # display text if portal and player hitbox collide
             if portal.hitbox.colliderect(self.hitbox):
                 # renders text
-                portalText = scoreFontSmall.render("[s]/[.] Next Level?", True, colour)
+                portalText = textCache.render(scoreFontSmall, "[s]/[.] Next Level?", True, colour)
 
                 # blits text
-                gameWindow.blit(portalText, (portal.platform.x + portal.platform.length / 2 - 96, portal.platform.y - 118))
+                backend.blit(portalText, (camera.toScreen(portal.platform.x) + portal.platform.length / 2 - 96, portal.platform.y - 118))
 
                 # resets level - clears lists, resets positions, etc ------------------------------------------------------
                 if (keys[pygame.K_s] and self.WASD) or (keys[pygame.K_PERIOD] and not self.WASD):
@@ -3978,30 +6933,37 @@ class Coin(Collectible):
         y: float
             The y position of the collectible
 
-        coinImages: list[pygame.Surface]
-            The images for the animation coin
+        coinClip: int
+            The id of the animation clip of the coin
 
-        animationStage: int
-            The current image's index number
+        dropTick: int
+            The tick the coin was dropped on, which its animation is played from
 
         collected: bool
             If the collectible is collected or not
 
+        platform: Platform | None
+            The platform the coin rests on, or None if it is not above a platform
+
         offset: float
             The offset of the coin relative to the left of the platform. Used to move the coin with the platform
 
     """
 
     def __init__(self, x, y) -> None:
-        self.coinImages = [
-            pygame.image.load(f"images/coin/coinStage{i}.png") for i in range(1, 5)
-        ]
-        self.animationStage = 0
+        self.coinClip = animations.register(tuple(f"images/coin/coinStage{i}.png" for i in range(1, 5)), 10)
+        self.dropTick = animations.tick
         super().__init__(x, y)
+        self.platform = None
         for platform in level.platforms:
             if platform.x < self.x < platform.x + platform.length:
+                self.platform = platform
                 self.offset = self.x - platform.x
 
+        # rests the coin on its platform
+        if self.platform is not None:
+            self.y = self.platform.y - 10
+
     def draw(self) -> None:
         """ Draws and animates the collectible at the x and y positions
 
@@ -4010,23 +6972,15 @@ class Coin(Collectible):
 
         Return => None
         """
-        # resets the animation stage if the index will cause an error ---------
-        if self.animationStage >= (len(self.coinImages) * 10) - 1:
-            self.animationStage = 0
-
         # Resets the x and y position - for moving platforms ------------------
-        for platform in level.platforms:
-            if platform.x < self.x < platform.x + platform.length:
-                self.y = platform.y - 10
-                self.x = platform.x + self.offset
+        if self.platform is not None and self.platform.moves:
+            self.y = self.platform.y - 10
+            self.x = self.platform.x + self.offset
 
         # blits the image to the screen ---------------------------------------
-        gameWindow.blit(self.coinImages[int(self.animationStage // 10)],
+        spriteBatch.blit(animations.frame(self.coinClip, self.dropTick),
                         (self.x - COLLECTIBLE_SIZE / 2, self.y - COLLECTIBLE_SIZE / 2))
 
-        # increments animation stage ------------------------------------------
-        self.animationStage += 1
-
     def collect(self) -> None:
         """ Collects the coin and plays a sound
 
@@ -4085,7 +7039,7 @@ class UpgradePotion(Collectible):
                 self.x = platform.x + self.offset
 
         # blits the image to the screen ---------------------------------------
-        gameWindow.blit(self.image, (self.x - COLLECTIBLE_SIZE / 2, self.y - COLLECTIBLE_SIZE / 2))
+        spriteBatch.blit(self.image, (self.x - COLLECTIBLE_SIZE / 2, self.y - COLLECTIBLE_SIZE / 2))
 
     def collect(self):
         """ Collects the potion and plays a sound
@@ -4115,13 +7069,13 @@ class StrengthPotion(UpgradePotion):
     def __init__(self, x: float, y: float, strength: int) -> None:
         self.strength = strength
         if self.strength <= 3:
-            image = pygame.image.load("images/potion/strengthPotion/emptyPotion.png")
+            image = assets.load("images/potion/strengthPotion/emptyPotion.png")
 
         elif self.strength <= 5:
-            image = pygame.image.load("images/potion/strengthPotion/halfPotion.png")
+            image = assets.load("images/potion/strengthPotion/halfPotion.png")
 
         else:
-            image = pygame.image.load("images/potion/strengthPotion/fullPotion.png")
+            image = assets.load("images/potion/strengthPotion/fullPotion.png")
 
         super().__init__(x, y, image, f"+{self.strength}% strength")
 
@@ -4141,13 +7095,13 @@ class HealthPotion(UpgradePotion):
     def __init__(self, x, y, health):
         self.health = health
         if self.health <= 10:
-            image = pygame.image.load("images/potion/healthPotion/emptyPotion.png")
+            image = assets.load("images/potion/healthPotion/emptyPotion.png")
 
         elif self.health <= 20:
-            image = pygame.image.load("images/potion/healthPotion/halfPotion.png")
+            image = assets.load("images/potion/healthPotion/halfPotion.png")
 
         else:
-            image = pygame.image.load("images/potion/healthPotion/fullPotion.png")
+            image = assets.load("images/potion/healthPotion/fullPotion.png")
         super().__init__(x, y, image, f"+{self.health} health")
 
 
@@ -4188,11 +7142,11 @@ class WeaponChest(Chest):
         platform: Platform
             The platform the chest spawns on
 
-        images: list[pygame.Surface]
-            The images for the animated chest opening
+        openClip: int
+            The id of the animation clip of the chest opening
 
-        animationStage: int
-            The current image's index number
+        openTick: int | None
+            The tick the chest started opening on, or None if it has not been opened
 
         currentImage: pygame.Surface
             The current image to be blitted at the correct location
@@ -4200,8 +7154,11 @@ class WeaponChest(Chest):
         hitbox: pygame.Rect
             The hitbox of the chest. If a player is inside this  hitbox, the chest opens
 
-        weapon: Gun
-            The gun the chest holds, which is given to the player if they choose
+        weapon: WeaponDescriptor
+            The weapon the chest holds, which is given to the player if they choose
+
+        gun: Gun | None
+            The gun given to the player, constructed the first time the weapon is picked up
 
         collected: bool
             If the chest is collected or not
@@ -4211,18 +7168,32 @@ class WeaponChest(Chest):
 
     """
 
-    def __init__(self, platform: Platform, weapon: Gun) -> None:
+    def __init__(self, platform: Platform, weapon: WeaponDescriptor) -> None:
         super().__init__(platform)
-        self.images = [
-            pygame.image.load(f"images/chest/weaponChest/chest{i}.png") for i in range(1, 7)
-        ]
-        self.animationStage = 0
-        self.currentImage = self.images[0]
+        self.openClip = animations.register(
+            tuple(f"images/chest/weaponChest/chest{i}.png" for i in range(1, 7)), 8, False
+        )
+        self.openTick = None
+        self.currentImage = animations.clips[self.openClip].frame(0)
         self.hitbox = pygame.Rect((self.platform.x + self.platform.length / 2) - 32, self.platform.y - 43, 64, 64)
         self.weapon = weapon
+        self.gun = None
         self.collected = False
         self.opening = False
 
+    def takeWeapon(self) -> Gun:
+        """ Returns the gun held by the chest, constructing it the first time it is taken
+
+        Parameters:
+
+
+        Return => Gun: the gun held by the chest
+        """
+        if self.gun is None:
+            self.gun = self.weapon.create()
+
+        return self.gun
+
     def draw(self) -> None:
         """ Draws the chest at the middle of the platform. Draws the weapon's icon if the chest is opened
 
@@ -4232,29 +7203,29 @@ class WeaponChest(Chest):
         Return => None
         """
         # draw chest
-        gameWindow.blit(self.currentImage, (self.platform.x + self.platform.length / 2 - 32, self.platform.y - 43))
+        spriteBatch.blit(self.currentImage, (self.platform.x + self.platform.length / 2 - 32, self.platform.y - 43))
 
         # if the chest has not been collected[x] and the chest is finished opening
-        if self.animationStage == len(self.images) * 8 - 1 and not self.collected:
-            gameWindow.blit(self.weapon.icon, (self.platform.x + self.platform.length / 2 - 32, self.platform.y - 43))
+        if self.openTick is not None and animations.finished(self.openClip, self.openTick) and not self.collected:
+            spriteBatch.blit(self.weapon.icon, (self.platform.x + self.platform.length / 2 - 32, self.platform.y - 43))
 
-        # Rebuilds the hitbox
-        self.hitbox = pygame.Rect((self.platform.x + self.platform.length / 2) - 32, self.platform.y - 43, 64, 64)
+        # Rebuilds the hitbox if the platform moved
+        if self.platform.moves:
+            self.hitbox = pygame.Rect((self.platform.x + self.platform.length / 2) - 32, self.platform.y - 43, 64, 64)
 
     def open(self) -> None:
-        """ Sets the current image and increments 'Animation Stage'
+        """ Starts the opening animation the first time it is called, and sets the current image
 
         Parameters:
 
 
         Return => None
         """
-        # sets current image
-        self.currentImage = self.images[int(self.animationStage // 8)]
+        if self.openTick is None:
+            self.openTick = animations.tick
 
-        # increments 'animationStage' if possible
-        if self.animationStage <= len(self.images) * 8 - 2:
-            self.animationStage += 1
+        # sets current image
+        self.currentImage = animations.frame(self.openClip, self.openTick)
 
 
 class UpgradeChest(Chest):
@@ -4264,11 +7235,11 @@ class UpgradeChest(Chest):
         platform: Platform
             The platform the chest spawns on
 
-        images: list[pygame.Surface]
-            The images for the animated chest opening
+        openClip: int
+            The id of the animation clip of the chest opening
 
-        animationStage: int
-            The current image's index number
+        openTick: int | None
+            The tick the chest started opening on, or None if it has not been opened
 
         currentImage: pygame.Surface
             The current image to be blitted at the correct location
@@ -4286,9 +7257,11 @@ class UpgradeChest(Chest):
 
     def __init__(self, platform: Platform, upgrade: UpgradePotion) -> None:
         super().__init__(platform)
-        self.images = [pygame.image.load(f"images/chest/upgradeChest/chest{i}.png") for i in range(1, 7)]
-        self.animationStage = 0
-        self.currentImage = self.images[self.animationStage]
+        self.openClip = animations.register(
+            tuple(f"images/chest/upgradeChest/chest{i}.png" for i in range(1, 7)), 8, False
+        )
+        self.openTick = None
+        self.currentImage = animations.clips[self.openClip].frame(0)
         self.hitbox = pygame.Rect((self.platform.x + self.platform.length / 2) - 32, self.platform.y - 43, 64, 64)
         self.upgrade = upgrade
         self.collected = False
@@ -4303,29 +7276,29 @@ class UpgradeChest(Chest):
         Return => None
         """
         # draw chest
-        gameWindow.blit(self.currentImage, (self.platform.x + self.platform.length / 2 - 32, self.platform.y - 43))
+        spriteBatch.blit(self.currentImage, (self.platform.x + self.platform.length / 2 - 32, self.platform.y - 43))
 
         # if the chest has not been collected[x] and the chest is finished opening
-        if self.animationStage == len(self.images) * 8 - 1 and not self.collected:
-            gameWindow.blit(self.upgrade.image, (self.platform.x + self.platform.length / 2 - COLLECTIBLE_SIZE / 2, self.platform.y - COLLECTIBLE_SIZE))
+        if self.openTick is not None and animations.finished(self.openClip, self.openTick) and not self.collected:
+            spriteBatch.blit(self.upgrade.image, (self.platform.x + self.platform.length / 2 - COLLECTIBLE_SIZE / 2, self.platform.y - COLLECTIBLE_SIZE))
 
-        # Rebuilds the hitbox
-        self.hitbox = pygame.Rect((self.platform.x + self.platform.length / 2) - 32, self.platform.y - 43, 64, 64)
+        # Rebuilds the hitbox if the platform moved
+        if self.platform.moves:
+            self.hitbox = pygame.Rect((self.platform.x + self.platform.length / 2) - 32, self.platform.y - 43, 64, 64)
 
     def open(self) -> None:
-        """ Sets the current image and increments 'Animation Stage'
+        """ Starts the opening animation the first time it is called, and sets the current image
 
         Parameters:
 
 
         Return => None
         """
-        # sets current image
-        self.currentImage = self.images[int(self.animationStage // 8)]
+        if self.openTick is None:
+            self.openTick = animations.tick
 
-        # increments 'animationStage' if possible
-        if self.animationStage <= len(self.images) * 8 - 2:
-            self.animationStage += 1
+        # sets current image
+        self.currentImage = animations.frame(self.openClip, self.openTick)
 
 
 #################################################################
@@ -4343,11 +7316,11 @@ class Portal(object):
         hitbox: pygame.Rect
             The hitbox of the portal
 
-        images: list[pygame.Surface]
-            The images for the animated portal
+        portalClip: int
+            The id of the animation clip of the portal
 
-        animationStage: int
-            The current image's index number
+        spawnTick: int
+            The tick the portal spawned on, which its animation is played from
 
         currentImage: pygame.Surface
             The current image to be blitted at the correct location
@@ -4357,11 +7330,9 @@ class Portal(object):
     def __init__(self, platform: Platform) -> None:
         self.platform = platform
         self.hitbox = pygame.Rect(self.platform.x + self.platform.length / 2 - 64, self.platform.y - 118, 128, 128)
-        self.images = [
-            pygame.image.load(f"images/portal/portal{i}.png") for i in range(1, 9)
-        ]
-        self.animationStage = 0
-        self.currentImage = self.images[self.animationStage]
+        self.portalClip = animations.register(tuple(f"images/portal/portal{i}.png" for i in range(1, 9)), 5)
+        self.spawnTick = animations.tick
+        self.currentImage = animations.frame(self.portalClip, self.spawnTick)
 
     def draw(self) -> None:
         """ Draws the portal at the midpoint of its platform
@@ -4371,19 +7342,13 @@ class Portal(object):
 
         Return => None
         """
-        # resets 'animationStage' if the current value will cause an IndexError
-        if self.animationStage >= len(self.images) * 5 - 1:
-            self.animationStage = 0
+        # rebuilds hitbox if the platform moved
+        if self.platform.moves:
+            self.hitbox = pygame.Rect(self.platform.x + self.platform.length / 2 - 64, self.platform.y - 118, 128, 128)
 
         # sets the current image and blits it
-        self.currentImage = self.images[int(self.animationStage // 5)]
-        gameWindow.blit(self.currentImage, (self.platform.x + self.platform.length / 2 - 64, self.platform.y - 118))
-
-        # rebuilds hitbox
-        self.hitbox = pygame.Rect(self.platform.x + self.platform.length / 2 - 64, self.platform.y - 118, 128, 128)
-
-        # increments animation stage
-        self.animationStage += 1
+        self.currentImage = animations.frame(self.portalClip, self.spawnTick)
+        spriteBatch.blit(self.currentImage, (self.platform.x + self.platform.length / 2 - 64, self.platform.y - 118))
 
 
 #################################################################
@@ -4405,27 +7370,23 @@ class Level(object):
             The maximum number of platforms in the level excluding the last 2 platforms. The second last platform has a
             upgrade chest and the last platform has a portal to the next level
 
-        background: pygame.Surface
-            The background of the level
+        biome: BiomeBundle
+            The biome of the level, which provides its background, tiles and enemies
 
 
 
     """
 
-    def __init__(self, maxPlatforms: int, background: pygame.Surface = backgroundImage) -> None:
-        if background is underworldBackgroundImage:
-            self.startPlatform = Platform(200, HEIGHT // 2 - 100, 100, underworldTile)
-
-        elif background is iceBackgroundImage:
-            self.startPlatform = Platform(200, HEIGHT // 2 - 100, 100, iceTile)
-
-        else:
-            self.startPlatform = Platform(200, HEIGHT // 2 - 100, 100)
+    def __init__(self, maxPlatforms: int, biome: BiomeBundle = grassBiome) -> None:
+        self.startPlatform = Platform(200, HEIGHT // 2 - 100, 100, biome)
 
         self.platforms: list[Union[Platform, HorizontalMovingPlatform, VerticalMovingPlatform]] = [self.startPlatform]
         self.maxPlatforms = maxPlatforms
         self.numOfPlatforms = len(self.platforms)
-        self.background = background
+        self.biome = biome.load()
+
+        # every level starts at the left edge of the world
+        camera.reset()
 
     # Platform-related functions
     def drawPlatforms(self) -> None:
@@ -4439,12 +7400,14 @@ class Level(object):
         for platform in self.platforms:
             platform.draw()
 
+        spriteBatch.submit()
+
     def deletePlatforms(self) -> None:
         # gets first element because first element is closes to the border --------------------------------------------
         if len(self.platforms) >= 1:
 
             # if the platform is out of the screen, remove it -----------------
-            if self.platforms[0].x + self.platforms[0].length < -30:
+            if camera.toScreen(self.platforms[0].x + self.platforms[0].length) < -30:
                 # pops the platform from the list -----------------------------
                 self.platforms.pop(0)
 
@@ -4452,14 +7415,14 @@ class Level(object):
 
         # removes enemies it they are off the screen ------------------------------------------------------------------
         for enemy in enemies:
-            if enemy.platform.x + enemy.platform.length < -5:
+            if camera.toScreen(enemy.platform.x + enemy.platform.length) < -5:
                 enemies.pop(0)
 
         # -------------------------------------------------------------------------------------------------------------
 
         # removes chests if they are off the screen -------------------------------------------------------------------
         for chest in chests:
-            if chest.platform.x + chest.platform.length < -5:
+            if camera.toScreen(chest.platform.x + chest.platform.length) < -5:
                 chests.pop(0)
 
         # -------------------------------------------------------------------------------------------------------------
@@ -4472,18 +7435,8 @@ class Level(object):
 
         Return => None
         """
-        # generates platform depending on the level background
-        if self.background is underworldBackgroundImage:
-            image = underworldTile
-
-        elif self.background is iceBackgroundImage:
-            image = iceTile
-
-        else:
-            image = grassTile
-
         # if there is no new platform, generate one -------------------------------------------------------------------
-        if self.platforms[-1].x <= WIDTH - 60 and self.numOfPlatforms < self.maxPlatforms and len(self.platforms) != 0:
+        if camera.toScreen(self.platforms[-1].x) <= WIDTH - 60 and self.numOfPlatforms < self.maxPlatforms and len(self.platforms) != 0:
             # chance of a moving platform
             movingPlatformChance = randint(1, 4)
 
@@ -4507,7 +7460,7 @@ class Level(object):
                         VerticalMovingPlatform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 6) * 20),
                                                self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20),
                                                (randint(3, 6) * 10),
-                                               choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                                               choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
 
                 elif movingPlatformChance == 2 and not (
@@ -4517,7 +7470,7 @@ class Level(object):
                         HorizontalMovingPlatform(
                             self.platforms[-1].x + self.platforms[-1].length + (randint(8, 10) * 20),
                             self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20),
-                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
                 # else make a normal platform -------------------------------------------------
                 else:
@@ -4525,19 +7478,19 @@ class Level(object):
                     if isinstance(self.platforms[-1], HorizontalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].lowerBound + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
                     # make new platform a random distance from the lowest point of vertically moving platform
                     elif isinstance(self.platforms[-1], VerticalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].lowerBound + (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].lowerBound + (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
                     else:
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 6) * 20),
-                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
             # if 'higherOrLower' is 0, make the platform higher than the current one ----------------------
@@ -4549,7 +7502,7 @@ class Level(object):
                         VerticalMovingPlatform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 7) * 20),
                                                self.platforms[-1].y - (randint(2, 3) * 20), (randint(7, 10) * 20),
                                                (randint(3, 6) * 10),
-                                               choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                                               choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
 
                 elif movingPlatformChance == 2 and not (
@@ -4559,7 +7512,7 @@ class Level(object):
                         HorizontalMovingPlatform(
                             self.platforms[-1].x + self.platforms[-1].length + (randint(9, 10) * 20),
                             self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20),
-                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
                 # else make a normal platform -------------------------------------------------
                 else:
@@ -4567,19 +7520,19 @@ class Level(object):
                     if isinstance(self.platforms[-1], HorizontalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].lowerBound + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
                     # make new platform a random distance from the highest point of vertically moving platform
                     elif isinstance(self.platforms[-1], VerticalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].upperBound - (randint(1, 3) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].upperBound - (randint(1, 3) * 20), (randint(7, 10) * 20), self.biome)
                         )
                     else:
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 6) * 20),
-                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
             # increments 'numOfPlatforms' ---------------------------------
@@ -4597,13 +7550,13 @@ class Level(object):
                 # generate the 'numberOfEnemies' number of enemies, depending on background --
                 for j in range(numberOfEnemies):
                     # ice enemy
-                    if level.background is iceBackgroundImage:
+                    if level.biome is iceBiome:
                         enemies.append(
                             IceEnemy(self.platforms[-1], speed, 100)
                         )
 
                     # underworld enemy
-                    elif level.background is underworldBackgroundImage:
+                    elif level.biome is underworldBiome:
                         enemies.append(
                             UnderworldEnemy(self.platforms[-1], speed, 100)
                         )
@@ -4648,14 +7601,14 @@ class Level(object):
                 # appending platform based on the right most position
                 self.platforms.append(
                     Platform(self.platforms[-1].lowerBound + self.platforms[-1].length + 60,
-                             self.platforms[-1].y, 180, image)
+                             self.platforms[-1].y, 180, self.biome)
                 )
 
             else:
                 # append platform normally
                 self.platforms.append(
                     Platform(self.platforms[-1].x + self.platforms[-1].length + 60,
-                             self.platforms[-1].y, 180, image)
+                             self.platforms[-1].y, 180, self.biome)
                 )
 
             # generate potions ----------------------------------------------------------------
@@ -4684,7 +7637,7 @@ class Level(object):
         if self.numOfPlatforms == self.maxPlatforms + 1:
             self.platforms.append(
                 Platform(self.platforms[-1].x + self.platforms[-1].length + 60,
-                         self.platforms[-1].y, 180, image)
+                         self.platforms[-1].y, 180, self.biome)
             )
 
             # appends portal to list
@@ -4776,12 +7729,12 @@ class MissileChannel(object):
         Return => None
         """
         if self.isOpened:
-            pygame.draw.rect(gameWindow, RED, (WIDTH - 5, self.hitbox.y, 5, self.hitbox.height))
-            pygame.draw.rect(gameWindow, BLACK, (WIDTH - 6, self.hitbox.y - 1, 7, self.hitbox.height + 2), 1)
+            backend.drawRect(RED, (WIDTH - 5, self.hitbox.y, 5, self.hitbox.height))
+            backend.drawRect(BLACK, (WIDTH - 6, self.hitbox.y - 1, 7, self.hitbox.height + 2), 1)
 
         else:
-            pygame.draw.rect(gameWindow, self.colour, (WIDTH - 5, self.hitbox.y, 5, self.hitbox.height))
-            pygame.draw.rect(gameWindow, BLACK, (WIDTH - 6, self.hitbox.y - 1, 7, self.hitbox.height + 2), 1)
+            backend.drawRect(self.colour, (WIDTH - 5, self.hitbox.y, 5, self.hitbox.height))
+            backend.drawRect(BLACK, (WIDTH - 6, self.hitbox.y - 1, 7, self.hitbox.height + 2), 1)
 
     def flash(self) -> None:
         """ Flashes the channels red
@@ -4814,8 +7767,8 @@ class BossLevel(Level):
         maxPlatforms: int
             The maximum number of platforms in the level. The last platform has a portal to the next level
 
-        background: pygame.Surface
-            The background of the level
+        biome: BiomeBundle
+            The biome of the level, which provides its background, tiles and enemies
 
         generatePlatform: bool
             In the boss level, platforms are generated infinitely until the boss is defeated. This booleans controls
@@ -4847,8 +7800,8 @@ class BossLevel(Level):
 
     """
 
-    def __init__(self, maxPlatforms: int, background: pygame.Surface = backgroundImage) -> None:
-        super().__init__(maxPlatforms, background)
+    def __init__(self, maxPlatforms: int, biome: BiomeBundle = grassBiome) -> None:
+        super().__init__(maxPlatforms, biome)
 
         # booleans
         self.generatePlatform = True
@@ -4884,18 +7837,8 @@ class BossLevel(Level):
 
         Return => None
         """
-        # generates platform depending on the level background
-        if self.background is underworldBackgroundImage:
-            image = underworldTile
-
-        elif self.background is iceBackgroundImage:
-            image = iceTile
-
-        else:
-            image = grassTile
-
         # if there is no new platform, generate one -------------------------------------------------------------------
-        if self.platforms[-1].x <= WIDTH - 60 and self.generatePlatform:
+        if camera.toScreen(self.platforms[-1].x) <= WIDTH - 60 and self.generatePlatform:
             # chance of a moving platform
             movingPlatformChance = randint(1, 4)
 
@@ -4918,7 +7861,7 @@ class BossLevel(Level):
                     self.platforms.append(
                         VerticalMovingPlatform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 6) * 20),
                                                self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20),
-                                               (randint(3, 6) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                                               (randint(3, 6) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
 
                 elif movingPlatformChance == 2 and not (
@@ -4928,7 +7871,7 @@ class BossLevel(Level):
                         HorizontalMovingPlatform(
                             self.platforms[-1].x + self.platforms[-1].length + (randint(8, 10) * 20),
                             self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20),
-                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
                 # else make a normal platform -------------------------------------------------
                 else:
@@ -4936,19 +7879,19 @@ class BossLevel(Level):
                     if isinstance(self.platforms[-1], HorizontalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].lowerBound + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
                     # make new platform a random distance from the lowest point of vertically moving platform
                     elif isinstance(self.platforms[-1], VerticalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].lowerBound + (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].lowerBound + (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
                     else:
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 6) * 20),
-                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y + (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
             # if 'higherOrLower' is 0, make the platform higher than the current one ----------------------
@@ -4959,7 +7902,7 @@ class BossLevel(Level):
                     self.platforms.append(
                         VerticalMovingPlatform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 7) * 20),
                                                self.platforms[-1].y - (randint(2, 3) * 20), (randint(7, 10) * 20),
-                                               (randint(3, 6) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                                               (randint(3, 6) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
 
                 elif movingPlatformChance == 2 and not (
@@ -4969,7 +7912,7 @@ class BossLevel(Level):
                         HorizontalMovingPlatform(
                             self.platforms[-1].x + self.platforms[-1].length + (randint(9, 10) * 20),
                             self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20),
-                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), image)
+                            (randint(4, 7) * 10), choice([i / MOVING_PLATFORM_SPEED for i in range(5, 20)]), self.biome)
                     )
                 # else make a normal platform -------------------------------------------------
                 else:
@@ -4977,19 +7920,19 @@ class BossLevel(Level):
                     if isinstance(self.platforms[-1], HorizontalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].lowerBound + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
                     # make new platform a random distance from the highest point of vertically moving platform
                     elif isinstance(self.platforms[-1], VerticalMovingPlatform):
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(5, 8) * 20),
-                                     self.platforms[-1].upperBound - (randint(1, 3) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].upperBound - (randint(1, 3) * 20), (randint(7, 10) * 20), self.biome)
                         )
                     else:
                         self.platforms.append(
                             Platform(self.platforms[-1].x + self.platforms[-1].length + (randint(3, 6) * 20),
-                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), image)
+                                     self.platforms[-1].y - (randint(2, 4) * 20), (randint(7, 10) * 20), self.biome)
                         )
 
             # if the last platform is not the spawn platform and 'chanceOfEnemy' is 1 ---------
@@ -5001,14 +7944,14 @@ class BossLevel(Level):
                 typeOfEnemy = randint(1, 8)
 
                 # ice enemy
-                if typeOfEnemy == 1 and self.background is iceBackgroundImage:
+                if typeOfEnemy == 1 and self.biome is iceBiome:
                     enemies.append(
                         IceEnemy(self.platforms[-1], speed, 100)
                     )
 
                 # underworld enemy
                 elif typeOfEnemy == 2 and (
-                        self.background is iceBackgroundImage or self.background is underworldBackgroundImage):
+                        self.biome is iceBiome or self.biome is underworldBiome):
                     enemies.append(
                         UnderworldEnemy(self.platforms[-1], speed, 100)
                     )
@@ -5048,14 +7991,14 @@ class BossLevel(Level):
                 # appending platform based on the right most position
                 self.platforms.append(
                     Platform(self.platforms[-1].lowerBound + self.platforms[-1].length + 60,
-                             self.platforms[-1].y, 180, image)
+                             self.platforms[-1].y, 180, self.biome)
                 )
 
             else:
                 # append platform normally
                 self.platforms.append(
                     Platform(self.platforms[-1].x + self.platforms[-1].length + 60,
-                             self.platforms[-1].y, 180, image)
+                             self.platforms[-1].y, 180, self.biome)
                 )
 
             # generate potions ----------------------------------------------------------------
@@ -5082,7 +8025,7 @@ class BossLevel(Level):
         if self.generatePlatform and self.levelOver:
             self.platforms.append(
                 Platform(self.platforms[-1].x + self.platforms[-1].length + 60,
-                         self.platforms[-1].y, 180, image)
+                         self.platforms[-1].y, 180, self.biome)
             )
 
             # appends portal to list
@@ -5103,25 +8046,9 @@ class BossLevel(Level):
 
         Return => None
         """
-        # drawing player health in chunks of 25 -------------------------------
-        for j in range(int(self.health // 25)):
-            # health
-            pygame.draw.rect(gameWindow, PURPLE, (200 + (j * 14), y + 3, 14, 30), 0, 0)
-            pygame.draw.rect(gameWindow, LPURPLE, (200 + (j * 14), y + 8, 14, 6), 0, 0)
-
-            # drawing over edges of health bar
-            if j == 0:
-                pygame.draw.rect(gameWindow, PURPLE, (200, y + 3, 6, 30), 0, 0)
-            if j == (self.health // 25) - 1:
-                pygame.draw.rect(gameWindow, PURPLE, (200 + (j * 14) + 8, y + 3, 6, 30), 0, 0)
-
-        # ---------------------------------------------------------------------
-
-        # border --------------------------------------------------------------
-        pygame.draw.rect(gameWindow, BLACK, (196, y, 422, 36), 5, 8)
-        pygame.draw.rect(gameWindow, (64, 64, 64), (196, y - 2, 424, 40), 3, 8)
-
-        # ---------------------------------------------------------------------
+        # boss health in chunks of 25, only redrawn when a chunk is lost
+        bar, (offsetX, offsetY) = healthBars.boss(self.health)
+        backend.blit(bar, (200 + offsetX, y + offsetY))
 
     def checkPlayerCollision(self, playerToCheck: Player) -> None:
         """ Responsible for checking for collision between the platforms and the player
@@ -5168,7 +8095,7 @@ class BossLevel(Level):
 
         self.hitboxes[randomChannel].open()
 
-        bullets.append(EnemyBullet(WIDTH - 10, randomChannel * 50 + 17, 8))
+        bullets.append(EnemyBullet(camera.toWorld(WIDTH - 10), randomChannel * 50 + 17, 8))
 
     def fireLaser(self, start, end) -> None:
         laserFired = True
@@ -5179,7 +8106,7 @@ class BossLevel(Level):
         self.canFireLaser = laserFired
 
         if self.canFireLaser:
-            bullets.append(EnemyLaser(start, end, 12))
+            bullets.append(EnemyLaser(camera.toWorld(start), end, 12))
 
     def drawChannels(self) -> None:
         """ Draws the channels and also closes them after a period of time
@@ -5204,6 +8131,9 @@ class BossLevel(Level):
         Return => None
         """
         for channel in self.hitboxes:
+            # the channels stay at the right edge of the screen
+            channel.hitbox.x = int(camera.toWorld(WIDTH - 2))
+
             for bullet in bullets:
                 if bullet.hitbox.colliderect(channel.hitbox) and channel.isOpened and not isinstance(bullet, EnemyProjectile):
                     bossHitSound.stop()
@@ -5248,11 +8178,10 @@ class BossLevel(Level):
             if self.instructionAnimationStage < len(instructionStr) * 2:
                 self.instructionAnimationStage += 1
 
-            bossInstructions = instructionFont.render(instructionStr[:self.instructionAnimationStage // 2], False,
-                                                      WHITE)
-            instructionsWidth, instructionsHeight = instructionFont.size(
-                instructionStr[:self.instructionAnimationStage // 2])
-            gameWindow.blit(bossInstructions, (WIDTH / 2 - instructionsWidth / 2, HEIGHT - 40 - instructionsHeight))
+            bossInstructions = textCache.typed(instructionFont, instructionStr, False, WHITE)
+            instructionsWidth, instructionsHeight = bossInstructions.size(self.instructionAnimationStage // 2)
+            bossInstructions.draw(self.instructionAnimationStage // 2,
+                                  (WIDTH / 2 - instructionsWidth / 2, HEIGHT - 40 - instructionsHeight))
 
     def fireWeapon(self) -> None:
         """ Draws the platforms
@@ -5308,44 +8237,6 @@ class BossLevel(Level):
 # Functions
 #
 ###############################################################################
-## Move background ############################################
-def moveBackground(rate: float) -> None:
-    """ Moves the background to give the illusion of the player moving forward
-
-    Parameters:
-        rate: float -> the rate of which the backgrounds moves
-
-
-    Return => None
-    """
-    # moves player
-    for play in players:
-        play.x -= rate
-
-    # moves platforms
-    for pf in level.platforms:
-        pf.x -= rate
-        if isinstance(pf, HorizontalMovingPlatform):
-            pf.upperBound -= rate
-            pf.lowerBound -= rate
-
-    # moves enemies
-    for en in enemies:
-        en.x -= rate
-
-    # moves collectibles
-    for co in collectibles:
-        co.x -= rate
-
-    # moves bullets
-    for bu in bullets:
-        bu.x -= rate
-
-    # moves grenades
-    for gr in grenades:
-        gr.x -= rate
-
-
 ## Enemy-related functions ####################################
 def drawEnemies() -> None:
     """ Draws all the enemies
@@ -5358,6 +8249,14 @@ def drawEnemies() -> None:
     for enemy in enemies:
         enemy.draw()
 
+    spriteBatch.submit()
+
+    # the health bars go over every enemy, so they are drawn once the sprites are
+    for enemy in enemies:
+        enemy.drawHealthBar()
+
+    spriteBatch.submit()
+
 
 def moveEnemies() -> None:
     """ Moves all the enemies
@@ -5372,17 +8271,16 @@ def moveEnemies() -> None:
 
 
 def deleteEnemies() -> None:
-    """ Deletes enemies if their health is <= 0 and their death animation is over
+    """ Deletes dead enemies right away, handing their death animation over to 'effects'
 
     Parameters:
 
 
     Return => None
     """
-    for enemy in enemies:
-        if enemy.health <= 0 and enemy.deadStage == (len(enemy.dead) * 8) - 1:
-            if enemy in enemies:
-                enemies.remove(enemy)
+    for enemy in [enemy for enemy in enemies if enemy.isDead]:
+        enemy.explode()
+        enemies.remove(enemy)
 
 
 def checkEnemyAlive() -> None:
@@ -5421,6 +8319,8 @@ def drawBullets() -> None:
     for bullet in bullets:
         bullet.draw()
 
+    spriteBatch.submit()
+
 
 ## Grenade-related functions ##################################
 def drawGrenades() -> None:
@@ -5434,6 +8334,8 @@ def drawGrenades() -> None:
     for grenade in grenades:
         grenade.draw()
 
+    spriteBatch.submit()
+
 
 def moveGrenades() -> None:
     """ Draws grenades
@@ -5447,6 +8349,18 @@ def moveGrenades() -> None:
         grenade.move()
 
 
+## Effect-related functions ###################################
+def redrawEffects() -> None:
+    """ Draws and advances the explosions and flashes left behind by enemies, bullets and grenades
+
+    Parameters:
+
+
+    Return => None
+    """
+    effects.update()
+
+
 ## Chest-related functions ####################################
 def drawChests() -> None:
     """ Draws chests
@@ -5459,6 +8373,8 @@ def drawChests() -> None:
     for chest in chests:
         chest.draw()
 
+    spriteBatch.submit()
+
 
 ## Collectible-related functions ##############################
 def drawCollectibles() -> None:
@@ -5472,6 +8388,8 @@ def drawCollectibles() -> None:
     for collectible in collectibles:
         collectible.draw()
 
+    spriteBatch.submit()
+
 
 ## Portal-related functions ###################################
 def drawPortals() -> None:
@@ -5485,6 +8403,8 @@ def drawPortals() -> None:
     for portal in portals:
         portal.draw()
 
+    spriteBatch.submit()
+
 
 ## Level generation ###########################################
 def generateLevel(playerList: list[Player]) -> Level:
@@ -5510,6 +8430,7 @@ def generateLevel(playerList: list[Player]) -> Level:
             portals.clear()
             enemies.clear()
             grenades.clear()
+            effects.clear()
             bullets.clear()
             collectibles.clear()
 
@@ -5530,32 +8451,37 @@ def generateLevel(playerList: list[Player]) -> Level:
             levelNumber += 1
             levelTransition = False
 
+            # restarts the asset counters, so any image decoded during the new level shows up as a miss
+            assets.resetCounters()
+
             # reset player health and weapon after they finish the tutorial ---------------
             if levelNumber == 1:
                 for play in playerList:
                     play.currentWeapon = Pistol()
                     play.health = 100
 
-            levelBackgroundImage = backgroundImage
+            levelBiome = grassBiome
 
 
-            # sets background based on level number
+            # sets biome based on level number
             if 6 <= levelNumber <= 10:
-                levelBackgroundImage = underworldBackgroundImage
+                levelBiome = underworldBiome
 
             if 11 <= levelNumber <= 15:
                 # acceleration as the level has 'ice'
                 playerToCheck.accelerationX = 0.15
-                levelBackgroundImage = iceBackgroundImage
+                levelBiome = iceBiome
+
+            switchBiome(level.biome, levelBiome)
 
             platformNum = levelNumber * 5 + 5
             if platformNum > MAX_PLATFORMS:
                 platformNum = MAX_PLATFORMS
 
             if levelNumber == 5 or levelNumber == 10 or levelNumber == 15:
-                return BossLevel(platformNum, levelBackgroundImage)
+                return BossLevel(platformNum, levelBiome)
 
-            return Level(platformNum, levelBackgroundImage)
+            return Level(platformNum, levelBiome)
 
         # Going into the underworld transition ----------------------------------------------------------------------------
         if levelTransition:
@@ -5575,6 +8501,7 @@ def generateLevel(playerList: list[Player]) -> Level:
                 portals.clear()
                 enemies.clear()
                 grenades.clear()
+                effects.clear()
                 bullets.clear()
                 collectibles.clear()
 
@@ -5593,24 +8520,48 @@ def generateLevel(playerList: list[Player]) -> Level:
                 # increments level number
                 levelNumber += 1
 
+                # restarts the asset counters for the new level
+                assets.resetCounters()
+
                 platformNum = levelNumber * 5 + 5
                 if platformNum > MAX_PLATFORMS:
                     platformNum = MAX_PLATFORMS
 
-                return Level(platformNum, underworldBackgroundImage)
+                switchBiome(level.biome, underworldBiome)
+
+                return Level(platformNum, underworldBiome)
 
     return level
 
 
 
+## Biome switching ############################################
+def switchBiome(previous: BiomeBundle, biome: BiomeBundle) -> BiomeBundle:
+    """ Loads the assets of 'biome' and evicts the assets of 'previous' if the run is leaving it.
+        Enemy sprites used by both biomes stay cached
+
+    Parameters:
+        previous: BiomeBundle -> the biome of the current level
+        biome: BiomeBundle -> the biome of the next level
+
+
+    Return => BiomeBundle: the loaded biome
+    """
+    if previous is not biome:
+        previous.evict(biome.paths())
+
+    return biome.load()
+
+
 ## Weapon generation ##########################################
-def generateWeapon() -> Gun:
+def generateWeapon() -> WeaponDescriptor:
     """ Generates a weapon using the choice() function from the random module.
+        Only the descriptor is returned - the gun is constructed when it is picked up
 
     Parameters:
 
 
-    Return => Gun: returns the randomly generated gun
+    Return => WeaponDescriptor: returns the randomly generated weapon
     """
     # generating weapon -------------------------------------------------------
     # picking a type of weapon
@@ -5626,7 +8577,8 @@ def generateWeapon() -> Gun:
 
     weapon = choice(weapons[weaponType])
 
-    return SubMachineGun()
+    # every chest holds the sub-machine gun for now - 'weapon' is picked but not returned
+    return weapons["default"][2]
 
 
 ###############################################################################
@@ -5671,17 +8623,17 @@ def checkBulletCollision(playerToCheck: Player) -> None:
                 bullet.collided = True
 
         # removes bullet if it has left the screen ----------------------------
-        if (bullet.x > WIDTH + 10 or bullet.x < -10 or bullet.y > HEIGHT + 10) and not isinstance(bullet, EnemyLaser):
+        if (camera.toScreen(bullet.x) > WIDTH + 10 or camera.toScreen(bullet.x) < -10 or bullet.y > HEIGHT + 10) and not isinstance(bullet, EnemyLaser):
             if bullet in bullets:
                 bullets.remove(bullet)
 
-        # removes shotgun bullets whose animation is over----------------------
-        if isinstance(bullet, ShotgunBullet) and bullet.muzzleFlashStage == len(bullet.muzzleFlash) * 2 - 1:
+        # removes shotgun bullets that no longer do damage --------------------
+        if isinstance(bullet, ShotgunBullet) and bullet.lifetime <= 0:
             if bullet in bullets:
                 bullets.remove(bullet)
 
-        # removes shotgun bullets whose animation is over ---------------------
-        if isinstance(bullet, LaserShotgunBullet) and bullet.muzzleFlashStage == len(bullet.muzzleFlash) * 2 - 1:
+        # removes shotgun bullets that no longer do damage --------------------
+        if isinstance(bullet, LaserShotgunBullet) and bullet.lifetime <= 0:
             if bullet in bullets:
                 bullets.remove(bullet)
 
@@ -5696,7 +8648,7 @@ def checkBulletCollision(playerToCheck: Player) -> None:
                 bullets.remove(bullet)
 
         # removes beams -------------------------------------------------------
-        if isinstance(bullet, Lightning) and bullet.explosionAnimationStage == len(bullet.explosionAnimation) * 10 - 1:
+        if isinstance(bullet, Lightning) and bullet.strikeTick is not None and animations.finished(bullet.strikeClip, bullet.strikeTick):
             if bullet in bullets:
                 bullets.remove(bullet)
 
@@ -5725,7 +8677,7 @@ def checkGrenadeCollision() -> None:
     Return => None
     """
     # Checks if the bullet is in any platforms or enemies ---------------------
-    for grenade in grenades:
+    for grenade in grenades[:]:
         for platform in level.platforms:
             # Builds platform hitbox
             platformHitbox = pygame.Rect(platform.x, platform.y, platform.length, platform.width)
@@ -5734,24 +8686,26 @@ def checkGrenadeCollision() -> None:
             if grenade.hitbox.colliderect(platformHitbox):
                 grenade.exploded = True
 
-            # Checks every enemy for collision ------------------------
-            for enemy in enemies:
+        # Checks every enemy for collision ----------------------------
+        for enemy in enemies:
 
-                # explodes if grenade hits an enemy -------------------
-                if grenade.hitbox.colliderect(enemy.hitbox):
-                    grenade.exploded = True
+            # explodes if grenade hits an enemy -----------------------
+            if grenade.hitbox.colliderect(enemy.hitbox):
+                grenade.exploded = True
 
-                # Deduct health ---------------------------------------
-                if grenade.exploded and grenade.explosionHitbox.colliderect(enemy.hitbox) and grenade.explosionAnimationStage == 0:
+        if grenade.exploded:
+            # Deduct health -------------------------------------------
+            for enemy in enemies:
+                if grenade.explosionHitbox.colliderect(enemy.hitbox):
                     enemy.takeDamage(GRENADE_LAUNCHER_DAMAGE)
 
-        # Remove grenade when explosion animation ends ----------------
-        if grenade.explosionAnimationStage >= len(grenade.explosionAnimation) * 8 - 1:
-            grenades.pop(grenades.index(grenade))
+            # Remove grenade once it explodes, leaving the explosion to 'effects'
+            grenade.explode()
+            grenades.remove(grenade)
 
         # removes grenade if it falls out of the screen ---------------
-        if grenade.y > HEIGHT + 10:
-            grenades.pop(grenades.index(grenade))
+        elif grenade.y > HEIGHT + 10:
+            grenades.remove(grenade)
 
     # -------------------------------------------------------------------------
 
@@ -5810,14 +8764,13 @@ def redrawEnemies() -> None:
     # checks if enemy is alive
     checkEnemyAlive()
 
+    # delete dead enemies, whose explosions are played by 'effects'
+    deleteEnemies()
+
     # draws and move enemy
     drawEnemies()
     moveEnemies()
 
-    # delete enemies that are finished their death animation
-    deleteEnemies()
-    
-
 
 def checkEnemyInvincibilityCooldown(playerToCheck: Player) -> None:
     """ Makes sure that the collision cooldown is used - makes the enmy invicible for a short duration
@@ -5906,25 +8859,9 @@ def drawHealthBar(playerToCheck: Player, y: int) -> None:
 
     Return => None
     """
-    # drawing player health in chunks of 5 ------------------------------------
-    for j in range(int(playerToCheck.health // 5)):
-        # health
-        pygame.draw.rect(gameWindow, RED, (WIDTH - 366 + (j * 14), y + 3, 14, 30), 0, 0)
-        pygame.draw.rect(gameWindow, LRED, (WIDTH - 366 + (j * 14), y + 8, 14, 6), 0, 0)
-
-        # drawing over edges of health bar
-        if j == 0:
-            pygame.draw.rect(gameWindow, RED, (WIDTH - 366, y + 3, 6, 30), 0, 0)
-        if j == (playerToCheck.health // 5) - 1:
-            pygame.draw.rect(gameWindow, RED, (WIDTH - 366 + (j * 14) + 8, y + 3, 6, 30), 0, 0)
-
-    # -------------------------------------------------------------------------
-
-    # border ------------------------------------------------------------------
-    pygame.draw.rect(gameWindow, BLACK, (WIDTH - 370, y, 286, 36), 5, 8)
-    pygame.draw.rect(gameWindow, (64, 64, 64), (WIDTH - 370, y - 2, 288, 40), 3, 8)
-
-    # -------------------------------------------------------------------------
+    # player health in chunks of 5, only redrawn when a chunk is lost
+    bar, (offsetX, offsetY) = healthBars.player(playerToCheck.health)
+    hud.blit(bar, (WIDTH - 366 + offsetX, y + offsetY))
 
 
 def drawCoinDisplay() -> None:
@@ -5937,19 +8874,40 @@ def drawCoinDisplay() -> None:
     """
 
     # changes colour based on background ------------------------------
-    colour = BLACK if level.background is iceBackgroundImage else WHITE
+    colour = BLACK if level.biome is iceBiome else WHITE
+
+    # only rendered again when a coin is collected or spent -----------
+    hud.blit(hud.widget("coins", renderCoinDisplay, coinsCollected, colour), (30, 16))
+
+
+def renderCoinDisplay(coins: int, colour: tuple[int, int, int]) -> pygame.Surface:
+    """ Renders the coin icon and the number of coins, with (30, 16) of the screen at the top left
+
+    Parameters:
+        coins: int
+            The number of coins collected
+
+        colour: tuple[int, int, int]
+            The colour of the text
 
+    Return => pygame.Surface: the rendered coin display
+    """
     # rendering text, with antialias off ------------------------------
-    xRender = scoreFontSmall.render("x", False, colour)
-    scoreRender = scoreFont.render(f"{coinsCollected}", False, colour)
+    xRender = textCache.render(scoreFontSmall, "x", False, colour)
+    scoreRender = textCache.render(scoreFont, f"{coins}", False, colour)
 
     # blitting text and images ----------------------------------------
-    # gameWindow.blit(coinIcon, (WIDTH - 470, 16))
-    # gameWindow.blit(xRender, (WIDTH - 495, 30))
-    # gameWindow.blit(scoreRender, (WIDTH - 500 - scoreWidth, 20))
-    gameWindow.blit(coinIcon, (30, 16))
-    gameWindow.blit(xRender, (85, 30))
-    gameWindow.blit(scoreRender, (100, 20))
+    # display.blit(coinIcon, (WIDTH - 470, 16))
+    # display.blit(xRender, (WIDTH - 495, 30))
+    # display.blit(scoreRender, (WIDTH - 500 - scoreWidth, 20))
+    parts = [(coinIcon, (0, 0)), (xRender, (55, 14)), (scoreRender, (70, 4))]
+    width = max(part.get_width() + x for part, (x, y) in parts)
+    height = max(part.get_height() + y for part, (x, y) in parts)
+
+    display = pygame.Surface((width, height), pygame.SRCALPHA)
+    display.blits([(part, position) for part, position in parts], doreturn=False)
+
+    return assets.normalize(display)
 
 
 def drawBulletDisplay(timeSinceFire: float, fireRate: float, y: float) -> None:
@@ -5971,19 +8929,19 @@ def drawBulletDisplay(timeSinceFire: float, fireRate: float, y: float) -> None:
     """
     # draws different versions of the bullet depending on 'timeSinceFire'
     if round(timeSinceFire, 2) <= round(fireRate / 6, 2):
-        gameWindow.blit(bulletGUI[0], (WIDTH - 80, y))
+        hud.blit(bulletGUI[0], (WIDTH - 80, y))
 
     elif round(timeSinceFire, 2) <= round(fireRate / 3, 2):
-        gameWindow.blit(bulletGUI[1], (WIDTH - 80, y))
+        hud.blit(bulletGUI[1], (WIDTH - 80, y))
 
     elif round(timeSinceFire, 2) <= round(fireRate / 2, 2):
-        gameWindow.blit(bulletGUI[2], (WIDTH - 80, y))
+        hud.blit(bulletGUI[2], (WIDTH - 80, y))
 
     elif round(timeSinceFire, 2) <= round(fireRate / 1.25, 2):
-        gameWindow.blit(bulletGUI[3], (WIDTH - 80, y))
+        hud.blit(bulletGUI[3], (WIDTH - 80, y))
 
     else:
-        gameWindow.blit(bulletGUI[4], (WIDTH - 80, y))
+        hud.blit(bulletGUI[4], (WIDTH - 80, y))
 
 
 def drawMagazineDisplay(playerToCheck: Player, timeSinceFire: float, fireRate: float, y: float) -> None:
@@ -6010,20 +8968,20 @@ def drawMagazineDisplay(playerToCheck: Player, timeSinceFire: float, fireRate: f
         drawBulletDisplay(timeSinceFire, fireRate, y)
 
     elif playerToCheck.currentWeapon.bulletsInMagazine == playerToCheck.currentWeapon.clipSize // 4:
-        gameWindow.blit(bulletGUI[1], (WIDTH - 80, y))
+        hud.blit(bulletGUI[1], (WIDTH - 80, y))
 
     elif playerToCheck.currentWeapon.bulletsInMagazine == playerToCheck.currentWeapon.clipSize // 4 * 2:
-        gameWindow.blit(bulletGUI[2], (WIDTH - 80, y))
+        hud.blit(bulletGUI[2], (WIDTH - 80, y))
 
     elif playerToCheck.currentWeapon.bulletsInMagazine == playerToCheck.currentWeapon.clipSize // 4 * 3:
-        gameWindow.blit(bulletGUI[3], (WIDTH - 80, y))
+        hud.blit(bulletGUI[3], (WIDTH - 80, y))
 
     else:
-        gameWindow.blit(bulletGUI[4], (WIDTH - 80, y))
+        hud.blit(bulletGUI[4], (WIDTH - 80, y))
     # displays the player name in middle of the bullet
-    gameWindow.blit(playerToCheck.nameRender, (WIDTH - 80 + bulletGUI[0].get_size()[0] / 2,
-                                               y + bulletGUI[0].get_size()[1] / 2 - playerToCheck.nameRender.get_size()[
-                                                   1] / 2))
+    hud.blit(playerToCheck.nameRender, (WIDTH - 80 + bulletGUI[0].get_size()[0] / 2,
+                                        y + bulletGUI[0].get_size()[1] / 2 - playerToCheck.nameRender.get_size()[
+                                            1] / 2))
 
 
 def drawWeaponDisplay(playerToCheck: Player, y) -> None:
@@ -6041,14 +8999,15 @@ def drawWeaponDisplay(playerToCheck: Player, y) -> None:
     Return => None
     """
     # changing colour if the background is the underworld one
-    colour = (32, 32, 32) if level.background is iceBackgroundImage else WHITE
+    colour = (32, 32, 32) if level.biome is iceBiome else WHITE
 
-    # rendering name
-    weaponName = scoreFontSmall.render(playerToCheck.currentWeapon.name, True, colour)
+    # rendering name, only when the weapon or colour changes
+    weaponName = hud.widget(f"weapon {playerToCheck.name}", textCache.render, scoreFontSmall,
+                            playerToCheck.currentWeapon.name, True, colour)
     weaponNameLength = weaponName.get_size()[0]
 
     # blits name based on width of weapon name
-    gameWindow.blit(weaponName, (WIDTH - 226 - weaponNameLength / 2, y))
+    hud.blit(weaponName, (WIDTH - 226 - weaponNameLength / 2, y))
 
 
 def drawInstructions() -> None:
@@ -6114,9 +9073,9 @@ def drawInstruction(messageToWrite: str, lettersToRender: int, colour: tuple[int
 
     Return => None
     """
-    instruction = instructionFont.render(messageToWrite[:lettersToRender], False, colour)
-    instructionWidth = instructionFont.size(messageToWrite[:lettersToRender])[0]
-    gameWindow.blit(instruction, (WIDTH / 2 - instructionWidth / 2, HEIGHT - 100))
+    instruction = textCache.typed(instructionFont, messageToWrite, False, colour)
+    instructionWidth = instruction.size(lettersToRender)[0]
+    instruction.draw(lettersToRender, (WIDTH / 2 - instructionWidth / 2, HEIGHT - 100))
 
 
 def drawGUI(playerList: list[Player]) -> None:
@@ -6136,6 +9095,10 @@ def drawGUI(playerList: list[Player]) -> None:
         yPos += 70
 
     drawCoinDisplay()
+
+    # draws the whole HUD - including the magazine displays queued with the players - in one call
+    hud.draw()
+
     # only draws instructions if the level is the tutorial level and its not finished drawing
     if instructionNum < len(instructions):
         drawInstructions()
@@ -6147,11 +9110,40 @@ def drawGUI(playerList: list[Player]) -> None:
     if levelNumber == 11 and level.numOfPlatforms < 8:
         drawMiscWeaponUnlock()
 
-def checkQuit() -> bool:
-    """ Checks if the ESCAPE or QUIT button has been pressed, and returns True if so
+def updateDisplay() -> None:
+    """ Shows the finished frame on the screen, only pushing the regions that changed if possible
+
+    Parameters:
+
+
+    Return => None
+    """
+    backend.present()
+    frameStats.endFrame()
+
+
+def drawLayers(layers: list[ParallaxLayer], scroll: float) -> None:
+    """ Draws the layers of a background, from the back to the front
 
     Parameters:
+        layers: list[ParallaxLayer]
+            The layers to draw
+
+        scroll: float
+            How far the view has scrolled, i.e. the x position of the camera
+
+    Return => None
+    """
+    for layer in layers:
+        layer.draw(scroll)
+
+
+def checkQuit(events: list[pygame.event.Event] = None) -> bool:
+    """ Checks if the ESCAPE or QUIT button has been pressed, and returns True if so
 
+    Parameters:
+        events: list[pygame.event.Event]
+            The events of this frame, or None to take them from the event queue
 
     Return => bool: if the quit event has been detected
     """
@@ -6159,7 +9151,7 @@ def checkQuit() -> bool:
     if keys[pygame.K_ESCAPE]:
         return True
 
-    for event in pygame.event.get():
+    for event in pygame.event.get() if events is None else events:
         if event.type == pygame.QUIT:
             return True
     return False
@@ -6267,7 +9259,7 @@ GRENADE_LAUNCHER_DAMAGE = 160
 INVINCIBLE_DELAY = 0.35
 
 # menu variables
-menuImagesX = 0
+menuScroll = 0
 
 ###############################################################################
 #
@@ -6311,35 +9303,41 @@ POTION_COST = 10
 # the time that a chest is opened - allows a cooldown
 timeOpened = 0
 
-# all weapons - used for weapon generation
+# all weapons - used for weapon generation. Guns are only constructed when they are picked up
 weapons = {
     # available any level
     "default": [
-        Pistol(),
-        AssaultRifle(),
-        SubMachineGun(),
-        MachineGun(),
-        SniperRifle(),
-        Shotgun(),
-        GrenadeLauncher(),
-        FlameThrower(),
-        MissileLauncher(),
+        WeaponDescriptor(weaponClass, "default") for weaponClass in [
+            Pistol,
+            AssaultRifle,
+            SubMachineGun,
+            MachineGun,
+            SniperRifle,
+            Shotgun,
+            GrenadeLauncher,
+            FlameThrower,
+            MissileLauncher,
+        ]
     ],
 
     # after level 5
     "laser": [
-        LaserPistol(),
-        LaserAssaultRifle(),
-        LaserMachineGun(),
-        LaserSniperRifle(),
-        LaserShotgun(),
+        WeaponDescriptor(weaponClass, "laser") for weaponClass in [
+            LaserPistol,
+            LaserAssaultRifle,
+            LaserMachineGun,
+            LaserSniperRifle,
+            LaserShotgun,
+        ]
     ],
 
     # after level 10
     "misc": [
-        LaserCannon(),
-        LightningStaff(),
-        PlasmaCannon(),
+        WeaponDescriptor(weaponClass, "misc") for weaponClass in [
+            LaserCannon,
+            LightningStaff,
+            PlasmaCannon,
+        ]
     ]
 }
 
@@ -6382,113 +9380,138 @@ pygame.mixer.music.load("sounds/menuSoundtrack.mp3")
 pygame.mixer.music.set_volume(0.5)
 pygame.mixer.music.play(-1)
 
+# Menu widgets ----------------------------------------------------------------
+titleWidth, titleHeight = titleFont.size(titleStr)
+buttonY = titleHeight + HEIGHT * 41 / 108
+playTextHeight = subTitleFont.size("Play")[1]
+singlePlayerTextHeight = smallHeadingFont.size("1 player")[1]
+multiplayerTextHeight = smallHeadingFont.size("2 players")[1]
+
+# play button, with the player count options under it
+playButton = Button(subTitleFont, "Play", WIDTH / 2, buttonY, 4, hoverShadowAntialias=False)
+singlePlayerToggle = Toggle(smallHeadingFont, "1 player", ">1 player", WIDTH / 2, buttonY + playTextHeight + 30, 2)
+multiplayerToggle = Toggle(smallHeadingFont, "2 players", ">2 players", WIDTH / 2,
+                           buttonY + playTextHeight + singlePlayerTextHeight + 50, 2)
+
+# the options are shown while the mouse is anywhere over the button or the options
+playButton.hoverArea = pygame.Rect(playButton.rect.x, buttonY, playButton.rect.width,
+                                   playTextHeight + singlePlayerTextHeight + multiplayerTextHeight + 60)
+
+menuScreen = WidgetScreen([singlePlayerToggle, multiplayerToggle, playButton])
+menuScreen.reset()
+
+# end screen widgets ----------------------------------------------------------
+restartButton = Button(subTitleFont, "Play Again", WIDTH / 2, buttonY, 4)
+exitButton = Button(subTitleFont, "Exit", WIDTH / 2, buttonY, 4)
+
+# arrows on either side of each button, which switch between the buttons
+rightArrowTextWidth = subTitleFont.size(">")[0]
+leftArrowTextWidth = subTitleFont.size("<")[0]
+restartArrows = [
+    Button(subTitleFont, ">", WIDTH / 2 + restartButton.rect.width / 2 + rightArrowTextWidth / 2, buttonY, 4),
+    Button(subTitleFont, "<", WIDTH / 2 - restartButton.rect.width / 2 - leftArrowTextWidth / 2, buttonY, 4)
+]
+exitArrows = [
+    Button(subTitleFont, ">", WIDTH / 2 + exitButton.rect.width / 2 + rightArrowTextWidth / 2, buttonY, 4),
+    Button(subTitleFont, "<", WIDTH / 2 - exitButton.rect.width / 2 - leftArrowTextWidth / 2, buttonY, 4)
+]
+
+endScreenWidgets = WidgetScreen([restartButton, *restartArrows, exitButton, *exitArrows])
+
+
+def showEndScreenButton(showExit: bool) -> None:
+    """ Shows only the current end screen button and its arrows, so hidden buttons cannot be clicked
+
+    Parameters:
+        showExit: bool
+            Whether 'exit' is shown instead of 'play again'
+
+    Return => None
+    """
+    restartButton.visible = not showExit
+    exitButton.visible = showExit
+
+    for arrow in restartArrows:
+        arrow.visible = not showExit
+
+    for arrow in exitArrows:
+        arrow.visible = showExit
+
+
+# 'play again' is shown first
+showEndScreenButton(False)
+
+# the clouds drifting over the menu and end screen, scaled by the workers while the game loaded
+cloudsLayer = ParallaxLayer(preloader.loadScaled("images/backgrounds/clouds.png", (WIDTH, HEIGHT)), 1)
+
 ###############################################################################
 #
 # Menu Loop
 #
 ###############################################################################
 while inMenu:
-    # resetting 'menuImagesX' to restart the animation loop -----------
-    if menuImagesX <= -WIDTH:
-        menuImagesX = 0
-
     # getting all keys ------------------------------------------------
     keys = pygame.key.get_pressed()
 
-    # clearing events -------------------------------------------------
-    pygame.event.clear()
+    # passing this frame's events to the widgets ----------------------
+    events = pygame.event.get()
+    menuScreen.handle(events)
 
     # blitting background ---------------------------------------------
-    gameWindow.blit(menuBackgroundImage, (0, 0))
-    gameWindow.blit(cloudsImage, (menuImagesX, 0))
-    gameWindow.blit(cloudsImage, (menuImagesX + WIDTH, 0))
+    drawLayers(grassBiome.load().layers + [cloudsLayer], menuScroll)
 
-    # mouse position and button status --------------------------------
-    mousePos = pygame.mouse.get_pos()
-    mouseClicked = pygame.mouse.get_pressed(3)[0]
+    # rendering the title ---------------------------------------------
+    title = textCache.typed(titleFont, titleStr, False, WHITE)
+    titleShadow = textCache.typed(titleFont, titleStr, False, BLACK)
+
+    # selecting the number of players ---------------------------------
+    if singlePlayerToggle.clicked:
+        numOfPlayers = 1
+        menuSelect.play()
 
-    # rendering text --------------------------------------------------
-    title = titleFont.render(titleStr[:titleLettersToRender // 3], False, WHITE)
-    titleShadow = titleFont.render(titleStr[:titleLettersToRender // 3], False, BLACK)
-    playText = subTitleFont.render("Play", False, BLACK)
-    playTextShadow = subTitleFont.render("Play", False, WHITE)
-    singlePlayerText = smallHeadingFont.render("1 player", False, BLACK)
-    singlePlayerTextShadow = smallHeadingFont.render("1 player", False, WHITE)
-    multiplayerText = smallHeadingFont.render("2 players", False, BLACK)
-    multiplayerTextShadow = smallHeadingFont.render("2 players", False, WHITE)
-
-    # getting the width and height of the title and play text ---------
-    titleWidth, titleHeight = titleFont.size(titleStr)
-    playTextWidth, playTextHeight = subTitleFont.size("Play")
-    singlePlayerTextWidth, singlePlayerTextHeight = smallHeadingFont.size("1 player")
-    multiplayerTextWidth, multiplayerTextHeight = smallHeadingFont.size("2 players")
-
-    # setting hitbox for play button ----------------------------------
-    playHoverHitbox = pygame.Rect(WIDTH / 2 - playTextWidth / 2, titleHeight + HEIGHT * 41 / 108, playTextWidth, playTextHeight + singlePlayerTextHeight + multiplayerTextHeight + 60)
-    playHitbox = pygame.Rect(WIDTH / 2 - playTextWidth / 2, titleHeight + HEIGHT * 41 / 108, playTextWidth, playTextHeight)
-    singlePlayerHitbox = pygame.Rect(WIDTH / 2 - playTextWidth / 2, titleHeight + HEIGHT * 41 / 108 + playTextHeight + 30, singlePlayerTextWidth, singlePlayerTextHeight)
-    multiplayerHitbox = pygame.Rect(WIDTH / 2 - playTextWidth / 2, titleHeight + HEIGHT * 41 / 108 + playTextHeight + singlePlayerTextHeight + 50, multiplayerTextWidth, multiplayerTextHeight)
-
-    if numOfPlayers == 1:
-        singlePlayerText = smallHeadingFont.render(">1 player", False, WHITE)
-        singlePlayerTextShadow = smallHeadingFont.render(">1 player", False, BLACK)
-        singlePlayerTextWidth, singlePlayerTextHeight = smallHeadingFont.size(">1 player")
-
-    elif numOfPlayers == 2:
-        multiplayerText = smallHeadingFont.render(">2 players", False, WHITE)
-        multiplayerTextShadow = smallHeadingFont.render(">2 players", False, BLACK)
-        multiplayerTextWidth, multiplayerTextHeight = smallHeadingFont.size(">2 players")
-
-    # makes the text white upon hover ---------------------------------
-    if playHoverHitbox.collidepoint(mousePos):
-
-        if singlePlayerHitbox.collidepoint(mousePos) and mouseClicked and timeElapsed - timeSelected >= 0.25:
-            numOfPlayers = 1
-            menuSelect.play()
-            timeSelected = timeElapsed
-
-
-        if multiplayerHitbox.collidepoint(mousePos) and mouseClicked and timeElapsed - timeSelected >= 0.25:
-            numOfPlayers = 2
-            menuSelect.play()
-            timeSelected = timeElapsed
-
-        # inverting colours
-        playText = subTitleFont.render("Play", True, WHITE)
-        playTextShadow = subTitleFont.render("Play", False, BLACK)
-        gameWindow.blit(singlePlayerTextShadow, (WIDTH / 2 - singlePlayerTextWidth / 2 + 2, titleHeight + HEIGHT * 41 / 108 + playTextHeight + 2 + 30))
-        gameWindow.blit(singlePlayerText, (WIDTH / 2 - singlePlayerTextWidth / 2, titleHeight + HEIGHT * 41 / 108 + playTextHeight + 30))
-        gameWindow.blit(multiplayerTextShadow, (WIDTH / 2 - multiplayerTextWidth / 2 + 2, titleHeight + HEIGHT * 41 / 108 + playTextHeight + 2 + 50 + singlePlayerTextHeight))
-        gameWindow.blit(multiplayerText, (WIDTH / 2 - multiplayerTextWidth / 2, titleHeight + HEIGHT * 41 / 108 + playTextHeight + 50 + singlePlayerTextHeight))
-
-    # starts the game upon hover and click ----------------------------
-    if playHitbox.collidepoint(mousePos) and mouseClicked:
+    if multiplayerToggle.clicked:
+        numOfPlayers = 2
+        menuSelect.play()
+
+    singlePlayerToggle.select(numOfPlayers == 1)
+    multiplayerToggle.select(numOfPlayers == 2)
+
+    # shows the options upon hover ------------------------------------
+    singlePlayerToggle.visible = multiplayerToggle.visible = playButton.hovered
+
+    # starts the game upon click --------------------------------------
+    if playButton.clicked:
         menuSelect.play()
         inMenu = False
 
+        # only blocks on the sprites the workers have not finished yet
+        waited = preloader.waitFor()
+
+        if waited:
+            print(f"waited {sum(waited.values()) * 1000:.0f} ms for {len(waited)} images: {', '.join(waited)}")
+
     # line decorations ------------------------------------------------
-    pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 40), (WIDTH / 2 + titleWidth / 2, 40))
-    pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 36), (WIDTH / 2 + titleWidth / 2, 36))
-    pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 8),
+    backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 40), (WIDTH / 2 + titleWidth / 2, 40))
+    backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 36), (WIDTH / 2 + titleWidth / 2, 36))
+    backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 8),
                      (WIDTH / 2 + titleWidth / 2, 40 + titleHeight + 8))
-    pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 12),
+    backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 12),
                      (WIDTH / 2 + titleWidth / 2, 40 + titleHeight + 12))
 
     # blitting text ---------------------------------------------------
-    gameWindow.blit(titleShadow, (WIDTH / 2 - titleWidth / 2 + 12, 52))
-    gameWindow.blit(title, (WIDTH / 2 - titleWidth / 2, 40))
+    titleShadow.draw(titleLettersToRender // 3, (WIDTH / 2 - titleWidth / 2 + 12, 52))
+    title.draw(titleLettersToRender // 3, (WIDTH / 2 - titleWidth / 2, 40))
 
-    gameWindow.blit(playTextShadow, (WIDTH / 2 - playTextWidth / 2 + 4, titleHeight + (HEIGHT * 41 / 108) + 4))
-    gameWindow.blit(playText, (WIDTH / 2 - playTextWidth / 2, titleHeight + HEIGHT * 41 / 108))
+    menuScreen.draw()
 
     # check for quit events -------------------------------------------
-    if checkQuit():
+    if checkQuit(events):
         inMenu = False
         inPlay = False
         inGame = False
 
-    # decrementing 'menuImagesX' to move the background ---------------
-    menuImagesX -= 1
+    # scrolling the clouds ---------------------------------------------
+    menuScroll += 1
 
     # incrementing 'lettersToRender' for a typed-out animation
     if titleLettersToRender < (len(titleStr) + 1) * 3:
@@ -6499,10 +9522,14 @@ while inMenu:
     timeElapsed += time / 1000
 
     # updating screen -------------------------------------------------
-    pygame.display.update()
+    updateDisplay()
 
 # -----------------------------------------------------------------------------
 
+# paused translucent image, scaled by the workers while the menu was shown
+pausedImage = preloader.loadScaled("images/backgrounds/paused.png", (WIDTH, HEIGHT))
+pausedImage.set_alpha(128)  # set opacity
+
 # generates the correct number of players
 players = [
     Player(100, 0.25, 5, 2.75, 15, 250, HEIGHT // 2 - 120, Pistol(), i % 2 == 1, f"p{i}") for i in range(1, numOfPlayers + 1)
@@ -6523,7 +9550,7 @@ while inGame:
     keys = pygame.key.get_pressed()
 
     # mouse position and button status --------------------------------
-    mousePos = pygame.mouse.get_pos()
+    mousePos = viewport.toGame(pygame.mouse.get_pos())
     mouseClicked = pygame.mouse.get_pressed(3)[0]
 
     # restarts music --------------------------------------------------
@@ -6544,14 +9571,14 @@ while inGame:
         keys = pygame.key.get_pressed()
 
         # mouse position and button status ------------------------------------
-        mousePos = pygame.mouse.get_pos()
+        mousePos = viewport.toGame(pygame.mouse.get_pos())
         mouseClicked = pygame.mouse.get_pressed(3)[0]
 
         # clearing events -----------------------------------------------------
         pygame.event.clear()
 
         # Adding background ---------------------------------------------------
-        gameWindow.blit(level.background, (0, 0))
+        drawLayers(level.biome.layers, camera.x)
 
         # Redraws chests ------------------------------------------------------
         forEachPlayer(players, redrawChest)
@@ -6578,6 +9605,9 @@ while inGame:
         # drawing enemies -----------------------------------------------------
         redrawEnemies()
 
+        # draws explosions and flashes ----------------------------------------
+        redrawEffects()
+
         # draws GUI -----------------------------------------------------------
         drawGUI(players)
 
@@ -6599,20 +9629,23 @@ while inGame:
         # checks if new level has to be generated -----------------------------
         level = generateLevel(players)
 
-        # moves background  ---------------------------------------------------
-        if anyPlayer(players, lambda playerCheck: playerCheck.x >= 200):
-            moveBackground(1)
+        # scrolls the camera  -------------------------------------------------
+        if anyPlayer(players, lambda playerCheck: camera.toScreen(playerCheck.x) >= 200):
+            camera.scroll(1)
 
         elif levelNumber == 0 and timeElapsed - timeOfFinishedWriting < 4:
-            moveBackground(0)
+            camera.scroll(0)
             
         else:
-            moveBackground(0.5)
+            camera.scroll(0.5)
 
         # accumulates time  ---------------------------------------------------
         time = fpsClock.tick(FPS)
         timeElapsed += time / 1000
 
+        # moves every animation on to the next tick ---------------------------
+        animations.advance()
+
         # Checking for quit events  -------------------------------------------
         if checkQuit():
             inPlay = False
@@ -6630,12 +9663,12 @@ while inGame:
             paused = True
             drawPausedImage = True
             timeOfPause = timeElapsed
-            gameWindow.blit(pauseButtonPressed, (WIDTH - 10 - pauseButtonWidth, 86 - pauseButtonPressedHeight))
+            backend.blit(pauseButtonPressed, (WIDTH - 10 - pauseButtonWidth, 86 - pauseButtonPressedHeight))
         else:
-            gameWindow.blit(pauseButton, (WIDTH - 10 - pauseButtonWidth, 86 - pauseButtonHeight))
+            backend.blit(pauseButton, (WIDTH - 10 - pauseButtonWidth, 86 - pauseButtonHeight))
 
         # updating screen  ----------------------------------------------------
-        pygame.display.update()
+        updateDisplay()
 
     # End of game loop ------------------------------------------------------------------------
 
@@ -6651,13 +9684,12 @@ while inGame:
         pygame.mixer.music.pause()
 
     # resets menu animation -------------------------------------------
-    menuImagesX = 0
+    menuScroll = 0
 
     # initializing 'showExit' for the arrow button
     showExit = False
-
-    # adds a delay between arrow presses
-    timeSinceArrowPress = 0
+    showEndScreenButton(showExit)
+    endScreenWidgets.reset()
 
     # death message
     if levelNumber >= 16:
@@ -6679,8 +9711,8 @@ while inGame:
     # Allows for unpausing --------------------------------------------
     # draws translucent image when paused
     if paused and drawPausedImage:
-        gameWindow.blit(pausedImage, (0, 0))
-        pygame.display.update()
+        backend.blit(pausedImage, (0, 0))
+        updateDisplay()
         drawPausedImage = False
 
     # Checking for quit events  ---------------------------------------
@@ -6705,108 +9737,28 @@ while inGame:
     #
     ###########################################################################################
     while endScreen:
-        # resetting 'menuImagesX' to restart the animation loop ---------------
-        if menuImagesX <= -WIDTH:
-            menuImagesX = 0
-
         # getting all keys ----------------------------------------------------
         keys = pygame.key.get_pressed()
 
-        # clearing events -----------------------------------------------------
-        pygame.event.clear()
+        # passing this frame's events to the widgets --------------------------
+        events = pygame.event.get()
+        endScreenWidgets.handle(events)
 
         # blitting background -------------------------------------------------
-        gameWindow.blit(menuBackgroundImage, (0, 0))
-        gameWindow.blit(cloudsImage, (menuImagesX, 0))
-        gameWindow.blit(cloudsImage, (menuImagesX + WIDTH, 0))
-
-        # mouse position and button status ------------------------------------
-        mousePos = pygame.mouse.get_pos()
-        mouseClicked = pygame.mouse.get_pressed(3)[0]
-
-        # rendering text and its shadows --------------------------------------
-        # title
-        title = titleFont.render(titleStr, False, WHITE)
-        titleShadow = titleFont.render(titleStr, False, BLACK)
-
-        # restart text
-        restartText = subTitleFont.render("Play Again", False, BLACK)
-        restartTextShadow = subTitleFont.render("Play Again", False, WHITE)
-
-        # exit text
-        exitText = subTitleFont.render("Exit", False, BLACK)
-        exitTextShadow = subTitleFont.render("Exit", False, WHITE)
-
-        # arrows
-        rightArrowText = subTitleFont.render(">", False, BLACK)
-        rightArrowTextShadow = subTitleFont.render(">", False, WHITE)
-
-        leftArrowText = subTitleFont.render("<", False, BLACK)
-        leftArrowTextShadow = subTitleFont.render("<", False, WHITE)
-
-        # death messages
-        deathMessageText = deathMessageFont.render(deathMessage[:deathMessageLetters // 3], False, WHITE)
-        deathMessageTextShadow = deathMessageFont.render(deathMessage[:deathMessageLetters // 3], False, BLACK)
+        drawLayers(grassBiome.load().layers + [cloudsLayer], menuScroll)
 
-        # getting the width and height of the title and restart text ----------
-        titleWidth, titleHeight = titleFont.size(titleStr)
+        # rendering the death message and its shadow --------------------------
+        deathMessageText = textCache.typed(deathMessageFont, deathMessage, False, WHITE)
+        deathMessageTextShadow = textCache.typed(deathMessageFont, deathMessage, False, BLACK)
+        deathMessageTextWidth, deathMessageTextHeight = deathMessageText.size(deathMessageLetters // 3)
 
-        restartTextWidth, restartTextHeight = subTitleFont.size("Play Again")
-
-        exitTextWidth, exitTextHeight = subTitleFont.size("Exit")
-
-        rightArrowTextWidth, rightArrowTextHeight = subTitleFont.size(">")
-
-        leftArrowTextWidth, leftArrowTextHeight = subTitleFont.size("<")
-
-        deathMessageTextWidth, deathMessageTextHeight = deathMessageFont.size(deathMessage[:deathMessageLetters // 3])
-
-        # setting hitbox for restart button -----------------------------------
-        restartHitbox = pygame.Rect(WIDTH / 2 - restartTextWidth / 2, titleHeight + HEIGHT * 41 / 108, restartTextWidth, restartTextHeight)
-
-        # setting hitbox for exit button --------------------------------------
-        exitHitbox = pygame.Rect(WIDTH / 2 - exitTextWidth / 2, titleHeight + HEIGHT * 41 / 108, exitTextWidth, exitTextHeight)
-
-        # setting hitbox for exit button --------------------------------------
-        if showExit:
-            rightArrowHitbox = pygame.Rect(WIDTH / 2 + exitTextWidth / 2, titleHeight + HEIGHT * 41 / 108,
-                                           rightArrowTextWidth, rightArrowTextHeight)
-            leftArrowHitbox = pygame.Rect(WIDTH / 2 - exitTextWidth / 2 - leftArrowTextWidth,
-                                          titleHeight + HEIGHT * 41 / 108, leftArrowTextWidth, leftArrowTextHeight)
-
-        else:
-            rightArrowHitbox = pygame.Rect(WIDTH / 2 + restartTextWidth / 2, titleHeight + HEIGHT * 41 / 108,
-                                           rightArrowTextWidth, rightArrowTextHeight)
-            leftArrowHitbox = pygame.Rect(WIDTH / 2 - restartTextWidth / 2 - leftArrowTextWidth,
-                                          titleHeight + HEIGHT * 41 / 108, leftArrowTextWidth, leftArrowTextWidth)
-
-        # makes the 'play again' text white upon hover ------------------------
-        if restartHitbox.collidepoint(mousePos) and not showExit:
-            restartText = subTitleFont.render("Play Again", True, WHITE)
-            restartTextShadow = subTitleFont.render("Play Again", True, BLACK)
-
-        # makes the 'exit' text white upon hover ------------------------------
-        if exitHitbox.collidepoint(mousePos) and showExit:
-            exitText = subTitleFont.render("Exit", True, WHITE)
-            exitTextShadow = subTitleFont.render("Exit", True, BLACK)
-
-        # makes the '>' text white upon hover ---------------------------------
-        if rightArrowHitbox.collidepoint(mousePos):
-            rightArrowText = subTitleFont.render(">", True, WHITE)
-            rightArrowTextShadow = subTitleFont.render(">", True, BLACK)
-
-        # makes the '<' text white upon hover ---------------------------------
-        if leftArrowHitbox.collidepoint(mousePos):
-            leftArrowText = subTitleFont.render("<", True, WHITE)
-            leftArrowTextShadow = subTitleFont.render("<", True, BLACK)
-
-        # switching from 'exit' to 'play again' upon click
-        if (rightArrowHitbox.collidepoint(mousePos) or leftArrowHitbox.collidepoint(mousePos)) and mouseClicked:
+        # switching between 'exit' and 'play again' upon clicking an arrow ----
+        if any(arrow.clicked for arrow in restartArrows + exitArrows):
             showExit = not showExit
-            timeSinceArrowPress = timeElapsed
+            showEndScreenButton(showExit)
 
-        # resets and restarts the game upon hover and click -------------------
-        if restartHitbox.collidepoint(mousePos) and mouseClicked and not showExit and timeElapsed - timeSinceArrowPress >= 0.25:
+        # resets and restarts the game upon click -----------------------------
+        if restartButton.clicked:
             inPlay = True
             endScreen = False
 
@@ -6823,10 +9775,12 @@ while inGame:
                 player.damageMultiplier = 1
             bullets.clear()
             grenades.clear()
+            effects.clear()
             chests.clear()
             portals.clear()
 
             # reset level ---------------------------------------------
+            switchBiome(level.biome, grassBiome)
             level = Level(8)
             levelNumber = 0
 
@@ -6835,62 +9789,39 @@ while inGame:
 
         # ---------------------------------------------------------------------
 
-        # exits the game upon hover and click ---------------------------------
-        if exitHitbox.collidepoint(mousePos) and mouseClicked and showExit and timeElapsed - timeSinceArrowPress >= 0.25:
+        # exits the game upon click -------------------------------------------
+        if exitButton.clicked:
             inMenu = False
             inGame = False
             inPlay = False
             endScreen = False
 
         # line decorations ------------------------------------------------
-        pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 40), (WIDTH / 2 + titleWidth / 2, 40))
-        pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 36), (WIDTH / 2 + titleWidth / 2, 36))
-        pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 8), (WIDTH / 2 + titleWidth / 2, 40 + titleHeight + 8))
-        pygame.draw.line(gameWindow, WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 12), (WIDTH / 2 + titleWidth / 2, 40 + titleHeight + 12))
+        backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 40), (WIDTH / 2 + titleWidth / 2, 40))
+        backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 36), (WIDTH / 2 + titleWidth / 2, 36))
+        backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 8), (WIDTH / 2 + titleWidth / 2, 40 + titleHeight + 8))
+        backend.drawLine(WHITE, (WIDTH / 2 - titleWidth / 2, 40 + titleHeight + 12), (WIDTH / 2 + titleWidth / 2, 40 + titleHeight + 12))
 
         # blitting text -------------------------------------------------------
-        gameWindow.blit(titleShadow, (WIDTH / 2 - titleWidth / 2 + 12, 52))
-        gameWindow.blit(title, (WIDTH / 2 - titleWidth / 2, 40))
-
-        gameWindow.blit(deathMessageTextShadow, (WIDTH / 2 - deathMessageTextWidth / 2 + 4, titleHeight + HEIGHT * 52 / 108 + 4))
-        gameWindow.blit(deathMessageText, (WIDTH / 2 - deathMessageTextWidth / 2, titleHeight + HEIGHT * 52 / 108))
-
-        # drawing different buttons based on the 'showExit' flag
-        if not showExit:
-            # restart text
-            gameWindow.blit(restartTextShadow, (WIDTH / 2 - restartTextWidth / 2 + 4, titleHeight + HEIGHT * 41 / 108 + 4))
-            gameWindow.blit(restartText, (WIDTH / 2 - restartTextWidth / 2, titleHeight + HEIGHT * 41 / 108))
-
-            # right arrow text
-            gameWindow.blit(rightArrowTextShadow, (WIDTH / 2 + restartTextWidth / 2 + 4, titleHeight + HEIGHT * 41 / 108 + 4))
-            gameWindow.blit(rightArrowText, (WIDTH / 2 + restartTextWidth / 2, titleHeight + HEIGHT * 41 / 108))
+        backend.blit(textCache.render(titleFont, titleStr, False, BLACK), (WIDTH / 2 - titleWidth / 2 + 12, 52))
+        backend.blit(textCache.render(titleFont, titleStr, False, WHITE), (WIDTH / 2 - titleWidth / 2, 40))
 
-            # left arrow text
-            gameWindow.blit(leftArrowTextShadow, (WIDTH / 2 - restartTextWidth / 2 - leftArrowTextWidth + 4, titleHeight + HEIGHT * 41 / 108 + 4))
-            gameWindow.blit(leftArrowText, (WIDTH / 2 - restartTextWidth / 2 - leftArrowTextWidth, titleHeight + HEIGHT * 41 / 108))
+        deathMessageTextShadow.draw(deathMessageLetters // 3, (WIDTH / 2 - deathMessageTextWidth / 2 + 4,
+                                                               titleHeight + HEIGHT * 52 / 108 + 4))
+        deathMessageText.draw(deathMessageLetters // 3, (WIDTH / 2 - deathMessageTextWidth / 2,
+                                                         titleHeight + HEIGHT * 52 / 108))
 
-        else:
-            # exit text
-            gameWindow.blit(exitTextShadow, (WIDTH / 2 - exitTextWidth / 2 + 4, titleHeight + HEIGHT * 41 / 108 + 4))
-            gameWindow.blit(exitText, (WIDTH / 2 - exitTextWidth / 2, titleHeight + HEIGHT * 41 / 108))
-
-            # right arrow text
-            gameWindow.blit(rightArrowTextShadow, (WIDTH / 2 + exitTextWidth / 2 + 4, titleHeight + HEIGHT * 41 / 108 + 4))
-            gameWindow.blit(rightArrowText, (WIDTH / 2 + exitTextWidth / 2, titleHeight + HEIGHT * 41 / 108))
-
-            # left arrow text
-            gameWindow.blit(leftArrowTextShadow, (WIDTH / 2 - exitTextWidth / 2 - leftArrowTextWidth + 4, titleHeight + HEIGHT * 41 / 108 + 4))
-            gameWindow.blit(leftArrowText, (WIDTH / 2 - exitTextWidth / 2 - leftArrowTextWidth, titleHeight + HEIGHT * 41 / 108))
+        endScreenWidgets.draw()
 
         # check for quit events -----------------------------------------------
-        if checkQuit():
+        if checkQuit(events):
             inMenu = False
             inGame = False
             inPlay = False
             endScreen = False
 
-        # decrementing 'menuImagesX' to move the background -------------------
-        menuImagesX -= 1
+        # scrolling the clouds -------------------------------------------------
+        menuScroll += 1
 
         if deathMessageLetters < len(deathMessage) * 3:
             deathMessageLetters += 1
@@ -6900,7 +9831,8 @@ while inGame:
         timeElapsed += time / 1000
 
         # updating screen -----------------------------------------------------
-        pygame.display.update()
+        updateDisplay()
 
 # quitting pygame
+preloader.shutdown()
 pygame.quit()